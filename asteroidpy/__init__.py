@@ -17,24 +17,58 @@ The application provides an interactive terminal UI (Textual) with support for
 multiple languages and comprehensive observatory configuration options.
 """
 
+import argparse
 import configparser
 import cProfile
+import os
 import pstats
 from configparser import ConfigParser
-
-import asteroidpy.interface as interface
+from typing import List, Optional, Sequence
 
 PROFILE = False
 
 config: ConfigParser = configparser.ConfigParser()
 
 
-def main() -> None:
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="asteroidpy",
+        description="Asteroid observation scheduling and analysis.",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        metavar="DIR",
+        help="save every MPC/7Timer response to DIR",
+    )
+    cassette.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="serve MPC/7Timer responses recorded in DIR; no network access",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        metavar="SECONDS",
+        type=float,
+        default=None,
+        help="delay added to each replayed response",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
     """Main entry point for the AsteroidPy application.
 
     Initializes the configuration and launches the user interface. Optionally
     enables profiling if the PROFILE flag is set to True.
 
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        Command-line arguments (default ``sys.argv[1:]``). ``--record DIR`` and
+        ``--replay DIR [--replay-latency SECONDS]`` select the network
+        cassette mode of :mod:`asteroidpy.cassette`.
+
     Returns
     -------
     None
@@ -44,8 +78,14 @@ def main() -> None:
     -----
     If PROFILE is True, the function runs with cProfile enabled and saves
     profiling statistics to 'asteroidpy.prof'. Otherwise, it directly
-    launches the interface.
+    launches the interface. The interface (and through it astropy and
+    astroquery) is imported here so ``import asteroidpy`` stays cheap.
     """
+    args = _parse_args(argv)
+    _select_cassette(args)
+
+    import asteroidpy.interface as interface
+
     if PROFILE:
         profiler = cProfile.Profile()
         profiler.enable()
@@ -55,3 +95,19 @@ def main() -> None:
         stats.dump_stats("asteroidpy.prof")
     else:
         interface.interface(config)
+
+
+def _select_cassette(args: argparse.Namespace) -> None:
+    # Passed through the environment so the network layer, imported lazily,
+    # picks the mode up on its first request.
+    from asteroidpy.cassette import ENV_DIR, ENV_LATENCY, ENV_MODE
+
+    settings: List[str] = []
+    if args.record:
+        settings = ["record", args.record]
+    elif args.replay:
+        settings = ["replay", args.replay]
+    if settings:
+        os.environ[ENV_MODE], os.environ[ENV_DIR] = settings
+    if args.replay_latency is not None:
+        os.environ[ENV_LATENCY] = str(args.replay_latency)
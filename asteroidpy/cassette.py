@@ -0,0 +1,174 @@
+"""Record HTTP exchanges to a directory and replay them without a network.
+
+In ``record`` mode :mod:`asteroidpy.network` saves every response returned
+by :func:`~asteroidpy.network.afetch` (and :func:`~asteroidpy.network.astream`)
+as one JSON file per request; in ``replay`` mode it answers from those files only,
+optionally sleeping a fixed latency per request, so the scheduling pipeline
+can be timed and profiled deterministically. Requests are matched with
+:func:`~asteroidpy.httpcache.cache_key` (method, URL and normalized
+query/form fields without ``authenticity_token``).
+
+The mode is chosen with the ``--record DIR`` / ``--replay DIR`` options of the
+``asteroidpy`` command or with the environment variables
+:data:`ENV_MODE`, :data:`ENV_DIR` and :data:`ENV_LATENCY`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Literal, Mapping, Optional, Union, cast
+
+from asteroidpy.httpcache import CachedResponse, cache_key
+
+#: ``record`` or ``replay``; anything else leaves the network untouched.
+ENV_MODE = "ASTEROIDPY_CASSETTE_MODE"
+#: Directory holding the cassette files.
+ENV_DIR = "ASTEROIDPY_CASSETTE_DIR"
+#: Seconds added to every replayed response (default 0).
+ENV_LATENCY = "ASTEROIDPY_REPLAY_LATENCY"
+
+CassetteMode = Literal["record", "replay"]
+_Fields = Union[None, str, bytes, Mapping[str, Any]]
+
+
+class CassetteMissError(LookupError):
+    """A replayed request has no recorded response."""
+
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(f"no recorded response for {method.upper()} {url}")
+        self.method = method
+        self.url = url
+
+
+class Cassette:
+    """Directory of recorded responses.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        Where recordings are written or read; created when recording.
+    mode : {"record", "replay"}
+        Whether responses are saved or served.
+    latency : float, optional
+        Seconds to wait before returning each replayed response (default 0).
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        mode: CassetteMode,
+        latency: float = 0.0,
+    ) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown cassette mode: {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency = max(0.0, float(latency))
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _path(self, method: str, url: str, params: _Fields, body: _Fields) -> Path:
+        return self.directory / f"{cache_key(method, url, params, body)}.json"
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: _Fields,
+        body: _Fields,
+        response: Any,
+        elapsed: float = 0.0,
+    ) -> None:
+        """Save ``response`` (anything with ``status_code``/``content``/``headers``).
+
+        Recordings are keyed without request headers, so a ``304 Not
+        Modified`` answering a conditional request does not replace the
+        response already recorded for the same request: replaying it would
+        hand the caller an empty body it never had a copy of.
+        """
+
+        entry: Dict[str, Any] = {
+            "method": method.upper(),
+            "url": url,
+            "status_code": int(response.status_code),
+            "headers": dict(getattr(response, "headers", None) or {}),
+            "content": base64.b64encode(response.content).decode("ascii"),
+            "elapsed": round(elapsed, 6),
+        }
+        path = self._path(method, url, params, body)
+        with self._lock:
+            if entry["status_code"] == 304 and path.exists():
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry, indent=1), encoding="utf-8")
+            tmp.replace(path)
+            self.recorded += 1
+
+    def _load(
+        self, method: str, url: str, params: _Fields, body: _Fields
+    ) -> CachedResponse:
+        path = self._path(method, url, params, body)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise CassetteMissError(method, url) from None
+        with self._lock:
+            self.replayed += 1
+        return CachedResponse(
+            int(entry["status_code"]),
+            base64.b64decode(entry["content"]),
+            cast(Dict[str, str], entry["headers"]),
+            path.stat().st_mtime,
+        )
+
+    def replay(
+        self, method: str, url: str, params: _Fields, body: _Fields
+    ) -> CachedResponse:
+        """Return the recorded response, after :attr:`latency` seconds."""
+
+        response = self._load(method, url, params, body)
+        if self.latency:
+            time.sleep(self.latency)
+        return response
+
+    async def areplay(
+        self, method: str, url: str, params: _Fields, body: _Fields
+    ) -> CachedResponse:
+        """Async :meth:`replay`; the latency does not block the event loop."""
+
+        response = self._load(method, url, params, body)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return response
+
+
+def cassette_from_env(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Optional[Cassette]:
+    """Build the cassette described by :data:`ENV_MODE`/:data:`ENV_DIR`, if any.
+
+    Raises ``ValueError`` when a mode is set without a directory or the
+    latency is not a number.
+    """
+
+    env = os.environ if environ is None else environ
+    mode = env.get(ENV_MODE, "").strip().lower()
+    if mode not in ("record", "replay"):
+        return None
+    directory = env.get(ENV_DIR, "").strip()
+    if not directory:
+        raise ValueError(f"{ENV_MODE}={mode} needs {ENV_DIR}")
+    latency = float(env.get(ENV_LATENCY, "0") or 0)
+    return Cassette(directory, cast(CassetteMode, mode), latency)
@@ -15,6 +15,8 @@ from typing import (
     Dict,
     Mapping,
     MutableMapping,
+    NamedTuple,
+    Optional,
     TextIO,
     Tuple,
     TypedDict,
@@ -22,7 +24,6 @@ from typing import (
 )
 
 import platformdirs
-from astroquery.mpc import MPC
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +54,86 @@ SECTION_DEFAULTS: Dict[str, Dict[str, str]] = {
         "nord_altitude": "0",
         "south_altitude": "0",
         "west_altitude": "0",
+        "horizon_file": "",
     },
 }
 
 
+class ConfigCacheInfo(NamedTuple):
+    """Counters reported by :func:`load_config_cache_info`."""
+
+    hits: int
+    misses: int
+
+
+#: ``(st_mtime_ns, st_size, st_ino)`` of the canonical INI file.
+_StatKey = Tuple[int, int, int]
+
+
+class _LoadConfigCache:
+    """Last parsed canonical INI, keyed by path and file identity."""
+
+    __slots__ = ("path", "key", "sections", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.path: Optional[Path] = None
+        self.key: Optional[_StatKey] = None
+        self.sections: Dict[str, Dict[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: Path, key: _StatKey) -> Optional[Dict[str, Dict[str, str]]]:
+        if self.path == path and self.key == key:
+            return self.sections
+        return None
+
+    def store(
+        self, path: Path, parser: ConfigParser, key: Optional[_StatKey] = None
+    ) -> None:
+        """Remember ``parser`` for ``path``; ``key`` defaults to a fresh ``stat``."""
+        if key is None:
+            key = _stat_key(path)
+        if key is None:
+            self.path = self.key = None
+            self.sections = {}
+            return
+        self.path = path
+        self.key = key
+        self.sections = _parser_sections(parser)
+
+
+_load_config_cache = _LoadConfigCache()
+
+
+def _stat_key(path: Path) -> Optional[_StatKey]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parser_sections(parser: ConfigParser) -> Dict[str, Dict[str, str]]:
+    """Raw option values per section, suitable for ``ConfigParser.read_dict``."""
+
+    return {
+        section: dict(parser.items(section, raw=True)) for section in parser.sections()
+    }
+
+
+def load_config_cache_info() -> ConfigCacheInfo:
+    """Return hit/miss counters of the in-process :func:`load_config` cache."""
+
+    return ConfigCacheInfo(_load_config_cache.hits, _load_config_cache.misses)
+
+
+def clear_load_config_cache() -> None:
+    """Forget the cached INI contents and reset the counters."""
+
+    global _load_config_cache
+    _load_config_cache = _LoadConfigCache()
+
+
 def canonical_config_path() -> Path:
     """INI path under `user_config_dir` (e.g. ``~/.config/asteroidpy`` on Linux)."""
 
@@ -157,12 +234,18 @@ def _atomic_replace(path: Path, writer: Callable[[TextIO], None]) -> None:
 
 
 def save_config(config: ConfigParser) -> None:
-    """Save configuration to disk (canonical path, atomic replace)."""
+    """Save configuration to disk (canonical path, atomic replace).
+
+    The :func:`load_config` cache is refreshed with the written values, so the
+    next load does not re-parse the file it just produced.
+    """
 
     def _writer(handle: TextIO) -> None:
         config.write(handle)
 
-    _atomic_replace(canonical_config_path(), _writer)
+    canon = canonical_config_path()
+    _atomic_replace(canon, _writer)
+    _load_config_cache.store(canon, config)
 
 
 def initialize(config: ConfigParser) -> None:
@@ -175,17 +258,38 @@ def initialize(config: ConfigParser) -> None:
 
 
 def load_config(config: ConfigParser) -> None:
-    """Load from canonical path, migrating ``~/.asteroidpy`` once if needed."""
+    """Load from canonical path, migrating ``~/.asteroidpy`` once if needed.
 
-    _migrate_legacy_configuration()
+    Parsed contents are cached in-process and keyed on the canonical file's
+    ``(st_mtime_ns, st_size, st_ino)``: while the file is unchanged a load costs
+    one ``stat`` and no parsing. The legacy path is only probed while the
+    canonical file does not exist. See :func:`load_config_cache_info`.
+    """
 
     canon = canonical_config_path()
+    key = _stat_key(canon)
+    if key is not None:
+        cached = _load_config_cache.lookup(canon, key)
+        if cached is not None:
+            _load_config_cache.hits += 1
+            config.read_dict(cached)
+            merge_missing_defaults(config)
+            return
+
+    _load_config_cache.misses += 1
+    if key is None:
+        _migrate_legacy_configuration()
+
     legacy = legacy_config_path()
 
     if canon.exists():
-        ok = _read_config_file(config, canon)
+        parsed = ConfigParser()
+        ok = _read_config_file(parsed, canon)
         if ok:
+            config.read_dict(_parser_sections(parsed))
             merge_missing_defaults(config)
+            # Key taken before reading: a concurrent rewrite forces a re-parse.
+            _load_config_cache.store(canon, parsed, key)
             return
         initialize(config)
         return
@@ -237,9 +341,12 @@ def get_observatory_coordinates(code: str) -> Tuple[float, float, float, str]:
 
     Latitude is reconstructed from MPC parallax coefficients ``rho*sin(phi')`` and
     ``rho*cos(phi')``; elevation is defaulted to sea level because the MPC list
-    usually omits altitude.
+    usually omits altitude. ``astroquery`` is imported here rather than at module
+    load because it is slow to import and only this lookup needs it.
     """
 
+    from astroquery.mpc import MPC
+
     result = MPC.get_observatory_location(code.strip())
     longitude_angle, cos_phi, sin_phi, name = result
     longitude_deg = float(longitude_angle.to_value("deg"))
@@ -261,6 +368,14 @@ def change_observer_name(config: ConfigParser, name: str) -> None:
     save_config(config)
 
 
+def change_horizon_file(config: ConfigParser, path: str) -> None:
+    """Persist the path of a text/CSV horizon profile ('' restores the four sectors)."""
+
+    load_config(config)
+    config["Observatory"]["horizon_file"] = str(path).strip()
+    save_config(config)
+
+
 def print_obs_config(config: ConfigParser, show_sensitive: bool = False) -> None:
     load_config(config)
     if not config.has_section("Observatory"):
@@ -283,6 +398,7 @@ def print_obs_config(config: ConfigParser, show_sensitive: bool = False) -> None
     _print_field("observer_name", "Osservatore", redact_when_private=False)
     _print_field("obs_name", "Nome Osservatorio", redact_when_private=False)
     _print_field("mpc_code", "Codice MPC", redact_when_private=False)
+    _print_field("horizon_file", "File orizzonte", redact_when_private=False)
 
 
 def virtual_horizon_configuration(
@@ -0,0 +1,152 @@
+"""Azimuth-dependent virtual horizon stored as a uniform NumPy altitude grid."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Any, List, Tuple, Union
+
+import numpy as np
+
+_FIELD_SPLIT_RE = re.compile(r"[\s,;]+")
+
+
+class HorizonProfile:
+    """Minimum altitude (degrees) per azimuth bin over ``[0, 360)``.
+
+    Bin ``i`` covers azimuths ``[i * step, (i + 1) * step)`` with
+    ``step = 360 / len(altitudes)``; lookups are a single vectorized index
+    operation whatever the resolution. The classic four-sector horizon is the
+    degenerate 8-bin case built by :meth:`from_sectors`; site profiles come from
+    :meth:`from_file`. Instances are read-only.
+    """
+
+    __slots__ = ("altitudes", "step")
+
+    altitudes: np.ndarray
+    step: float
+
+    def __init__(self, altitudes: Any) -> None:
+        grid = np.array(altitudes, dtype=float).ravel()
+        if grid.size == 0:
+            raise ValueError("horizon profile needs at least one altitude")
+        if not np.all(np.isfinite(grid)):
+            raise ValueError("horizon altitudes must be finite numbers")
+        grid.setflags(write=False)
+        object.__setattr__(self, "altitudes", grid)
+        object.__setattr__(self, "step", 360.0 / grid.size)
+
+    @classmethod
+    def from_sectors(
+        cls, north: float, east: float, south: float, west: float
+    ) -> HorizonProfile:
+        """Four 90° sectors centred on the cardinal points (North is ``[315, 45)``)."""
+
+        return cls([north, east, east, south, south, west, west, north])
+
+    @classmethod
+    def from_points(
+        cls,
+        azimuths: Any,
+        altitudes: Any,
+        resolution_deg: float = 1.0,
+    ) -> HorizonProfile:
+        """Resample ``(azimuth, altitude)`` samples onto a grid of ``resolution_deg`` bins.
+
+        Samples are linearly interpolated with wrap-around at 360°; each bin takes
+        the value at its centre.
+        """
+
+        if not 0.0 < resolution_deg <= 360.0:
+            raise ValueError("resolution_deg must be in (0, 360]")
+        az = np.mod(np.asarray(azimuths, dtype=float).ravel(), 360.0)
+        alt = np.asarray(altitudes, dtype=float).ravel()
+        if az.size == 0 or az.size != alt.size:
+            raise ValueError(
+                "azimuths and altitudes must be non-empty and equal length"
+            )
+        bins = max(1, int(round(360.0 / resolution_deg)))
+        centres = (np.arange(bins) + 0.5) * (360.0 / bins)
+        return cls(np.interp(centres, az, alt, period=360.0))
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, os.PathLike[str]], resolution_deg: float = 1.0
+    ) -> HorizonProfile:
+        """Load a text/CSV horizon: one ``azimuth altitude`` pair (degrees) per line.
+
+        Fields may be separated by commas, semicolons or whitespace; extra
+        columns are ignored. Blank lines, ``#`` comments and lines that do not
+        start with two numbers (such as a CSV header) are skipped. Raises
+        ``OSError`` when the file cannot be read and ``ValueError`` when it holds
+        no usable samples.
+        """
+
+        azimuths, altitudes = _read_horizon_points(Path(path))
+        if not azimuths:
+            raise ValueError(f"no azimuth/altitude pairs found in {path}")
+        return cls.from_points(azimuths, altitudes, resolution_deg)
+
+    def min_altitude(self, azimuth_deg: Any) -> Any:
+        """Horizon altitude for each azimuth (scalar or array, degrees)."""
+
+        azimuth = np.mod(np.asarray(azimuth_deg, dtype=float), 360.0)
+        index = (azimuth // self.step).astype(np.intp) % self.altitudes.size
+        return self.altitudes[index]
+
+    def altitude_bounds(
+        self, azimuth_deg: Any, half_width_deg: Any
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Lowest and highest horizon altitude within ``azimuth ± half_width``.
+
+        Used to decide visibility when the azimuth itself is only known to
+        within ``half_width_deg``; windows as wide as a bin fall back to the
+        extremes of the whole profile.
+        """
+
+        azimuth = np.asarray(azimuth_deg, dtype=float)
+        half_width = np.broadcast_to(
+            np.asarray(half_width_deg, dtype=float), azimuth.shape
+        )
+        # A window narrower than one bin spans at most three bins, each of
+        # which contains one of these samples.
+        samples = np.stack(
+            [
+                self.min_altitude(azimuth - half_width),
+                self.min_altitude(azimuth),
+                self.min_altitude(azimuth + half_width),
+            ]
+        )
+        wide = half_width >= self.step
+        low = np.where(wide, self.altitudes.min(), samples.min(axis=0))
+        high = np.where(wide, self.altitudes.max(), samples.max(axis=0))
+        return low, high
+
+    def is_visible(self, azimuth_deg: Any, altitude_deg: Any) -> Any:
+        """Boolean mask: ``altitude_deg`` at or above the horizon at ``azimuth_deg``."""
+
+        return np.asarray(altitude_deg, dtype=float) >= self.min_altitude(azimuth_deg)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bins={self.altitudes.size}, step={self.step!r})"
+
+
+def _read_horizon_points(path: Path) -> Tuple[List[float], List[float]]:
+    azimuths: List[float] = []
+    altitudes: List[float] = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            fields = _FIELD_SPLIT_RE.split(line.split("#", 1)[0].strip())
+            if len(fields) < 2:
+                continue
+            try:
+                az, alt = float(fields[0]), float(fields[1])
+            except ValueError:
+                continue
+            azimuths.append(az)
+            altitudes.append(alt)
+    return azimuths, altitudes
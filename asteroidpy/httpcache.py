@@ -0,0 +1,280 @@
+"""SQLite-backed cache of HTTP responses with per-endpoint TTLs.
+
+Entries are keyed on the request method, URL and normalized query/body (see
+:func:`cache_key`), expire after the TTL of the longest matching URL prefix
+and are evicted least-recently-used once the stored bodies exceed
+``max_bytes``. :mod:`asteroidpy.network` consults the cache for every
+``afetch`` from a worker thread; this module only knows about bytes and
+SQLite. Hits only read: their access times are kept in memory and written
+with the next :meth:`~ResponseCache.put` (before it evicts) or on close.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+
+import platformdirs
+
+#: Seconds each endpoint's responses stay fresh; the longest matching URL
+#: prefix wins and unlisted URLs are not cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "https://www.minorplanetcenter.net/Extended_Files/neocp.json": 60.0,
+    "https://cgi.minorplanetcenter.net/cgi-bin/confirmeph2.cgi": 300.0,
+    "https://www.minorplanetcenter.net/whatsup/index": 600.0,
+    "https://www.7timer.info/": 1800.0,
+}
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+#: Form fields left out of cache keys (per-session values that do not change
+#: the response).
+IGNORED_FIELDS = frozenset({"authenticity_token"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+class CachedResponse(NamedTuple):
+    """A stored response; mirrors the parts of ``httpx`` responses we use."""
+
+    status_code: int
+    content: bytes
+    headers: Dict[str, str]
+    stored: float
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Stored responses are always successful."""
+
+
+class ResponseCacheStats(NamedTuple):
+    """Counters reported by :meth:`ResponseCache.stats`."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+def default_cache_path() -> Path:
+    """SQLite file under ``user_cache_dir`` (e.g. ``~/.cache/asteroidpy``)."""
+
+    return Path(platformdirs.user_cache_dir("asteroidpy")) / "responses.sqlite3"
+
+
+def _normalized_fields(
+    fields: Union[None, str, bytes, Mapping[str, Any]],
+) -> List[Tuple[str, str]]:
+    if fields is None:
+        return []
+    if isinstance(fields, bytes):
+        fields = fields.decode("utf-8", errors="replace")
+    if isinstance(fields, str):
+        pairs = parse_qsl(fields, keep_blank_values=True)
+    else:
+        pairs = [(str(k), str(v)) for k, v in fields.items()]
+    return sorted((k, v) for k, v in pairs if k not in IGNORED_FIELDS)
+
+
+def cache_key(
+    method: str,
+    url: str,
+    params: Union[None, str, bytes, Mapping[str, Any]] = None,
+    body: Union[None, str, bytes, Mapping[str, Any]] = None,
+) -> str:
+    """Stable key for a request: method, URL and sorted query/form fields.
+
+    Form bodies (dicts or ``a=1&b=2`` strings) are compared field by field, so
+    ordering and :data:`IGNORED_FIELDS` do not create new entries.
+    """
+
+    material = json.dumps(
+        [
+            method.upper(),
+            url,
+            _normalized_fields(params),
+            _normalized_fields(body),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Persistent response store shared by all threads of the process."""
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # key -> time of the last hit, not yet written to ``accessed``.
+        self._accessed: Dict[str, float] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def ttl_for(self, url: str) -> float:
+        """TTL in seconds of the longest prefix of ``url`` in :attr:`ttls` (0 if none)."""
+
+        best = ""
+        for prefix in self.ttls:
+            if url.startswith(prefix) and len(prefix) > len(best):
+                best = prefix
+        return self.ttls[best] if best else 0.0
+
+    def get(
+        self, key: str, url: str, allow_stale: bool = False
+    ) -> Optional[CachedResponse]:
+        """Return a fresh entry for ``key`` (counting a hit) or ``None`` (a miss).
+
+        ``allow_stale=True`` ignores the TTL; used to answer while the origin
+        is unreachable.
+        """
+
+        ttl = float("inf") if allow_stale else self.ttl_for(url)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT status, headers, body, stored FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[3] > ttl:
+                self.misses += 1
+                return None
+            self._accessed[key] = now
+            self.hits += 1
+        status, headers, body, stored = row
+        return CachedResponse(int(status), bytes(body), json.loads(headers), stored)
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Store a response when its URL has a TTL, then evict down to ``max_bytes``."""
+
+        if self.ttl_for(url) <= 0 or len(content) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, headers, body, size, stored, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    int(status_code),
+                    json.dumps(dict(headers or {})),
+                    sqlite3.Binary(content),
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self._accessed.pop(key, None)
+            self._flush_accessed(conn)
+            self._evict(conn)
+            conn.commit()
+
+    def _flush_accessed(self, conn: sqlite3.Connection) -> None:
+        if self._accessed:
+            conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(when, key) for key, when in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        victims: List[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        ):
+            victims.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in victims])
+
+    def stats(self) -> ResponseCacheStats:
+        """Hit/miss counters of this process plus the stored entry count and size."""
+
+        with self._lock:
+            entries, size = (
+                self._connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+                .fetchone()
+            )
+            return ResponseCacheStats(
+                self.hits, self.misses, int(entries), int(size), self.max_bytes
+            )
+
+    def clear(self) -> None:
+        """Delete every stored response and reset the counters."""
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._accessed.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._flush_accessed(self._conn)
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
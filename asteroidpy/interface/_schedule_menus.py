@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import datetime
 from configparser import ConfigParser
-from typing import List
+from typing import List, Literal
 
 import asteroidpy.configuration as configuration
-import asteroidpy.scheduling as scheduling
 
 from ._input import get_float, get_integer, prompt_int_in_range, prompt_line
 from ._intl import translate
@@ -41,6 +40,8 @@ def select_specific_time() -> datetime.datetime:
 
 
 def observing_target_list_menu(config: ConfigParser) -> None:
+    import asteroidpy.scheduling as scheduling
+
     authenticity_token, used_fallback = scheduling.resolve_whatsup_authenticity_token()
     if used_fallback:
         print(
@@ -113,12 +114,16 @@ def observing_target_list_menu(config: ConfigParser) -> None:
 
 
 def neocp_confirmation_menu(config: ConfigParser) -> None:
+    import asteroidpy.scheduling as scheduling
+
     min_score = get_integer(translate("Minimum score -> "))
     max_magnitude = get_float(translate("Maximum magnitude -> "))
     min_altitude = get_integer(translate("Minimum altitude -> "))
+    top_n_text = prompt_line(translate("Show only the best N (empty for all) -> "))
+    top_n = int(top_n_text) if top_n_text.strip().isdigit() else None
     browser_view = prompt_line(translate("Do you want to view in Browser? (y/N) -> "))
     neocp = scheduling.neocp_confirmation(
-        config, min_score, max_magnitude, min_altitude
+        config, min_score, max_magnitude, min_altitude, top_n=top_n
     )
     if browser_view.strip().lower() in {"y", "yes"}:
         neocp.show_in_browser(jsviewer=True)
@@ -128,7 +133,10 @@ def neocp_confirmation_menu(config: ConfigParser) -> None:
 
 
 def twilight_sun_moon_menu(config: ConfigParser) -> None:
-    result_times = scheduling.twilight_times(config)
+    import asteroidpy.scheduling as scheduling
+
+    observatory = scheduling.resolve_observatory(config)
+    result_times = scheduling.twilight_times(observatory)
     tfmt = "%H:%M:%S"
     print(
         translate("Civil twilight: {m} – {e}").format(
@@ -149,7 +157,7 @@ def twilight_sun_moon_menu(config: ConfigParser) -> None:
         )
     )
     print("\n")
-    ephemeris = scheduling.sun_moon_ephemeris(config)
+    ephemeris = scheduling.sun_moon_ephemeris(observatory)
     print(translate("Sunrise: {t}").format(t=ephemeris["Sunrise"].strftime(tfmt)))
     print(translate("Sunset: {t}").format(t=ephemeris["Sunset"].strftime(tfmt)))
     print(translate("Moonrise: {t}").format(t=ephemeris["Moonrise"].strftime(tfmt)))
@@ -171,6 +179,8 @@ def print_scheduling_menu() -> None:
 
 
 def object_ephemeris_menu(config: ConfigParser) -> None:
+    import asteroidpy.scheduling as scheduling
+
     object_name = prompt_line(translate("Object Name -> "))
     print(translate("""Stepping
     m - 1 minute
@@ -183,11 +193,17 @@ def object_ephemeris_menu(config: ConfigParser) -> None:
         if step in {"m", "h", "d", "w"}:
             break
         print(translate("Invalid choice — enter m, h, d, or w."))
-    ephemeris_table = scheduling.object_ephemeris(config, object_name, step)
+    local = prompt_line(translate("Compute locally from the orbit? (y/N) -> "))
+    source: Literal["mpc", "local"] = (
+        "local" if local.strip().lower() in {"y", "yes"} else "mpc"
+    )
+    ephemeris_table = scheduling.object_ephemeris(config, object_name, step, source)
     print(ephemeris_table)
 
 
 def scheduling_menu(config: ConfigParser) -> None:
+    import asteroidpy.scheduling as scheduling
+
     choice = -1
     while choice != 0:
         print_scheduling_menu()
@@ -7,6 +7,7 @@ screens can reuse the caller's mutable configuration across the stack.
 
 from __future__ import annotations
 
+import sys
 from configparser import ConfigParser
 
 from textual.app import App
@@ -34,6 +35,18 @@ class AsteroidApp(App[None]):
     def on_mount(self) -> None:
         """Seed the navigation stack at the translated main menu."""
         self.push_screen(MainMenuScreen())
+        # Import the astropy/astroquery stack while the user reads the menu.
+        self.run_worker(_preload_scheduling, thread=True, exit_on_error=False)
+
+    async def on_unmount(self) -> None:
+        """Close pooled HTTP connections opened by scheduling calls."""
+        network = sys.modules.get("asteroidpy.network")
+        if network is not None:
+            await network.aclose_async_client()
+
+
+def _preload_scheduling() -> None:
+    import asteroidpy.scheduling  # noqa: F401
 
 
 def run_textual_interface(config: ConfigParser) -> None:
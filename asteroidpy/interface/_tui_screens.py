@@ -14,17 +14,22 @@ Behaviour notes for maintainers:
 * **MPC What's Observable** — :class:`ObservingTargetListScreen` clamps numeric
   form fields to safe ranges before building the POST payload (see module-level
   ``_MPC_*`` constants).
+* **NEOcp watch** — :class:`NeocpScreen` can poll ``scheduling.watch_neocp`` in a
+  worker and patches its ``DataTable`` rows in place (keyed on designation)
+  instead of pushing a new result modal per run.
 """
 
 from __future__ import annotations
 
 import asyncio
 import datetime
+import importlib
 import io
 import os
 from configparser import ConfigParser
 from contextlib import redirect_stdout
-from typing import Any, List, Tuple, cast
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, cast
 
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
@@ -33,6 +38,7 @@ from textual.screen import Screen
 from textual.widgets import (
     Button,
     Checkbox,
+    DataTable,
     Footer,
     Header,
     Input,
@@ -41,15 +47,20 @@ from textual.widgets import (
     Select,
     Static,
 )
-from textual.worker import WorkerFailed
+from textual.worker import Worker, WorkerFailed, WorkerState
 
 import asteroidpy.configuration as configuration
-import asteroidpy.scheduling as scheduling
 from asteroidpy.version import __version__
 
 from ._i18n import get_locale_dir, setup_gettext
 from ._intl import translate
 
+if TYPE_CHECKING:
+    from astropy.table import QTable
+
+    from asteroidpy.observatory import Observatory
+    from asteroidpy.scheduling import NeocpChanges
+
 
 def _app_config(screen: Screen) -> ConfigParser:
     """Return the mutable :class:`~configparser.ConfigParser` held on ``screen.app``.
@@ -59,6 +70,16 @@ def _app_config(screen: Screen) -> ConfigParser:
     return cast(ConfigParser, getattr(screen.app, "config"))
 
 
+async def _import_scheduling() -> ModuleType:
+    """Return :mod:`asteroidpy.scheduling`, importing it off the event loop.
+
+    The first import loads astropy, astroplan and astroquery (around a second),
+    so screens defer it to the first action that needs it instead of module
+    load; ``AsteroidApp`` also warms it up in the background.
+    """
+    return await asyncio.to_thread(importlib.import_module, "asteroidpy.scheduling")
+
+
 def _refresh_main_menu_after_locale(screen: Screen) -> None:
     """Drop nested screens after a locale change so labels pick up gettext."""
     app = screen.app
@@ -575,7 +596,11 @@ class ObservatoryMpcScreen(Screen):
 
 
 class ObservatoryHorizonScreen(Screen):
-    """Configure cardinal virtual-horizon strings (north/south/east/west)."""
+    """Configure cardinal virtual-horizon strings (north/south/east/west).
+
+    An optional horizon file (azimuth/altitude pairs) overrides the sectors for
+    visibility checks; fields load the stored values on mount.
+    """
 
     BINDINGS = [Binding("escape", "back", "Back")]
 
@@ -604,6 +629,11 @@ class ObservatoryHorizonScreen(Screen):
                 Input(placeholder="", id="west"),
                 classes="input-row",
             ),
+            Horizontal(
+                Label(translate("Horizon file -> ")),
+                Input(placeholder="", id="horizon_file"),
+                classes="input-row",
+            ),
             Horizontal(
                 Button(translate("Save"), id="save", variant="primary"),
                 Button(translate("Cancel"), id="cancel"),
@@ -614,6 +644,17 @@ class ObservatoryHorizonScreen(Screen):
     def action_back(self) -> None:
         self.app.pop_screen()
 
+    def on_mount(self) -> None:
+        cfg = _app_config(self)
+        if not cfg.has_section("Observatory"):
+            return
+        obs = cfg["Observatory"]
+        for field in ("nord", "south", "east", "west"):
+            value = (obs.get(f"{field}_altitude") or "").strip()
+            self.query_one(f"#{field}", Input).value = value
+        horizon_file = (obs.get("horizon_file") or "").strip()
+        self.query_one("#horizon_file", Input).value = horizon_file
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
             self.app.pop_screen()
@@ -627,6 +668,9 @@ class ObservatoryHorizonScreen(Screen):
             "west": self.query_one("#west", Input).value.strip(),
         }
         configuration.virtual_horizon_configuration(_app_config(self), horizon)
+        configuration.change_horizon_file(
+            _app_config(self), self.query_one("#horizon_file", Input).value
+        )
         self.app.pop_screen()
 
 
@@ -668,7 +712,7 @@ class SchedulingRootScreen(Screen):
 
 
 class WeatherScreen(Screen):
-    """Runs ``weather_forecast_report`` off the UI thread into a Rich log."""
+    """Awaits ``async_weather_forecast_report`` and writes it to a Rich log."""
 
     BINDINGS = [Binding("escape", "back", "Back")]
 
@@ -699,10 +743,8 @@ class WeatherScreen(Screen):
         log.clear()
         btn.disabled = True
         try:
-            report = await asyncio.to_thread(
-                scheduling.weather_forecast_report,
-                _app_config(self),
-            )
+            scheduling = await _import_scheduling()
+            report = await scheduling.async_weather_forecast_report(_app_config(self))
             log.write(report)
         finally:
             btn.disabled = False
@@ -813,8 +855,11 @@ class ObservingTargetListScreen(Screen):
         btn = self.query_one("#run", Button)
         btn.disabled = True
         try:
-            authenticity_token, used_fallback = await asyncio.to_thread(
-                scheduling.resolve_whatsup_authenticity_token
+            scheduling = await _import_scheduling()
+            # The token scrape runs on the UI loop while the config is parsed.
+            (authenticity_token, used_fallback), observatory = await asyncio.gather(
+                scheduling.async_resolve_whatsup_authenticity_token(),
+                asyncio.to_thread(scheduling.resolve_observatory, cfg),
             )
             if used_fallback:
                 self.app.notify(
@@ -825,7 +870,7 @@ class ObservingTargetListScreen(Screen):
                     severity="warning",
                 )
 
-            coordinates = await asyncio.to_thread(_local_coordinates, cfg)
+            coordinates = _local_coordinates(observatory)
             use_now = self.query_one("#use_now", Checkbox).value
             if use_now:
                 utc_now = datetime.datetime.now(datetime.timezone.utc)
@@ -986,10 +1031,8 @@ class ObservingTargetListScreen(Screen):
                 "submit": "Submit",
             }
 
-            target_list = await asyncio.to_thread(
-                scheduling.observing_target_list,
-                cfg,
-                payload,
+            target_list = await scheduling.async_observing_target_list(
+                observatory, payload
             )
             open_browser = self.query_one("#browser", Checkbox).value
             if open_browser:
@@ -1004,12 +1047,9 @@ class ObservingTargetListScreen(Screen):
             btn.disabled = False
 
 
-def _local_coordinates(config: ConfigParser) -> List[str]:
-    """Return latitude/longitude strings from the observatory section (after reload)."""
-    configuration.load_config(config)
-    latitude = config["Observatory"]["latitude"]
-    longitude = config["Observatory"]["longitude"]
-    return [latitude, longitude]
+def _local_coordinates(observatory: Observatory) -> List[str]:
+    """Return latitude/longitude strings for the MPC form from a parsed observatory."""
+    return [str(observatory.latitude), str(observatory.longitude)]
 
 
 def _parse_datetime_inputs(screen: ObservingTargetListScreen) -> datetime.datetime:
@@ -1071,11 +1111,71 @@ async def _push_result_log_modal(screen: Screen, body: str) -> None:
         raise exc.error from exc
 
 
+def _neocp_cell(value: Any) -> str:
+    """Display text for one candidate-table value (Quantities without unit)."""
+    value = getattr(value, "value", value)
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _sync_neocp_rows(data_table: DataTable[str], table: "QTable") -> None:
+    """Make ``data_table`` show ``table``, touching only rows and cells that differ.
+
+    Rows are keyed on ``Temp_Desig``: vanished designations are removed, new
+    ones appended and changed cells of the others updated in place. A ranked
+    table (with a ``Priority`` column) is then re-sorted best first. When the
+    columns differ (e.g. a watch restarted with or without ranking) the table
+    is rebuilt from scratch.
+    """
+    if [key.value for key in data_table.columns] != list(table.colnames):
+        data_table.clear(columns=True)
+        for name in table.colnames:
+            data_table.add_column(name, key=name)
+    wanted = {}
+    for row in table:
+        wanted[str(row["Temp_Desig"])] = [
+            _neocp_cell(row[name]) for name in table.colnames
+        ]
+    for row_key in list(data_table.rows):
+        if row_key.value not in wanted:
+            data_table.remove_row(row_key)
+    for designation, cells in wanted.items():
+        if designation not in data_table.rows:
+            data_table.add_row(*cells, key=designation)
+            continue
+        for name, cell in zip(table.colnames, cells):
+            if data_table.get_cell(designation, name) != cell:
+                data_table.update_cell(designation, name, cell)
+    if "Priority" in table.colnames:
+        data_table.sort("Priority", key=float, reverse=True)
+
+
+def _neocp_changes_summary(changes: "NeocpChanges") -> str:
+    """One status line, e.g. ``+2 new, -1 gone, 3 updated (P21abcD: NObs 4->6)``."""
+    text = translate("{added} new, {removed} gone, {updated} updated").format(
+        added=len(changes.added),
+        removed=len(changes.removed),
+        updated=len(changes.updated),
+    )
+    details = [
+        designation
+        + ": "
+        + ", ".join(f"{field} {old}->{new}" for field, (old, new) in fields.items())
+        for designation, fields in list(changes.updated.items())[:3]
+    ]
+    return text + (f" ({'; '.join(details)})" if details else "")
+
+
 class NeocpScreen(Screen):
-    """Filter NEOcp confirmation prospects; render table or JS viewer."""
+    """Filter NEOcp confirmation prospects; render table, JS viewer or live watch."""
 
     BINDINGS = [Binding("escape", "back", "Back")]
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._watch_worker: Optional[Worker[None]] = None
+
     def compose(self) -> Any:
         yield Header()
         yield Footer()
@@ -1096,17 +1196,28 @@ class NeocpScreen(Screen):
                 Input(placeholder="", id="min_alt"),
                 classes="input-row",
             ),
+            Horizontal(
+                Label(translate("Show only the best N (empty for all) -> ")),
+                Input(placeholder="", id="top_n"),
+                classes="input-row",
+            ),
             Checkbox(
                 translate("Open result in browser"),
                 id="browser",
             ),
             Horizontal(
                 Button(translate("Run"), id="run", variant="primary"),
+                Button(translate("Watch"), id="watch"),
                 Button(translate("0 - Back"), id="back"),
             ),
+            Static("", id="watch_status"),
+            DataTable(id="watch_table", zebra_stripes=True),
             id="panel",
         )
 
+    def on_mount(self) -> None:
+        self.query_one("#watch_table", DataTable).display = False
+
     def action_back(self) -> None:
         self.app.pop_screen()
 
@@ -1115,28 +1226,42 @@ class NeocpScreen(Screen):
             self.app.pop_screen()
         elif event.button.id == "run":
             await self._do_run()
+        elif event.button.id == "watch":
+            await self._toggle_watch()
+
+    def _read_filters(self) -> Optional[Tuple[int, float, int, Optional[int]]]:
+        """``(min_score, max_magnitude, min_altitude, top_n)``, or ``None`` after a warning."""
+        try:
+            min_score = int(self.query_one("#min_score", Input).value.strip())
+            min_altitude = int(self.query_one("#min_alt", Input).value.strip())
+            max_magnitude = float(self.query_one("#max_mag", Input).value.strip())
+            top_n_text = self.query_one("#top_n", Input).value.strip()
+            top_n = int(top_n_text) if top_n_text else None
+        except ValueError:
+            self.app.notify(
+                translate("You must enter valid numeric fields."),
+                severity="warning",
+            )
+            return None
+        return min_score, max_magnitude, min_altitude, top_n
 
     async def _do_run(self) -> None:
         """Validate numeric filters, fetch async MPC table, show result overlay."""
         btn = self.query_one("#run", Button)
         btn.disabled = True
         try:
-            try:
-                min_score = int(self.query_one("#min_score", Input).value.strip())
-                min_altitude = int(self.query_one("#min_alt", Input).value.strip())
-                max_magnitude = float(self.query_one("#max_mag", Input).value.strip())
-            except ValueError:
-                self.app.notify(
-                    translate("You must enter valid numeric fields."),
-                    severity="warning",
-                )
+            filters = self._read_filters()
+            if filters is None:
                 return
+            min_score, max_magnitude, min_altitude, top_n = filters
 
+            scheduling = await _import_scheduling()
             table = await scheduling.async_neocp_confirmation(
                 _app_config(self),
                 min_score,
                 max_magnitude,
                 min_altitude,
+                top_n=top_n,
             )
             open_browser = self.query_one("#browser", Checkbox).value
             if open_browser:
@@ -1148,6 +1273,73 @@ class NeocpScreen(Screen):
         finally:
             btn.disabled = False
 
+    async def _toggle_watch(self) -> None:
+        """Start polling into the embedded table, or stop a running watch."""
+        button = self.query_one("#watch", Button)
+        if self._watch_worker is not None:
+            self._watch_worker.cancel()
+            self._watch_worker = None
+            button.label = translate("Watch")
+            self.query_one("#watch_status", Static).update(translate("Watch stopped."))
+            return
+        filters = self._read_filters()
+        if filters is None:
+            return
+        self.query_one("#watch_table", DataTable).display = True
+        button.label = translate("Stop watching")
+        self._watch_worker = self.run_worker(
+            self._watch(*filters), exclusive=True, exit_on_error=False
+        )
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Reset the Watch button when the watch ends by itself, reporting errors."""
+        if event.worker is not self._watch_worker or event.state not in (
+            WorkerState.ERROR,
+            WorkerState.SUCCESS,
+        ):
+            return
+        self._watch_worker = None
+        self.query_one("#watch", Button).label = translate("Watch")
+        status = self.query_one("#watch_status", Static)
+        if event.state == WorkerState.ERROR:
+            message = translate("Watch stopped after an error: {error}").format(
+                error=event.worker.error
+            )
+            status.update(message)
+            self.app.notify(message, severity="error")
+        else:
+            status.update(translate("Watch stopped."))
+
+    async def _watch(
+        self,
+        min_score: int,
+        max_magnitude: float,
+        min_altitude: int,
+        top_n: Optional[int],
+    ) -> None:
+        """Apply each ``watch_neocp`` update to the table and the status line."""
+        scheduling = await _import_scheduling()
+        data_table = self.query_one("#watch_table", DataTable)
+        status = self.query_one("#watch_status", Static)
+        status.update(translate("Polling NEOcp..."))
+        updates = scheduling.watch_neocp(
+            _app_config(self), min_score, max_magnitude, min_altitude, top_n=top_n
+        )
+        try:
+            async for update in updates:
+                stamp = datetime.datetime.now().strftime("%H:%M:%S")
+                if not update.ok:
+                    status.update(
+                        translate(
+                            "{time}: NEOcp poll failed; keeping last table."
+                        ).format(time=stamp)
+                    )
+                    continue
+                _sync_neocp_rows(data_table, update.table)
+                status.update(f"{stamp}: {_neocp_changes_summary(update.changes)}")
+        finally:
+            await updates.aclose()
+
 
 class EphemerisScreen(Screen):
     """Planetarium-style stepping ephemeris for a named solar-system object."""
@@ -1181,6 +1373,10 @@ class EphemerisScreen(Screen):
                 value="m",
                 id="step",
             ),
+            Checkbox(
+                translate("Compute locally from the orbit"),
+                id="local",
+            ),
             Horizontal(
                 Button(translate("Run"), id="run", variant="primary"),
                 Button(translate("0 - Back"), id="back"),
@@ -1210,11 +1406,14 @@ class EphemerisScreen(Screen):
                     severity="warning",
                 )
                 return
+            source = "local" if self.query_one("#local", Checkbox).value else "mpc"
+            scheduling = await _import_scheduling()
             table = await asyncio.to_thread(
                 scheduling.object_ephemeris,
                 _app_config(self),
                 name,
                 step,
+                source,
             )
             await _push_result_log_modal(self, str(table))
         finally:
@@ -1257,8 +1456,12 @@ class TwilightScreen(Screen):
             def _twilight_bundle(cfg: ConfigParser) -> Tuple[Any, Any]:
                 """Pair twilight and sun/moon results for ``asyncio.to_thread``."""
 
-                return scheduling.twilight_times(cfg), scheduling.sun_moon_ephemeris(
-                    cfg
+                import asteroidpy.scheduling as scheduling
+
+                observatory = scheduling.resolve_observatory(cfg)
+                return (
+                    scheduling.twilight_times(observatory),
+                    scheduling.sun_moon_ephemeris(observatory),
                 )
 
             result_times, ephemeris = await asyncio.to_thread(
@@ -0,0 +1,378 @@
+"""Parsers for MPC What's Observable and confirmation ephemeris pages.
+
+For What's Observable, the default backend walks the page with ``lxml.html`` and precompiled XPath
+expressions; the original BeautifulSoup traversal is kept as the ``"bs4"``
+backend for comparison (``scripts/bench_scrapers.py``) and produces the same
+rows. Cell text follows ``Tag.get_text(strip=True)``: every text node is
+stripped and the pieces are joined without a separator, comments excluded.
+
+Confirmation ephemeris (``confirmeph2.cgi``) responses are read by
+:class:`NeocpEphemerisScanner`, a single-pass scanner fed with the body as it
+arrives, so large multi-object pages are never held in memory whole. Every
+ephemeris line of an object is kept as a structured array
+(:data:`EPHEMERIS_DTYPE`) on the :class:`EphemerisValues` it returns.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import lxml.html
+import numpy as np
+from lxml import etree
+
+ParserBackend = Literal["lxml", "bs4"]
+
+#: Backend used when callers do not pick one.
+DEFAULT_BACKEND: ParserBackend = "lxml"
+
+# Result tables use either the classic columns or the extended Begin/Max layout.
+CLASSIC_HEADERS = frozenset({"Designation", "Mag", "Time", "RA", "Dec", "Alt"})
+BEGIN_HEADERS = frozenset(
+    {"Designation", "Mag", "Begin Time", "Beg RA", "Beg Dec", "Beg Alt"}
+)
+
+_TOKEN_INPUT_RE = re.compile(
+    r'name=["\']authenticity_token["\'][^>]*value=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+_CSRF_META_RE = re.compile(
+    r'<meta\s+name=["\']csrf-token["\']\s+content=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+_TABLES = etree.XPath("//table")
+_HEADER_CELLS = etree.XPath(".//th")
+_ROWS = etree.XPath(".//tr")
+_DATA_CELLS = etree.XPath(".//td")
+_TOKEN_VALUES = etree.XPath("(//input[@name='authenticity_token'])[1]/@value")
+
+_Html = Union[str, bytes]
+_T = TypeVar("_T")
+
+
+def _table_matches_results(headers: Iterable[str]) -> bool:
+    present = {h for h in headers if h}
+    return CLASSIC_HEADERS <= present or BEGIN_HEADERS <= present
+
+
+def _html_root(content: _Html) -> Optional[etree._Element]:
+    """Parse ``content`` as UTF-8 when it decodes, else let libxml2 sniff it."""
+
+    if isinstance(content, bytes):
+        try:
+            content = content.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+    if not content or not content.strip():
+        return None
+    try:
+        return lxml.html.document_fromstring(content)
+    except ValueError:
+        # str input with an XML encoding declaration: parse the bytes instead.
+        raw = content.encode("utf-8") if isinstance(content, str) else content
+        return lxml.html.document_fromstring(raw)
+    except etree.ParserError:
+        return None
+
+
+def _text(element: etree._Element) -> str:
+    return "".join(piece.strip() for piece in element.itertext())
+
+
+def _pick_table(
+    tables: Sequence[_T], headers_of: Callable[[_T], List[str]]
+) -> Optional[_T]:
+    # Prefer the 4th table (legacy layout), otherwise the first one whose
+    # headers look like a result table.
+    if len(tables) >= 4 and _table_matches_results(headers_of(tables[3])):
+        return tables[3]
+    for table in tables:
+        if _table_matches_results(headers_of(table)):
+            return table
+    return None
+
+
+def _whatsup_rows_lxml(content: _Html) -> List[List[str]]:
+    root = _html_root(content)
+    if root is None:
+        return []
+    table = _pick_table(_TABLES(root), lambda t: [_text(th) for th in _HEADER_CELLS(t)])
+    if table is None:
+        return []
+    data: List[List[str]] = []
+    for row in _ROWS(table):
+        cells = _DATA_CELLS(row)
+        if not cells:
+            continue
+        values = [_text(cell) for cell in cells]
+        if any(values):
+            data.append(values)
+    return data
+
+
+def _whatsup_rows_bs4(content: _Html) -> List[List[str]]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "lxml")
+    table = _pick_table(
+        soup.find_all("table"),
+        lambda t: [th.get_text(strip=True) for th in t.find_all("th")],
+    )
+    if table is None:
+        return []
+    data: List[List[str]] = []
+    for row in table.find_all("tr"):
+        cells = row.find_all("td")
+        if not cells:
+            continue
+        values = [cell.get_text(strip=True) for cell in cells]
+        if any(values):
+            data.append(values)
+    return data
+
+
+_ROW_PARSERS: Dict[str, Callable[[_Html], List[List[str]]]] = {
+    "lxml": _whatsup_rows_lxml,
+    "bs4": _whatsup_rows_bs4,
+}
+
+
+def parse_whatsup_results(
+    content: _Html, backend: Optional[ParserBackend] = None
+) -> List[List[str]]:
+    """Return the non-empty data rows of a What's Observable result page.
+
+    Parameters
+    ----------
+    content : str or bytes
+        Response body of the What's Observable POST.
+    backend : {"lxml", "bs4"}, optional
+        Parser to use (default :data:`DEFAULT_BACKEND`).
+
+    Returns
+    -------
+    List[List[str]]
+        One list of cell strings per row; empty when no table has the
+        expected headers.
+    """
+
+    name = backend or DEFAULT_BACKEND
+    try:
+        parse = _ROW_PARSERS[name]
+    except KeyError:
+        raise ValueError(f"unknown parser backend: {name!r}") from None
+    return parse(content)
+
+
+def parse_authenticity_token(content: _Html) -> str:
+    """Return the Rails ``authenticity_token`` of the What's Observable form, or ''.
+
+    Reads the form input with XPath, then falls back to regular expressions
+    for the input and the ``csrf-token`` meta tag.
+    """
+
+    root = _html_root(content)
+    if root is not None:
+        for value in _TOKEN_VALUES(root):
+            if value:
+                return str(value)
+    html = content.decode("utf-8", "replace") if isinstance(content, bytes) else content
+    for pattern in (_TOKEN_INPUT_RE, _CSRF_META_RE):
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    return ""
+
+
+# A confirmeph2 page has, per object, ``<b>DESIGNATION</b>`` followed by a
+# ``<pre>`` block whose third line is the first ephemeris row.
+_DESIGNATION_RE = re.compile(r"[A-Za-z0-9]*")
+_SEEK_NAME, _NAME, _SEEK_PRE, _PRE = range(4)
+
+#: One confirmeph2 ephemeris line: UTC epoch, J2000 R.A./Decl. in degrees,
+#: V magnitude, sky motion ("/min), its position angle and the altitude (deg).
+EPHEMERIS_DTYPE = np.dtype(
+    [
+        ("time", "datetime64[m]"),
+        ("ra", "f8"),
+        ("dec", "f8"),
+        ("v", "f4"),
+        ("motion", "f4"),
+        ("pa", "f4"),
+        ("alt", "f4"),
+    ]
+)
+
+# Token positions in an ephemeris line: date (0-2), UT hhmm (3), R.A. h m s
+# (4-6), Decl. d m s (7-9), elongation, V, motion, P.A., azimuth, altitude.
+_EPH_V, _EPH_MOTION, _EPH_PA, _EPH_ALT = 11, 12, 13, 15
+
+
+class EphemerisValues(List[str]):
+    """The whitespace-split first ephemeris row of an object, as a list.
+
+    ``series`` holds every parsable line of the object's ``<pre>`` block as an
+    :data:`EPHEMERIS_DTYPE` array (empty when no line parses).
+    """
+
+    def __init__(
+        self, values: Iterable[str], series: Optional[np.ndarray] = None
+    ) -> None:
+        super().__init__(values)
+        self.series = np.empty(0, EPHEMERIS_DTYPE) if series is None else series
+
+
+def _ephemeris_line(tokens: List[str]) -> Optional[Tuple[Any, ...]]:
+    if len(tokens) <= _EPH_ALT:
+        return None
+    year, month, day, hhmm = tokens[:4]
+    try:
+        when = np.datetime64(
+            f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+            f"T{int(hhmm[:2]):02d}:{int(hhmm[2:4] or 0):02d}",
+            "m",
+        )
+        ra_h, ra_m, ra_s = (float(t) for t in tokens[4:7])
+        dec_d, dec_m, dec_s = (abs(float(t)) for t in tokens[7:10])
+        numbers = [float(tokens[i]) for i in (_EPH_V, _EPH_MOTION, _EPH_PA, _EPH_ALT)]
+    except ValueError:
+        return None
+    sign = -1.0 if tokens[7].startswith("-") else 1.0
+    ra = 15.0 * (ra_h + ra_m / 60.0 + ra_s / 3600.0)
+    dec = sign * (dec_d + dec_m / 60.0 + dec_s / 3600.0)
+    return (when, ra, dec, *numbers)
+
+
+def parse_ephemeris_series(block: str) -> np.ndarray:
+    """Parse every ephemeris line of a confirmeph2 ``<pre>`` block.
+
+    Header, separator and comment lines are skipped; the result has
+    :data:`EPHEMERIS_DTYPE`.
+    """
+
+    rows = []
+    for line in block.splitlines():
+        row = _ephemeris_line(line.split())
+        if row is not None:
+            rows.append(row)
+    return np.array(rows, dtype=EPHEMERIS_DTYPE)
+
+
+EphemerisRecord = Tuple[str, EphemerisValues]
+
+
+def _ephemeris_row(block: str) -> Optional[EphemerisValues]:
+    lines = block.strip().split("\n")
+    line = lines[2] if len(lines) > 2 else lines[0]
+    values = line.split()
+    if len(values) < 4:
+        return None
+    return EphemerisValues(values, parse_ephemeris_series(block))
+
+
+class NeocpEphemerisScanner:
+    """Incremental, single-pass scanner for confirmeph2 ephemeris pages.
+
+    :meth:`feed` takes the response body in chunks of any size (bytes are
+    decoded as UTF-8) and returns the ``(designation, values)`` records the
+    chunk completed, ``values`` being the whitespace-split first ephemeris
+    row with the whole table on its ``series``. Each character is examined once; only the current ``<pre>`` block
+    and a few characters of look-behind are buffered between chunks. Rows
+    with fewer than 4 values are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._state = _SEEK_NAME
+        self._pending = ""
+        self._name = ""
+        self._block: List[str] = []
+
+    def feed(self, data: Union[str, bytes]) -> List[EphemerisRecord]:
+        """Scan the next chunk of the body; return the records it completed."""
+
+        text = self._decoder.decode(data) if isinstance(data, bytes) else data
+        return self._scan(self._pending + text)
+
+    def close(self) -> List[EphemerisRecord]:
+        """Finish the body; an unterminated ``<pre>`` block is dropped."""
+
+        records = self._scan(self._pending + self._decoder.decode(b"", final=True))
+        self._reset()
+        return records
+
+    def _scan(self, text: str) -> List[EphemerisRecord]:
+        records: List[EphemerisRecord] = []
+        pos = 0
+        end = len(text)
+        while True:
+            if self._state == _SEEK_NAME:
+                found = text.find("<b>", pos)
+                if found < 0:
+                    self._pending = text[max(pos, end - 2) :]
+                    return records
+                pos = found + 3
+                self._state = _NAME
+            elif self._state == _NAME:
+                stop = _DESIGNATION_RE.match(text, pos).end()  # type: ignore[union-attr]
+                closing = text[stop : stop + 4]
+                if len(closing) < 4 and "</b>".startswith(closing):
+                    self._pending = text[pos:]  # designation may continue
+                    return records
+                if stop > pos and closing == "</b>":
+                    self._name = text[pos:stop]
+                    pos = stop + 4
+                    self._state = _SEEK_PRE
+                else:
+                    self._state = _SEEK_NAME
+            elif self._state == _SEEK_PRE:
+                found = text.find("<pre>", pos)
+                if found < 0:
+                    self._pending = text[max(pos, end - 4) :]
+                    return records
+                pos = found + 5
+                self._state = _PRE
+            else:
+                found = text.find("</pre>", pos)
+                if found < 0:
+                    keep = max(pos, end - 5)
+                    self._block.append(text[pos:keep])
+                    self._pending = text[keep:]
+                    return records
+                self._block.append(text[pos:found])
+                row = _ephemeris_row("".join(self._block))
+                if row is not None:
+                    records.append((self._name, row))
+                self._block = []
+                pos = found + 6
+                self._state = _SEEK_NAME
+
+
+def scan_neocp_ephemerides(
+    chunks: Iterable[Union[str, bytes]],
+) -> Iterator[EphemerisRecord]:
+    """Yield ``(designation, values)`` records from a confirmeph2 body in chunks."""
+
+    scanner = NeocpEphemerisScanner()
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
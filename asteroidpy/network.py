@@ -0,0 +1,836 @@
+"""Shared, pooled HTTP clients for the MPC, 7Timer and other web services.
+
+:mod:`asteroidpy.scheduling` sends every request through the clients returned
+here instead of opening a connection per call, so repeated requests to the
+same host reuse keep-alive connections (and TLS sessions). There is one
+``httpx.AsyncClient`` per running event loop, because httpx connections are
+bound to the loop that opened them; the blocking scheduling functions run
+their ``async_`` variants on a short-lived loop (see :func:`run`), and the
+clients share one cookie jar across loops. ``AsteroidApp`` closes its
+client when it exits.
+
+:func:`afetch` adds the persistent response cache of
+:mod:`asteroidpy.httpcache` in front of those clients; pass
+``bypass_cache=True`` or wrap calls in :func:`cache_bypass` to force a
+refresh (the fresh response still updates the cache).
+
+It also applies the per-endpoint policies of :mod:`asteroidpy.resilience`:
+connect/read timeouts, jittered exponential retries of idempotent requests
+and a circuit breaker per host. While a host's breaker is open, or once the
+retries are used up, an expired cache entry is served if there is one;
+otherwise the call fails with :class:`~asteroidpy.resilience.CircuitOpenError`
+or the last transport error.
+
+Requests to rate-limited hosts wait for a token of the host's
+:class:`~asteroidpy.ratelimit.HostRateLimiter`, interactive callers ahead of
+:func:`request_priority` ``BACKGROUND`` ones, and identical idempotent
+requests already in flight are shared instead of being sent again.
+
+:func:`astream` is the streaming form of :func:`afetch`: the body is yielded
+in chunks as it arrives, under the same cache, policies and rate limits.
+
+With a :class:`~asteroidpy.cassette.Cassette` active (see :func:`use_cassette`)
+every response is also recorded, or, in replay mode, served from the
+cassette without touching the network, the cache or the breakers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import http.cookiejar
+import importlib.util
+import json
+import os
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import httpx
+
+from asteroidpy.cassette import Cassette, CassetteMissError, cassette_from_env
+from asteroidpy.httpcache import (
+    DEFAULT_MAX_BYTES,
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheStats,
+    cache_key,
+    default_cache_path,
+)
+from asteroidpy.ratelimit import (
+    DEFAULT_RATE_LIMITS,
+    HostRateLimiter,
+    Priority,
+    RateLimit,
+    limit_for,
+)
+from asteroidpy.resilience import (
+    DEFAULT_POLICIES,
+    RETRY_STATUSES,
+    CircuitBreaker,
+    CircuitOpenError,
+    EndpointPolicy,
+    backoff_delay,
+    policy_for,
+)
+
+DEFAULT_REQUEST_TIMEOUT_SEC = 30.0
+# Size of the chunks :func:`astream` yields for cached or replayed bodies.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+class HttpClientSettings(NamedTuple):
+    """Connection pool options applied to clients created after :func:`configure_http`."""
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+    timeout: float = DEFAULT_REQUEST_TIMEOUT_SEC
+    #: Use HTTP/2 when the optional ``h2`` package is installed.
+    http2: bool = False
+
+
+_settings = HttpClientSettings()
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+# One jar for every async client, so cookies (e.g. the MPC Rails session) outlive
+# the short-lived event loops of blocking wrappers.
+_cookies = http.cookiejar.CookieJar()
+
+
+def http_settings() -> HttpClientSettings:
+    """Return the active connection pool settings."""
+
+    return _settings
+
+
+def configure_http(**changes: Any) -> HttpClientSettings:
+    """Update pool settings (fields of :class:`HttpClientSettings`).
+
+    Existing clients keep their settings until they are closed; call
+    :func:`aclose_async_client` to apply changes now.
+    """
+
+    global _settings
+    _settings = _settings._replace(**changes)
+    return _settings
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient`` of the running event loop.
+
+    Created on first use with keep-alive limits from :func:`http_settings`;
+    HTTP/2 is enabled only when requested and ``h2`` is importable. All
+    clients share one cookie jar. Must be called from a coroutine.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        settings = _settings
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.timeout),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            http2=settings.http2 and _http2_available(),
+            cookies=_cookies,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's shared client, if one was created."""
+
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def run(coro: Awaitable[T]) -> T:
+    """Run ``coro`` with :func:`asyncio.run`, closing the loop's client afterwards.
+
+    Blocking wrappers use this so the pooled connections of their short-lived
+    event loop are released instead of leaking with the closed loop.
+    """
+
+    async def _main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+
+    return asyncio.run(_main())
+
+
+class AsyncCircuitOpenError(CircuitOpenError, httpx.TransportError):
+    """:class:`CircuitOpenError` raised by :func:`afetch` (an ``httpx`` error)."""
+
+
+_policies: Dict[str, EndpointPolicy] = dict(DEFAULT_POLICIES)
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def endpoint_policy(url: str) -> EndpointPolicy:
+    """Return the timeouts/retry/breaker policy applied to requests for ``url``."""
+
+    return policy_for(url, _policies)
+
+
+def configure_endpoint_policy(prefix: str, **changes: Any) -> EndpointPolicy:
+    """Set fields of the policy for URLs starting with ``prefix``.
+
+    A new prefix starts from the defaults of :class:`EndpointPolicy`. Breakers
+    already created keep their threshold until :func:`reset_circuit_breakers`.
+    """
+
+    with _lock:
+        policy = _policies.get(prefix, EndpointPolicy())._replace(**changes)
+        _policies[prefix] = policy
+    return policy
+
+
+def circuit_breaker(url: str) -> CircuitBreaker:
+    """Return the breaker of ``url``'s host (created from its endpoint policy)."""
+
+    host = urlsplit(url).netloc
+    with _lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            policy = policy_for(url, _policies)
+            breaker = CircuitBreaker(policy.failure_threshold, policy.reset_timeout)
+            _breakers[host] = breaker
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Close every breaker (forgetting recorded failures)."""
+
+    with _lock:
+        _breakers.clear()
+
+
+_rate_limits: Dict[str, RateLimit] = dict(DEFAULT_RATE_LIMITS)
+_limiters: Dict[str, HostRateLimiter] = {}
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "asteroidpy_request_priority", default=Priority.INTERACTIVE
+)
+
+
+def rate_limiter(url: str) -> Optional[HostRateLimiter]:
+    """Return the token bucket covering ``url``'s host, or ``None`` if unlimited."""
+
+    suffix, limit = limit_for(urlsplit(url).netloc, _rate_limits)
+    if limit is None:
+        return None
+    with _lock:
+        limiter = _limiters.get(suffix)
+        if limiter is None:
+            limiter = HostRateLimiter(limit.rate, limit.burst)
+            _limiters[suffix] = limiter
+        return limiter
+
+
+def configure_rate_limit(host_suffix: str, rate: float, burst: int) -> None:
+    """Limit hosts ending in ``host_suffix`` to ``rate`` requests/s (``burst`` extra).
+
+    A ``rate`` of ``0`` or less removes the limit.
+    """
+
+    with _lock:
+        if rate > 0:
+            _rate_limits[host_suffix] = RateLimit(rate, burst)
+        else:
+            _rate_limits.pop(host_suffix, None)
+        _limiters.pop(host_suffix, None)
+
+
+def reset_rate_limiters() -> None:
+    """Refill every bucket (new limiters are created on the next request)."""
+
+    with _lock:
+        _limiters.clear()
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Send the requests made in the block (and tasks started from it) in ``priority``.
+
+    Background prefetching should use ``Priority.BACKGROUND`` so interactive
+    requests waiting for the same host go first.
+    """
+
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+_ainflight: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str, "_SharedTask"]
+] = weakref.WeakKeyDictionary()
+
+
+class _SharedTask:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[HttpResponse]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _request_key(
+    method: str,
+    url: str,
+    params: _FormData,
+    body: _FormData,
+    headers: Optional[Mapping[str, str]],
+) -> str:
+    extra = json.dumps(sorted((headers or {}).items())) if headers else ""
+    return cache_key(method, url, params, body) + extra
+
+
+async def _ashared(
+    key: str, send: Callable[[], Awaitable[HttpResponse]]
+) -> HttpResponse:
+    """Run ``send`` once for concurrent callers with the same ``key`` in the loop.
+
+    The request is cancelled only when every caller waiting for it is.
+    """
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        pending = _ainflight.setdefault(loop, {})
+        shared = pending.get(key)
+        if shared is None:
+            shared = _SharedTask(asyncio.ensure_future(send()))
+            pending[key] = shared
+            shared.task.add_done_callback(lambda _: pending.pop(key, None))
+        shared.waiters += 1
+    try:
+        return await asyncio.shield(shared.task)
+    finally:
+        shared.waiters -= 1
+        if shared.waiters == 0 and not shared.task.done():
+            shared.task.cancel()
+
+
+class AsyncCassetteMissError(CassetteMissError, httpx.TransportError):
+    """:class:`CassetteMissError` raised by :func:`afetch` (an ``httpx`` error)."""
+
+
+_cassette: Optional[Cassette] = None
+_cassette_loaded = False
+
+
+def active_cassette() -> Optional[Cassette]:
+    """Return the cassette in use, reading the environment on first call."""
+
+    global _cassette, _cassette_loaded
+    with _lock:
+        if not _cassette_loaded:
+            _cassette = cassette_from_env()
+            _cassette_loaded = True
+        return _cassette
+
+
+def use_cassette(cassette: Optional[Cassette]) -> None:
+    """Record to / replay from ``cassette`` from now on (``None`` goes live)."""
+
+    global _cassette, _cassette_loaded
+    with _lock:
+        _cassette = cassette
+        _cassette_loaded = True
+
+
+class HttpResponse(Protocol):
+    """What callers may rely on from :func:`afetch` results.
+
+    Satisfied by ``httpx.Response`` and
+    :class:`~asteroidpy.httpcache.CachedResponse`.
+    """
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def json(self) -> Any: ...
+
+    def raise_for_status(self) -> Any: ...
+
+
+_FormData = Union[None, str, bytes, Mapping[str, Any]]
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_enabled = True
+_cache_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "asteroidpy_cache_bypass", default=False
+)
+
+
+def response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or ``None`` when disabled."""
+
+    global _response_cache
+    if not _response_cache_enabled:
+        return None
+    with _lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(default_cache_path())
+        return _response_cache
+
+
+def configure_response_cache(
+    *,
+    path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    max_bytes: Optional[int] = None,
+    ttls: Optional[Mapping[str, float]] = None,
+    enabled: Optional[bool] = None,
+) -> None:
+    """Change the cache file, size bound, per-URL-prefix TTLs or disable caching.
+
+    ``ttls`` entries are merged into the current table; a TTL of ``0`` stops
+    caching that endpoint.
+    """
+
+    global _response_cache, _response_cache_enabled
+    if enabled is not None:
+        _response_cache_enabled = enabled
+    with _lock:
+        current = _response_cache
+        if path is not None:
+            if current is not None:
+                current.close()
+            merged = dict(current.ttls) if current is not None else None
+            _response_cache = ResponseCache(
+                path,
+                max_bytes if max_bytes is not None else DEFAULT_MAX_BYTES,
+                merged,
+            )
+            current = _response_cache
+    if current is None and (max_bytes is not None or ttls is not None):
+        current = response_cache()
+    if current is not None:
+        if max_bytes is not None:
+            current.max_bytes = int(max_bytes)
+        if ttls is not None:
+            current.ttls.update(ttls)
+
+
+def response_cache_stats() -> Optional[ResponseCacheStats]:
+    """Hit/miss counters and stored size of the response cache (``None`` if disabled)."""
+
+    cache = response_cache()
+    return cache.stats() if cache is not None else None
+
+
+@contextlib.contextmanager
+def cache_bypass(enabled: bool = True) -> Iterator[None]:
+    """Within the block (and tasks/threads started from it) skip cache lookups."""
+
+    token = _cache_bypass.set(enabled or _cache_bypass.get())
+    try:
+        yield
+    finally:
+        _cache_bypass.reset(token)
+
+
+def cache_bypassed() -> bool:
+    """Whether the current context is inside an enabled :func:`cache_bypass` block."""
+
+    return _cache_bypass.get()
+
+
+def header_value(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Case-insensitive lookup of ``name`` in response ``headers``.
+
+    Stored responses keep whatever key case the original client reported, so
+    plain dictionary access is not enough.
+    """
+
+    wanted = name.lower()
+    for key, value in headers.items():
+        if key.lower() == wanted:
+            return value
+    return None
+
+
+# The cache is SQLite on disk: its reads and writes run in a worker thread.
+async def _cached(
+    method: str, url: str, params: _FormData, body: _FormData, bypass_cache: bool
+) -> Tuple[Optional[ResponseCache], str, Optional[HttpResponse]]:
+    cache = response_cache()
+    if cache is None or cache.ttl_for(url) <= 0:
+        return None, "", None
+    key = cache_key(method, url, params, body)
+    if bypass_cache or _cache_bypass.get():
+        return cache, key, None
+    return cache, key, await asyncio.to_thread(cache.get, key, url)
+
+
+async def _store(
+    cache: Optional[ResponseCache], key: str, url: str, response: HttpResponse
+) -> None:
+    if cache is not None and response.status_code == 200:
+        headers: Dict[str, str] = dict(getattr(response, "headers", None) or {})
+        await asyncio.to_thread(
+            cache.put, key, url, response.status_code, response.content, headers
+        )
+
+
+def _attempts(method: str, policy: EndpointPolicy) -> int:
+    return 1 + (max(0, policy.retries) if method.upper() in policy.retry_methods else 0)
+
+
+class _Attempts:
+    """Breaker, rate-limit and backoff bookkeeping of one request's attempts.
+
+    Shared by :func:`_asend` and :func:`astream`, which differ only in how
+    they send: iterating yields attempt numbers while the host's breaker
+    allows them (storing :class:`CircuitOpenError` in :attr:`failure` when it
+    refuses), each send runs inside :meth:`trial` and reports through
+    :meth:`settle`, and :attr:`failure` feeds :func:`_fallback` at the end.
+    The breaker sees one failure per request, once its retries are used up
+    (or at once for a half-open trial), not one per attempt.
+    """
+
+    failure: Union[HttpResponse, BaseException]
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        policy: EndpointPolicy,
+        open_error: Callable[[str, float], CircuitOpenError],
+    ) -> None:
+        self.policy = policy
+        self.count = _attempts(method, policy)
+        self.breaker = circuit_breaker(url)
+        self.limiter = rate_limiter(url)
+        self._host = urlsplit(url).netloc
+        self._open_error = open_error
+        self._last = False
+
+    def __iter__(self) -> Iterator[int]:
+        for attempt in range(self.count):
+            if not self.breaker.allow():
+                self.failure = self._open_error(self._host, self.breaker.retry_in())
+                return
+            self._last = attempt + 1 >= self.count
+            yield attempt
+
+    async def acquire_async(self) -> None:
+        if self.limiter is not None:
+            await self.limiter.acquire_async(_priority.get())
+
+    @contextlib.contextmanager
+    def trial(self) -> Iterator[None]:
+        """Report an attempt that ends with an exception the caller does not handle.
+
+        Errors count as failures; cancellation (e.g. ``asyncio.wait_for``) and
+        interrupts only hand a half-open trial back, so the breaker never waits
+        for an outcome that will not come.
+        """
+
+        try:
+            yield
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release_trial()
+            raise
+
+    def settle(
+        self, outcome: Union[HttpResponse, BaseException]
+    ) -> Optional[HttpResponse]:
+        """Record an attempt's outcome; return the response if it is final."""
+
+        if isinstance(outcome, BaseException) or outcome.status_code in RETRY_STATUSES:
+            if self._last or self.breaker.probing:
+                self.breaker.record_failure()
+            self.failure = outcome
+            return None
+        self.breaker.record_success()
+        return outcome
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait after ``attempt`` failed (0 after the last one)."""
+
+        if attempt + 1 >= self.count:
+            return 0.0
+        return backoff_delay(self.policy, attempt)
+
+
+async def _fallback(
+    cache: Optional[ResponseCache],
+    key: str,
+    url: str,
+    failure: Union[HttpResponse, BaseException],
+) -> HttpResponse:
+    """Serve an expired cache entry, else the last failed response or error."""
+
+    stale = None
+    if cache is not None:
+        stale = await asyncio.to_thread(cache.get, key, url, allow_stale=True)
+    if stale is not None:
+        return stale
+    if isinstance(failure, BaseException):
+        raise failure
+    return failure
+
+
+async def _afetch(
+    method: str,
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    data: Optional[Mapping[str, Any]] = None,
+    content: Union[None, str, bytes] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    bypass_cache: bool = False,
+) -> HttpResponse:
+    """Cache, sharing, rate limit, retries and breaker part of :func:`afetch`."""
+
+    body = data if data is not None else content
+    cache, key, hit = await _cached(method, url, params, body, bypass_cache)
+    if hit is not None:
+        return hit
+    policy = endpoint_policy(url)
+
+    def send() -> Awaitable[HttpResponse]:
+        return _asend(method, url, params, data, content, headers, policy, cache, key)
+
+    if method.upper() not in policy.retry_methods:
+        return await send()
+    return await _ashared(_request_key(method, url, params, body, headers), send)
+
+
+async def _asend(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]],
+    data: Optional[Mapping[str, Any]],
+    content: Union[None, str, bytes],
+    headers: Optional[Mapping[str, str]],
+    policy: EndpointPolicy,
+    cache: Optional[ResponseCache],
+    key: str,
+) -> HttpResponse:
+    client = get_async_client()
+    timeout = httpx.Timeout(policy.read_timeout, connect=policy.connect_timeout)
+    attempts = _Attempts(method, url, policy, AsyncCircuitOpenError)
+    for attempt in attempts:
+        outcome: Union[HttpResponse, BaseException]
+        with attempts.trial():
+            await attempts.acquire_async()
+            try:
+                if method.upper() == "POST":
+                    if content is not None:
+                        outcome = await client.post(
+                            url, headers=headers, content=content, timeout=timeout
+                        )
+                    else:
+                        outcome = await client.post(
+                            url, headers=headers, data=data, timeout=timeout
+                        )
+                else:
+                    outcome = await client.get(
+                        url, params=params, headers=headers, timeout=timeout
+                    )
+            except httpx.TransportError as exc:
+                outcome = exc
+        response = attempts.settle(outcome)
+        if response is not None:
+            await _store(cache, key, url, response)
+            return response
+        await asyncio.sleep(attempts.backoff(attempt))
+    return await _fallback(cache, key, url, attempts.failure)
+
+
+async def afetch(
+    method: str,
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    data: Optional[Mapping[str, Any]] = None,
+    content: Union[None, str, bytes] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    bypass_cache: bool = False,
+) -> HttpResponse:
+    """Async GET/POST through the loop's shared client and the response cache.
+
+    ``data`` is sent as form fields, ``content`` as a raw (already encoded)
+    body. Transport errors that survive the retries propagate as
+    ``httpx.RequestError`` (:class:`AsyncCircuitOpenError` while the host's
+    breaker is open, :class:`AsyncCassetteMissError` for unrecorded requests
+    in replay mode).
+    """
+
+    body = data if data is not None else content
+    cassette = active_cassette()
+    if cassette is not None and cassette.replaying:
+        try:
+            return await cassette.areplay(method, url, params, body)
+        except CassetteMissError as exc:
+            raise AsyncCassetteMissError(exc.method, exc.url) from None
+    started = time.perf_counter()
+    response = await _afetch(
+        method,
+        url,
+        params=params,
+        data=data,
+        content=content,
+        headers=headers,
+        bypass_cache=bypass_cache,
+    )
+    if cassette is not None:
+        cassette.record(
+            method, url, params, body, response, time.perf_counter() - started
+        )
+    return response
+
+
+def _chunked(content: bytes) -> Iterator[bytes]:
+    for start in range(0, len(content), STREAM_CHUNK_SIZE):
+        yield content[start : start + STREAM_CHUNK_SIZE]
+
+
+async def astream(
+    method: str,
+    url: str,
+    *,
+    params: Optional[Mapping[str, Any]] = None,
+    data: Optional[Mapping[str, Any]] = None,
+    content: Union[None, str, bytes] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    bypass_cache: bool = False,
+) -> AsyncIterator[bytes]:
+    """Async GET/POST whose body is yielded in chunks as it is received.
+
+    Takes the same arguments as :func:`afetch` and goes through the same
+    cassette, cache, rate limit, retry and breaker handling; cached, stale
+    and replayed bodies are yielded in :data:`STREAM_CHUNK_SIZE` pieces.
+    The body is only kept whole when it has to be cached or recorded, and
+    streams are not shared between identical requests. Endpoints with a
+    cache TTL (confirmeph2 has one in :data:`~asteroidpy.httpcache.DEFAULT_TTLS`)
+    are therefore still buffered in full: parsing overlaps the download, but
+    peak memory only drops with the response cache disabled or the
+    endpoint's TTL set to 0 (see :func:`configure_response_cache`). Attempts are retried
+    until the first chunk has been yielded; a transport error after that
+    propagates as ``httpx.RequestError``, as do those that survive the
+    retries.
+    """
+
+    body = data if data is not None else content
+    cassette = active_cassette()
+    if cassette is not None and cassette.replaying:
+        try:
+            replayed = await cassette.areplay(method, url, params, body)
+        except CassetteMissError as exc:
+            raise AsyncCassetteMissError(exc.method, exc.url) from None
+        for chunk in _chunked(replayed.content):
+            yield chunk
+        return
+    cache, key, hit = await _cached(method, url, params, body, bypass_cache)
+    if hit is not None:
+        for chunk in _chunked(hit.content):
+            yield chunk
+        return
+
+    client = get_async_client()
+    policy = endpoint_policy(url)
+    timeout = httpx.Timeout(policy.read_timeout, connect=policy.connect_timeout)
+    keep = cache is not None or cassette is not None
+    attempts = _Attempts(method, url, policy, AsyncCircuitOpenError)
+    started = time.perf_counter()
+    for attempt in attempts:
+        outcome: Union[HttpResponse, BaseException]
+        received: List[bytes] = []
+        streaming = False
+        with attempts.trial():
+            await attempts.acquire_async()
+            try:
+                async with client.stream(
+                    method.upper(),
+                    url,
+                    params=params,
+                    data=data,
+                    content=content,
+                    headers=headers,
+                    timeout=timeout,
+                ) as response:
+                    if response.status_code in RETRY_STATUSES:
+                        await response.aread()
+                        outcome = response
+                    else:
+                        attempts.settle(response)
+                        streaming = True
+                        async for chunk in response.aiter_bytes():
+                            if keep:
+                                received.append(chunk)
+                            yield chunk
+                        whole = CachedResponse(
+                            response.status_code,
+                            b"".join(received),
+                            dict(response.headers),
+                            time.time(),
+                        )
+                        await _store(cache, key, url, whole)
+                        if cassette is not None:
+                            cassette.record(
+                                method,
+                                url,
+                                params,
+                                body,
+                                whole,
+                                time.perf_counter() - started,
+                            )
+                        return
+            except httpx.TransportError as exc:
+                if streaming:
+                    raise
+                outcome = exc
+        attempts.settle(outcome)
+        await asyncio.sleep(attempts.backoff(attempt))
+    fallback = await _fallback(cache, key, url, attempts.failure)
+    for chunk in _chunked(fallback.content):
+        yield chunk
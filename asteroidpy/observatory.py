@@ -0,0 +1,144 @@
+"""Immutable observatory context parsed once from the ``[Observatory]`` section."""
+
+from __future__ import annotations
+
+import logging
+import os
+from configparser import ConfigParser
+from typing import Any, Optional, Tuple
+
+from astropy import units as u
+from astropy.coordinates import EarthLocation
+
+from asteroidpy.horizon import HorizonProfile
+
+logger = logging.getLogger(__name__)
+
+
+class Observatory:
+    """Observing site: coordinates, ``EarthLocation``, MPC code and virtual horizon.
+
+    Build it once with :meth:`from_config` and hand it to the
+    :mod:`asteroidpy.scheduling` functions in place of the ``ConfigParser``;
+    they then neither reload the INI file nor re-parse its values. Instances
+    are immutable, so one context can be shared freely between calls.
+
+    Attributes
+    ----------
+    name : str
+        Observatory name (``obs_name``).
+    latitude, longitude : float
+        Geodetic coordinates in degrees.
+    height : float
+        Altitude above sea level in metres.
+    mpc_code : str
+        MPC observatory code (may be empty).
+    location : EarthLocation
+        Astropy location built from the coordinates above.
+    horizon : Tuple[float, float, float, float]
+        Virtual horizon minima in degrees for the north, east, south and west
+        sectors.
+    horizon_profile : HorizonProfile
+        Azimuth lookup used for visibility: the ``horizon_file`` profile when
+        one is configured, otherwise the four sectors above.
+    """
+
+    __slots__ = (
+        "name",
+        "latitude",
+        "longitude",
+        "height",
+        "mpc_code",
+        "location",
+        "horizon",
+        "horizon_profile",
+    )
+
+    name: str
+    latitude: float
+    longitude: float
+    height: float
+    mpc_code: str
+    location: EarthLocation
+    horizon: Tuple[float, float, float, float]
+    horizon_profile: HorizonProfile
+
+    def __init__(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        height: float = 0.0,
+        name: str = "",
+        mpc_code: str = "",
+        horizon: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0),
+        horizon_profile: Optional[HorizonProfile] = None,
+    ) -> None:
+        init = object.__setattr__
+        init(self, "name", str(name))
+        init(self, "latitude", float(latitude))
+        init(self, "longitude", float(longitude))
+        init(self, "height", float(height))
+        init(self, "mpc_code", str(mpc_code))
+        init(self, "horizon", tuple(float(value) for value in horizon))
+        if horizon_profile is None:
+            horizon_profile = HorizonProfile.from_sectors(*self.horizon)
+        init(self, "horizon_profile", horizon_profile)
+        init(
+            self,
+            "location",
+            EarthLocation.from_geodetic(
+                lon=self.longitude * u.deg,
+                lat=self.latitude * u.deg,
+                height=self.height * u.m,
+            ),
+        )
+
+    @classmethod
+    def from_config(cls, config: ConfigParser) -> Observatory:
+        """Parse the ``[Observatory]`` section of an already loaded ``config``.
+
+        Raises ``KeyError`` when options are missing and ``ValueError`` when
+        numeric options do not parse. An unreadable or empty ``horizon_file``
+        is logged and replaced by the four-sector horizon.
+        """
+
+        obs = config["Observatory"]
+        return cls(
+            name=obs["obs_name"],
+            latitude=float(obs["latitude"]),
+            longitude=float(obs["longitude"]),
+            height=float(obs["altitude"]),
+            mpc_code=obs["mpc_code"],
+            horizon=(
+                float(obs["nord_altitude"]),
+                float(obs["east_altitude"]),
+                float(obs["south_altitude"]),
+                float(obs["west_altitude"]),
+            ),
+            horizon_profile=_horizon_profile_from_file(obs.get("horizon_file", "")),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, latitude={self.latitude!r}, "
+            f"longitude={self.longitude!r}, height={self.height!r}, "
+            f"mpc_code={self.mpc_code!r}, horizon={self.horizon!r})"
+        )
+
+
+def _horizon_profile_from_file(path: str) -> Optional[HorizonProfile]:
+    path = path.strip()
+    if not path:
+        return None
+    try:
+        return HorizonProfile.from_file(os.path.expanduser(path))
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring horizon file %s: %s", path, exc)
+        return None
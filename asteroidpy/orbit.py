@@ -0,0 +1,381 @@
+"""Two-body ephemerides from osculating orbital elements.
+
+A local alternative to the MPC Minor Planet Ephemeris Service for
+:func:`asteroidpy.scheduling.object_ephemeris`: elements come from an
+MPCORB-format file (:func:`read_mpcorb`) or from one MPC orbit query
+(:func:`elements_from_mpc`), Kepler's equation is solved with NumPy for all
+epochs at once and the geometry (light time, the observer's topocentric
+offset, the Earth from ERFA's ``epv00``) yields the columns of the MPC table.
+
+Perturbations are ignored: within 30 days of the osculation epoch the
+positions of (1) Ceres agree with JPL Horizons to better than 0.3″ (checked by
+``tests/test_orbit.py``); the error grows with the distance from the epoch and
+for close approaches to planets.
+Altitudes use :func:`asteroidpy.fastaltaz.approx_altaz`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+import erfa
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import EarthLocation
+from astropy.table import QTable
+from astropy.time import Time
+
+from asteroidpy.fastaltaz import approx_altaz
+
+#: Gaussian gravitational constant (rad/day, AU and solar masses).
+GAUSS_K = 0.01720209895
+#: IAU 1976 obliquity of the ecliptic at J2000, the plane of MPCORB elements.
+OBLIQUITY_J2000_DEG = 23.4392911
+#: Speed of light in AU/day.
+SPEED_OF_LIGHT_AU_DAY = 173.1446326846693
+
+# Interval used for the finite-difference sky motion.
+_MOTION_STEP_DAYS = 60.0 / 86400.0
+_KEPLER_TOLERANCE = 1e-12
+_KEPLER_MAX_ITER = 50
+
+
+class OrbitalElements(NamedTuple):
+    """Heliocentric osculating elements, J2000 ecliptic and equinox.
+
+    Angles are in degrees, ``epoch`` is a Julian date (TT), ``semimajor_axis``
+    in AU and ``mean_motion`` in degrees per day; ``h`` and ``g`` are the
+    H, G magnitude parameters (``h`` NaN when unknown).
+    """
+
+    designation: str
+    epoch: float
+    mean_anomaly: float
+    arg_perihelion: float
+    node: float
+    inclination: float
+    eccentricity: float
+    semimajor_axis: float
+    mean_motion: float
+    h: float = math.nan
+    g: float = 0.15
+
+
+# Packed MPC dates: century letter, two-digit year, then month and day as
+# 1-9 followed by A-V for 10-31.
+_PACKED_CENTURY = {"I": 1800, "J": 1900, "K": 2000}
+_PACKED_DIGITS = "123456789ABCDEFGHIJKLMNOPQRSTUV"
+
+
+def unpack_epoch(packed: str) -> float:
+    """Julian date (TT, 0h) of a packed MPC epoch such as ``K2555``."""
+
+    packed = packed.strip()
+    if len(packed) != 5 or packed[0] not in _PACKED_CENTURY:
+        raise ValueError(f"invalid packed epoch: {packed!r}")
+    year = _PACKED_CENTURY[packed[0]] + int(packed[1:3])
+    month = _PACKED_DIGITS.index(packed[3]) + 1
+    day = _PACKED_DIGITS.index(packed[4]) + 1
+    jd1, jd2 = erfa.cal2jd(year, month, day)
+    return float(jd1 + jd2)
+
+
+def _float_field(text: str, default: float = math.nan) -> float:
+    text = text.strip()
+    return float(text) if text else default
+
+
+def parse_mpcorb_line(line: str) -> OrbitalElements:
+    """Elements from one fixed-width MPCORB record.
+
+    The readable designation (columns 167–194, e.g. ``(1) Ceres``) names the
+    orbit when present, the packed one (columns 1–7) otherwise. Raises
+    ``ValueError`` for lines that are not element records.
+    """
+
+    if len(line) < 103:
+        raise ValueError("MPCORB record too short")
+    readable = line[166:194].strip()
+    return OrbitalElements(
+        designation=readable or line[0:7].strip(),
+        epoch=unpack_epoch(line[20:25]),
+        mean_anomaly=float(line[26:35]),
+        arg_perihelion=float(line[37:46]),
+        node=float(line[48:57]),
+        inclination=float(line[59:68]),
+        eccentricity=float(line[70:79]),
+        mean_motion=float(line[80:91]),
+        semimajor_axis=float(line[92:103]),
+        h=_float_field(line[8:13]),
+        g=_float_field(line[14:19], 0.15),
+    )
+
+
+def read_mpcorb(
+    source: Union[str, "os.PathLike[str]", Iterable[str]],
+) -> List[OrbitalElements]:
+    """Every element record of an MPCORB file (``.gz`` allowed) or of lines.
+
+    The header before the dashed separator and lines that do not parse are
+    skipped.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        opener: Any = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="ascii", errors="replace") as handle:
+            return read_mpcorb(list(handle))
+    orbits: List[OrbitalElements] = []
+    for line in source:
+        if line.startswith("-----"):
+            orbits.clear()  # everything above was the header
+            continue
+        try:
+            orbits.append(parse_mpcorb_line(line.rstrip("\n")))
+        except ValueError:
+            continue
+    return orbits
+
+
+def elements_from_mpc(record: Mapping[str, Any]) -> OrbitalElements:
+    """Elements from one result of ``astroquery``'s ``MPC.query_object``."""
+
+    def value(key: str, default: float = math.nan) -> float:
+        raw = record.get(key)
+        return default if raw in (None, "") else float(raw)
+
+    name = record.get("name") or record.get("designation") or ""
+    number = record.get("number")
+    designation = f"({number}) {name}".strip() if number else str(name)
+    return OrbitalElements(
+        designation=designation,
+        epoch=value("epoch_jd"),
+        mean_anomaly=value("mean_anomaly"),
+        arg_perihelion=value("argument_of_perihelion"),
+        node=value("ascending_node"),
+        inclination=value("inclination"),
+        eccentricity=value("eccentricity"),
+        semimajor_axis=value("semimajor_axis"),
+        mean_motion=value("mean_daily_motion"),
+        h=value("absolute_magnitude"),
+        g=value("phase_slope", 0.15),
+    )
+
+
+def designation_keys(designation: str) -> List[str]:
+    """Lookup keys for a designation: ``(433) Eros`` gives ``433``, ``EROS``…"""
+
+    text = " ".join(designation.upper().split())
+    keys = [text]
+    match = re.fullmatch(r"\((\d+)\)\s*(.*)", text)
+    if match:
+        keys.append(match.group(1))
+        if match.group(2):
+            keys.append(match.group(2))
+    return keys
+
+
+class ElementCatalog:
+    """Orbits by designation, name or number, shared by the process."""
+
+    def __init__(self) -> None:
+        self._orbits: Dict[str, OrbitalElements] = {}
+        self._lock = threading.Lock()
+
+    def add(self, orbits: Iterable[OrbitalElements]) -> int:
+        """Register ``orbits`` under all their :func:`designation_keys`."""
+
+        count = 0
+        with self._lock:
+            for elements in orbits:
+                for key in designation_keys(elements.designation):
+                    self._orbits[key] = elements
+                count += 1
+        return count
+
+    def get(self, name: str) -> Optional[OrbitalElements]:
+        with self._lock:
+            for key in designation_keys(name):
+                if key in self._orbits:
+                    return self._orbits[key]
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._orbits.clear()
+
+
+def solve_kepler(mean_anomaly: Any, eccentricity: float) -> np.ndarray:
+    """Eccentric anomalies (radians) for mean anomalies (radians), ``e < 1``.
+
+    Newton iteration on all values at once, started from ``M`` (or ``π`` for
+    ``e > 0.8``) and stopped when every correction is below 1e-12 rad.
+    """
+
+    if not 0.0 <= eccentricity < 1.0:
+        raise ValueError("only elliptic orbits (0 <= e < 1) are supported")
+    m = np.mod(np.asarray(mean_anomaly, dtype=float), 2.0 * np.pi)
+    e_anomaly = np.full_like(m, np.pi) if eccentricity > 0.8 else m.copy()
+    for _ in range(_KEPLER_MAX_ITER):
+        step = (e_anomaly - eccentricity * np.sin(e_anomaly) - m) / (
+            1.0 - eccentricity * np.cos(e_anomaly)
+        )
+        e_anomaly -= step
+        if np.all(np.abs(step) < _KEPLER_TOLERANCE):
+            break
+    return np.asarray(e_anomaly)
+
+
+def heliocentric_positions(elements: OrbitalElements, jd_tt: Any) -> np.ndarray:
+    """Heliocentric J2000 equatorial positions (AU), shape ``(N, 3)``."""
+
+    mean_motion = elements.mean_motion
+    if not mean_motion > 0.0:
+        mean_motion = math.degrees(GAUSS_K / elements.semimajor_axis**1.5)
+    jd = np.atleast_1d(np.asarray(jd_tt, dtype=float))
+    mean_anomaly = np.radians(
+        elements.mean_anomaly + mean_motion * (jd - elements.epoch)
+    )
+    e = elements.eccentricity
+    a = elements.semimajor_axis
+    e_anomaly = solve_kepler(mean_anomaly, e)
+    in_plane = np.stack(
+        [
+            a * (np.cos(e_anomaly) - e),
+            a * math.sqrt(1.0 - e * e) * np.sin(e_anomaly),
+        ],
+        axis=-1,
+    )
+
+    w = math.radians(elements.arg_perihelion)
+    node = math.radians(elements.node)
+    inc = math.radians(elements.inclination)
+    eps = math.radians(OBLIQUITY_J2000_DEG)
+    # Orbital plane -> ecliptic (Rz(node) Rx(inc) Rz(w)), then -> equator.
+    cw, sw = math.cos(w), math.sin(w)
+    cn, sn = math.cos(node), math.sin(node)
+    ci, si = math.cos(inc), math.sin(inc)
+    ecliptic = np.array(
+        [
+            [cn * cw - sn * sw * ci, -cn * sw - sn * cw * ci],
+            [sn * cw + cn * sw * ci, -sn * sw + cn * cw * ci],
+            [sw * si, cw * si],
+        ]
+    )
+    equatorial = np.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.0, math.cos(eps), -math.sin(eps)],
+            [0.0, math.sin(eps), math.cos(eps)],
+        ]
+    )
+    return np.asarray(in_plane @ (equatorial @ ecliptic).T)
+
+
+def _hg_magnitude(
+    h: float, g: float, r: np.ndarray, delta: np.ndarray, phase: np.ndarray
+) -> np.ndarray:
+    tan_half = np.tan(phase / 2.0)
+    phi1 = np.exp(-3.33 * tan_half**0.63)
+    phi2 = np.exp(-1.87 * tan_half**1.22)
+    return np.asarray(
+        h + 5.0 * np.log10(r * delta) - 2.5 * np.log10((1.0 - g) * phi1 + g * phi2)
+    )
+
+
+def _observer_geometry(
+    elements: OrbitalElements, location: EarthLocation, times: Time
+) -> Dict[str, np.ndarray]:
+    """Topocentric astrometric direction, distances and angles at ``times``."""
+
+    tdb = times.tdb
+    earth_helio = erfa.epv00(tdb.jd1, tdb.jd2)[0]["p"]
+    site, _ = location.get_gcrs_posvel(times)
+    observer = earth_helio + site.xyz.to_value(u.AU).T
+    jd_tt = times.tt.jd
+    light_time = np.zeros(len(times))
+    for _ in range(3):
+        body = heliocentric_positions(elements, jd_tt - light_time)
+        topocentric = body - observer
+        delta = np.linalg.norm(topocentric, axis=1)
+        light_time = delta / SPEED_OF_LIGHT_AU_DAY
+    r = np.linalg.norm(body, axis=1)
+    sun_distance = np.linalg.norm(observer, axis=1)
+    elongation = np.arccos(
+        np.clip(-np.sum(observer * topocentric, axis=1) / (sun_distance * delta), -1, 1)
+    )
+    phase = np.arccos(np.clip(np.sum(body * topocentric, axis=1) / (r * delta), -1, 1))
+    return {
+        "ra": np.mod(np.arctan2(topocentric[:, 1], topocentric[:, 0]), 2.0 * np.pi),
+        "dec": np.arcsin(topocentric[:, 2] / delta),
+        "r": r,
+        "delta": delta,
+        "elongation": elongation,
+        "phase": phase,
+    }
+
+
+def ephemeris(
+    elements: OrbitalElements, location: EarthLocation, times: Time
+) -> QTable:
+    """Ephemeris of ``elements`` seen from ``location`` at ``times``.
+
+    Returns the columns of the MPC service as used by
+    :func:`asteroidpy.scheduling.object_ephemeris`: ``Date``, astrometric J2000
+    ``RA``/``Dec`` (deg), ``Elongation`` (deg), ``V`` (mag, H-G system),
+    ``Altitude`` (deg), ``Proper motion`` ("/h) and ``Direction`` (deg, from
+    North through East). Positions at ``times`` and one minute later are
+    computed in a single vectorized pass; the motion is their difference.
+    """
+
+    jd = np.atleast_1d(times.utc.jd)
+    times = Time(jd, format="jd", scale="utc")
+    count = len(jd)
+    both = _observer_geometry(
+        elements,
+        location,
+        Time(np.concatenate([jd, jd + _MOTION_STEP_DAYS]), format="jd", scale="utc"),
+    )
+    ra, ra_next = both["ra"][:count], both["ra"][count:]
+    dec, dec_next = both["dec"][:count], both["dec"][count:]
+    d_ra = (np.mod(ra_next - ra + np.pi, 2.0 * np.pi) - np.pi) * np.cos(dec)
+    d_dec = dec_next - dec
+    hours = _MOTION_STEP_DAYS * 24.0
+    motion = np.degrees(np.hypot(d_ra, d_dec)) * 3600.0 / hours
+    direction = np.mod(np.degrees(np.arctan2(d_ra, d_dec)), 360.0)
+
+    ra_deg = np.degrees(ra)
+    dec_deg = np.degrees(dec)
+    _, altitude = approx_altaz(
+        ra_deg,
+        dec_deg,
+        location.lat.to_value(u.deg),
+        location.lon.to_value(u.deg),
+        times.jd,
+    )
+    magnitude = _hg_magnitude(
+        elements.h,
+        elements.g,
+        both["r"][:count],
+        both["delta"][:count],
+        both["phase"][:count],
+    )
+    return QTable(
+        {
+            "Date": times,
+            "RA": ra_deg * u.deg,
+            "Dec": dec_deg * u.deg,
+            "Elongation": np.degrees(both["elongation"][:count]) * u.deg,
+            "V": magnitude * u.mag,
+            "Altitude": altitude * u.deg,
+            "Proper motion": motion * u.arcsec / u.hour,
+            "Direction": direction * u.deg,
+        },
+        meta={"name": elements.designation},
+    )
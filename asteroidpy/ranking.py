@@ -0,0 +1,84 @@
+"""Follow-up priority for NEOcp candidates.
+
+:mod:`asteroidpy.scheduling` collects one :class:`NeocpFeatures` column set for
+the candidates that pass the NEOcp filters and hands it to a scorer: any
+callable mapping the features to one priority per candidate (higher means
+observe first), evaluated on whole NumPy columns. :func:`top_k_indices` then
+keeps the best ``k`` with a bounded heap, so only those rows are formatted.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+
+class NeocpFeatures(NamedTuple):
+    """Per-candidate inputs to a scorer, as equally long ``float64`` columns.
+
+    ``alt`` is the current altitude and ``peak_alt`` the highest altitude of
+    the rest of the confirmeph2 ephemeris (both degrees); ``motion`` is the
+    sky motion in "/min; ``not_seen`` and ``arc`` are in days.
+    """
+
+    score: np.ndarray
+    v: np.ndarray
+    alt: np.ndarray
+    peak_alt: np.ndarray
+    motion: np.ndarray
+    not_seen: np.ndarray
+    arc: np.ndarray
+
+
+#: A scoring function: features in, one priority per candidate out.
+NeocpScorer = Callable[[NeocpFeatures], np.ndarray]
+
+# Magnitudes scaled to 0 at LIMIT and 1 at LIMIT - RANGE (and brighter).
+_V_LIMIT = 21.5
+_V_RANGE = 4.0
+# Motion ("/min), time unseen and arc (days) at which their terms saturate.
+_FAST_MOTION = 5.0
+_STALE_DAYS = 2.0
+_SHORT_ARC_DAYS = 1.0
+
+
+def default_neocp_priority(features: NeocpFeatures) -> np.ndarray:
+    """Weighted sum favouring likely, easy and urgent NEOcp follow-up targets.
+
+    The NEOcp ``Score`` (0–100) counts most; brightness, current and peak
+    altitude add for targets that are easy to reach now or later tonight;
+    fast motion, a long time since the last observation and a short arc add
+    for objects at risk of being lost. Every term lies in ``[0, 1]`` before
+    weighting; missing values contribute nothing.
+    """
+
+    def unit(values: np.ndarray) -> np.ndarray:
+        return np.asarray(np.nan_to_num(np.clip(values, 0.0, 1.0), nan=0.0))
+
+    return np.asarray(
+        1.0 * unit(features.score / 100.0)
+        + 0.5 * unit((_V_LIMIT - features.v) / _V_RANGE)
+        + 0.3 * unit(features.alt / 90.0)
+        + 0.2 * unit(features.peak_alt / 90.0)
+        + 0.3 * unit(features.motion / _FAST_MOTION)
+        + 0.4 * unit(features.not_seen / _STALE_DAYS)
+        + 0.3 * unit(1.0 - features.arc / _SHORT_ARC_DAYS),
+        dtype=float,
+    )
+
+
+def top_k_indices(priority: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest priorities, best first.
+
+    Selection keeps a heap of at most ``k`` entries, so it costs
+    O(n log k); ties keep their input order and NaN ranks last.
+    """
+
+    values = np.asarray(priority, dtype=float)
+    if k <= 0 or values.size == 0:
+        return np.empty(0, dtype=np.intp)
+    keys = np.where(np.isnan(values), -np.inf, values).tolist()
+    best = heapq.nlargest(k, range(len(keys)), key=lambda i: (keys[i], -i))
+    return np.asarray(best, dtype=np.intp)
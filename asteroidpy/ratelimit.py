@@ -0,0 +1,141 @@
+"""Per-host token buckets with priority lanes.
+
+Every request that :mod:`asteroidpy.network` sends to a rate-limited host
+first takes a token from that host's :class:`HostRateLimiter`. Tokens refill
+at ``rate`` per second up to ``burst``; when callers have to wait they are
+served strictly by :class:`Priority` (interactive before background) and in
+arrival order within a lane, whether they wait in a thread or a coroutine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Request lanes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class RateLimit(NamedTuple):
+    """Sustained requests per second and the burst allowed on top."""
+
+    rate: float
+    burst: int
+
+
+#: Limits by host name suffix (the longest matching suffix wins); other hosts
+#: are not limited. Both MPC hosts throttle by client, so they share a budget.
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    "minorplanetcenter.net": RateLimit(rate=2.0, burst=4),
+    "7timer.info": RateLimit(rate=1.0, burst=2),
+}
+
+# Upper bound on one sleep while waiting, so a waiter notices being served.
+_MAX_POLL_SEC = 0.05
+
+
+def limit_for(
+    host: str, limits: Optional[Mapping[str, RateLimit]] = None
+) -> Tuple[str, Optional[RateLimit]]:
+    """Return ``(suffix, limit)`` for ``host`` (``("", None)`` when unlimited)."""
+
+    table = DEFAULT_RATE_LIMITS if limits is None else limits
+    host = host.split(":", 1)[0].lower()
+    best = ""
+    for suffix in table:
+        if (host == suffix or host.endswith("." + suffix)) and len(suffix) > len(best):
+            best = suffix
+    return (best, table[best]) if best else ("", None)
+
+
+class _Waiter:
+    __slots__ = ("granted",)
+
+    def __init__(self) -> None:
+        self.granted = False
+
+
+class HostRateLimiter:
+    """Token bucket shared by threads and event loops, with priority lanes."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _dispatch(self) -> float:
+        """Hand tokens to queued waiters; return seconds until the next token."""
+
+        with self._lock:
+            self._refill(time.monotonic())
+            while self._queue and self._tokens >= 1.0:
+                _, _, waiter = heapq.heappop(self._queue)
+                waiter.granted = True
+                self._tokens -= 1.0
+            if self.rate <= 0:
+                return _MAX_POLL_SEC
+            return max(0.0, (1.0 - self._tokens) / self.rate)
+
+    def _enqueue(self, priority: Priority) -> _Waiter:
+        waiter = _Waiter()
+        with self._lock:
+            heapq.heappush(self._queue, (int(priority), next(self._counter), waiter))
+        return waiter
+
+    def _withdraw(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                # Cancelled after being served: give the token back.
+                self._tokens = min(float(self.burst), self._tokens + 1.0)
+                return
+            self._queue = [entry for entry in self._queue if entry[2] is not waiter]
+            heapq.heapify(self._queue)
+
+    def acquire(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """Block the calling thread until a token is granted; return the wait."""
+
+        start = time.monotonic()
+        waiter = self._enqueue(priority)
+        try:
+            while True:
+                delay = self._dispatch()
+                if waiter.granted:
+                    return time.monotonic() - start
+                time.sleep(min(max(delay, 0.001), _MAX_POLL_SEC))
+        except BaseException:
+            self._withdraw(waiter)
+            raise
+
+    async def acquire_async(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """Coroutine version of :meth:`acquire`; other tasks run while waiting."""
+
+        start = time.monotonic()
+        waiter = self._enqueue(priority)
+        try:
+            while True:
+                delay = self._dispatch()
+                if waiter.granted:
+                    return time.monotonic() - start
+                await asyncio.sleep(min(max(delay, 0.001), _MAX_POLL_SEC))
+        except asyncio.CancelledError:
+            self._withdraw(waiter)
+            raise
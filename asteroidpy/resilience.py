@@ -0,0 +1,168 @@
+"""Per-endpoint timeouts, retries with backoff and circuit breakers.
+
+:mod:`asteroidpy.network` looks up an :class:`EndpointPolicy` for every
+request URL (longest matching prefix of :data:`DEFAULT_POLICIES`, like the
+response cache TTLs) and keeps one :class:`CircuitBreaker` per host. After
+``failure_threshold`` consecutive failed requests (each counted once, after
+its retries are used up) the breaker opens and requests to that host fail
+immediately with :class:`CircuitOpenError` (or are answered
+from an expired cache entry) until ``reset_timeout`` has passed; one trial
+request then decides whether it closes again.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Dict, FrozenSet, Mapping, NamedTuple, Optional
+
+
+class EndpointPolicy(NamedTuple):
+    """Timeouts, retry and breaker settings for one endpoint."""
+
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    #: Extra attempts after the first one, for methods in ``retry_methods``.
+    retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    #: Methods safe to repeat; MPC query forms are read-only POSTs.
+    retry_methods: FrozenSet[str] = frozenset({"GET"})
+    #: Consecutive failed requests (not attempts) that open the breaker.
+    failure_threshold: int = 3
+    reset_timeout: float = 60.0
+
+
+_MPC_QUERY_METHODS = frozenset({"GET", "POST"})
+
+#: Policies by URL prefix; the longest matching prefix wins and other URLs get
+#: ``EndpointPolicy()``.
+DEFAULT_POLICIES: Dict[str, EndpointPolicy] = {
+    "https://www.minorplanetcenter.net/Extended_Files/neocp.json": EndpointPolicy(
+        read_timeout=15.0
+    ),
+    "https://cgi.minorplanetcenter.net/cgi-bin/confirmeph2.cgi": EndpointPolicy(
+        read_timeout=20.0, retry_methods=_MPC_QUERY_METHODS
+    ),
+    "https://www.minorplanetcenter.net/whatsup/index": EndpointPolicy(
+        read_timeout=30.0, retry_methods=_MPC_QUERY_METHODS
+    ),
+    "https://www.7timer.info/": EndpointPolicy(read_timeout=20.0),
+}
+
+#: HTTP statuses treated like transport failures: retried and counted by the
+#: breaker.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"{host} is failing; not retrying for {retry_in:.0f} s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def policy_for(
+    url: str, policies: Optional[Mapping[str, EndpointPolicy]] = None
+) -> EndpointPolicy:
+    """Return the policy of the longest prefix of ``url`` in ``policies``."""
+
+    table = DEFAULT_POLICIES if policies is None else policies
+    best = ""
+    for prefix in table:
+        if url.startswith(prefix) and len(prefix) > len(best):
+            best = prefix
+    return table[best] if best else EndpointPolicy()
+
+
+def backoff_delay(policy: EndpointPolicy, attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (0-based).
+
+    Exponential in ``attempt``, capped at ``backoff_max``, with "equal
+    jitter": a random value between half and all of the capped delay.
+    """
+
+    capped = min(policy.backoff_max, policy.backoff_base * 2.0**attempt)
+    return capped / 2 + random.uniform(0, capped / 2)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with closed, open and half-open states."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half-open"``."""
+
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    @property
+    def probing(self) -> bool:
+        """Whether a half-open trial request is in flight."""
+
+        with self._lock:
+            return self._trial_running
+
+    def retry_in(self) -> float:
+        """Seconds until the next trial request is allowed (0 when closed)."""
+
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now.
+
+        When half-open only one caller is let through until it reports back.
+        """
+
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == "closed":
+                return True
+            if state == "open" or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Let another caller through after a trial ended without an outcome.
+
+        For attempts that were cancelled or interrupted before the host
+        answered; the breaker keeps its state and failure count.
+        """
+
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
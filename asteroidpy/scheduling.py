@@ -1,24 +1,82 @@
 import asyncio
 import datetime
+import json
+import logging
+import os
 import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from configparser import ConfigParser
-from typing import Any, Dict, List, Literal, Tuple, Union, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import httpx
-import requests
+import numpy as np
 from astroplan import Observer
 from astropy import units as u
-from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+from astropy.coordinates import (
+    AltAz,
+    Angle,
+    EarthLocation,
+    SkyCoord,
+    UnitSphericalRepresentation,
+)
 from astropy.table import QTable
 from astropy.time import Time
 from astropy.units import Quantity
 from astroquery.mpc import MPC
-from bs4 import BeautifulSoup
 
-from asteroidpy import configuration
+from asteroidpy import configuration, network
+from asteroidpy.fastaltaz import FAST_ALTAZ_MAX_ERROR_DEG, approx_altaz
+from asteroidpy.horizon import HorizonProfile
+from asteroidpy.mpcparse import (
+    EPHEMERIS_DTYPE,
+    NeocpEphemerisScanner,
+    parse_authenticity_token,
+    parse_whatsup_results,
+)
+from asteroidpy.observatory import Observatory
+from asteroidpy.orbit import (
+    ElementCatalog,
+    OrbitalElements,
+    elements_from_mpc,
+)
+from asteroidpy.orbit import ephemeris as orbit_ephemeris
+from asteroidpy.orbit import read_mpcorb
+from asteroidpy.ranking import (
+    NeocpFeatures,
+    NeocpScorer,
+    default_neocp_priority,
+    top_k_indices,
+)
+from asteroidpy.ratelimit import Priority
+from asteroidpy.resilience import CircuitOpenError
+from asteroidpy.snapshots import NeocpSnapshotStore, default_snapshot_path
+from asteroidpy.tables import ColumnarTableBuilder
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
 
 SEVENTIMER_API_URL = "https://www.7timer.info/bin/api.pl"
-DEFAULT_REQUEST_TIMEOUT_SEC = 30.0
+DEFAULT_REQUEST_TIMEOUT_SEC = network.DEFAULT_REQUEST_TIMEOUT_SEC
 
 # MPC whats-up HTML table columns (minimum 8 cells per data row).
 MPC_COL_DESIGNATION = 0
@@ -44,48 +102,173 @@ _MPC_BROWSER_HEADERS = {
 }
 
 
-def _scrape_whatsup_authenticity_token() -> str:
+def _run_sync(coro: Coroutine[Any, Any, T], name: str, async_name: str) -> T:
+    """Run ``coro`` for the blocking function ``name`` with :func:`network.run`.
+
+    Raises RuntimeError instead when this thread already runs an event loop;
+    such callers must ``await`` ``async_name`` themselves.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return network.run(coro)
+    coro.close()
+    raise RuntimeError(
+        f"{name}() cannot be used while an asyncio event loop is running "
+        f"(e.g. inside async code or Jupyter). Use await {async_name}(...) instead."
+    )
+
+
+async def _scrape_whatsup_authenticity_token() -> str:
     """Return '' if scraping did not recover a Rails authenticity_token."""
 
     try:
-        r = requests.get(
+        r = await network.afetch(
+            "GET",
             MPC_WHATSUP_INDEX_URL,
             headers=_MPC_BROWSER_HEADERS,
-            timeout=DEFAULT_REQUEST_TIMEOUT_SEC,
+            bypass_cache=True,
         )
-    except requests.RequestException:
+    except httpx.RequestError:
         return ""
     if r.status_code != 200:
         return ""
-    soup = BeautifulSoup(r.content, "lxml")
-    inp = soup.find("input", attrs={"name": "authenticity_token"})
-    if inp and inp.get("value"):
-        return str(inp["value"])
-    html = r.text
-    m = re.search(
-        r'name=["\']authenticity_token["\'][^>]*value=["\']([^"\']+)["\']',
-        html,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1)
-    meta = re.search(
-        r'<meta\s+name=["\']csrf-token["\']\s+content=["\']([^"\']+)["\']',
-        html,
-        re.IGNORECASE,
-    )
-    if meta:
-        return meta.group(1)
-    return ""
+    return parse_authenticity_token(r.content)
+
+
+# Seconds a scraped What's Observable token is reused before the page is fetched again.
+MPC_WHATSUP_TOKEN_TTL_SEC = 1800.0
+
+# Statuses with which the MPC Rails app rejects a stale authenticity_token.
+_MPC_REJECTED_TOKEN_STATUSES = frozenset({403, 419, 422})
+
+
+class MpcSession:
+    """Reusable What's Observable form state: scraped token plus cookies.
+
+    The token is scraped once and reused for ``token_ttl`` seconds; requests
+    go through the shared async clients of :mod:`asteroidpy.network`, whose
+    common cookie jar keeps the Rails session cookie the token belongs to. A
+    POST rejected with 403, 419 or 422 drops the token, scrapes a new one and
+    is retried once. The blocking methods wrap the ``async_`` ones.
+
+    Parameters
+    ----------
+    token_ttl : float, optional
+        Seconds a scraped token stays valid (default ``MPC_WHATSUP_TOKEN_TTL_SEC``).
+    """
+
+    def __init__(self, token_ttl: float = MPC_WHATSUP_TOKEN_TTL_SEC) -> None:
+        self.token_ttl = token_ttl
+        self._token: Optional[str] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    async def async_authenticity_token(self, refresh: bool = False) -> Tuple[str, bool]:
+        """Return ``(token, used_fallback)``, scraping only when none is cached.
+
+        ``refresh=True`` scrapes even if a cached token has not expired. The
+        embedded fallback token is never cached. Concurrent scrapes in one
+        event loop share a single request.
+        """
+
+        with self._lock:
+            if not refresh and self._token and time.monotonic() < self._expires:
+                return self._token, False
+        scraped = await _scrape_whatsup_authenticity_token()
+        with self._lock:
+            if not scraped:
+                self._token = None
+                return _MPC_WHATSUP_AUTH_TOKEN_FALLBACK, True
+            self._token = scraped
+            self._expires = time.monotonic() + self.token_ttl
+            return scraped, False
+
+    def authenticity_token(self, refresh: bool = False) -> Tuple[str, bool]:
+        """Blocking wrapper around :meth:`async_authenticity_token`."""
+
+        return _run_sync(
+            self.async_authenticity_token(refresh),
+            "MpcSession.authenticity_token",
+            "MpcSession.async_authenticity_token",
+        )
+
+    def invalidate(self) -> None:
+        """Forget the cached token; the next request scrapes a new one."""
+
+        with self._lock:
+            self._token = None
+
+    async def async_post_form(
+        self, url: str, body: Dict[str, Any], bypass_cache: bool = False
+    ) -> network.HttpResponse:
+        """POST a What's Observable form, renewing a rejected token once.
+
+        Raises ``httpx.RequestError`` on transport errors; the status of the
+        (possibly retried) response is left for the caller to check.
+        """
+
+        r = await network.afetch(
+            "POST",
+            url,
+            data=body,
+            headers=_MPC_BROWSER_HEADERS,
+            bypass_cache=bypass_cache,
+        )
+        if r.status_code not in _MPC_REJECTED_TOKEN_STATUSES:
+            return r
+        token, used_fallback = await self.async_authenticity_token(refresh=True)
+        if used_fallback or token == body.get("authenticity_token"):
+            return r
+        logger.info("MPC rejected the form token; retrying with a fresh one")
+        return await network.afetch(
+            "POST",
+            url,
+            data=dict(body, authenticity_token=token),
+            headers=_MPC_BROWSER_HEADERS,
+            bypass_cache=True,
+        )
+
+    def post_form(
+        self, url: str, body: Dict[str, Any], bypass_cache: bool = False
+    ) -> network.HttpResponse:
+        """Blocking wrapper around :meth:`async_post_form`."""
+
+        return _run_sync(
+            self.async_post_form(url, body, bypass_cache),
+            "MpcSession.post_form",
+            "MpcSession.async_post_form",
+        )
+
+
+_mpc_session = MpcSession()
+
+
+def mpc_session() -> MpcSession:
+    """Return the process-wide :class:`MpcSession`."""
+
+    return _mpc_session
+
+
+async def async_resolve_whatsup_authenticity_token() -> Tuple[str, bool]:
+    """Return ``(authenticity_token, used_fallback)`` for MPC What's Observable POST.
+
+    Served from :func:`mpc_session`, so back-to-back queries reuse the token
+    scraped by the first one until it expires.
+    """
+
+    return await mpc_session().async_authenticity_token()
 
 
 def resolve_whatsup_authenticity_token() -> Tuple[str, bool]:
-    """Return ``(authenticity_token, used_fallback)`` for MPC What's Observable POST."""
+    """Blocking wrapper around :func:`async_resolve_whatsup_authenticity_token`."""
 
-    scraped = _scrape_whatsup_authenticity_token()
-    if scraped:
-        return scraped, False
-    return _MPC_WHATSUP_AUTH_TOKEN_FALLBACK, True
+    return _run_sync(
+        async_resolve_whatsup_authenticity_token(),
+        "resolve_whatsup_authenticity_token",
+        "async_resolve_whatsup_authenticity_token",
+    )
 
 
 # MPC observing-target calendar times, e.g. ``2026 5 24.559 (13:25 UT)``, optional ``UTC``.
@@ -141,6 +324,22 @@ NEOCP_EPHEM_VELOCITY_IDX = 12
 NEOCP_EPHEM_DIRECTION_IDX = 13
 NEOCP_EPHEM_MIN_LEN = NEOCP_EPHEM_DIRECTION_IDX + 1
 
+# confirmeph2 requests: designations per POST, concurrent POSTs, seconds per POST.
+NEOCP_EPHEM_CHUNK_SIZE = 20
+NEOCP_EPHEM_MAX_CONCURRENCY = 4
+NEOCP_EPHEM_CHUNK_TIMEOUT_SEC = 20.0
+
+NEOCP_JSON_URL = "https://www.minorplanetcenter.net/Extended_Files/neocp.json"
+# Seconds a confirmeph2 result is reused while its NEOCP_EPHEM_FIELDS are unchanged.
+NEOCP_EPHEM_MEMO_MAX_AGE_SEC = 1800.0
+
+# NEOcp watch mode: seconds between polls and the entry fields whose changes are reported.
+NEOCP_WATCH_INTERVAL_SEC = 300.0
+NEOCP_WATCH_FIELDS = ("Score", "NObs", "Arc")
+# Entry fields that change with a new orbit solution, and so with its confirmeph2 ephemeris;
+# fields such as Not_Seen_dys or Updated change on every regeneration of neocp.json.
+NEOCP_EPHEM_FIELDS = NEOCP_WATCH_FIELDS + ("R.A.", "Decl.", "V")
+
 cloudcover_dict = {
     1: "0%-6%",
     2: "6%-19%",
@@ -217,9 +416,28 @@ wind10m_speed_dict = {
 }
 
 
-def earth_location_from_config(config: ConfigParser) -> EarthLocation:
+#: Either a (re)loadable ``ConfigParser`` or an already parsed :class:`Observatory`.
+ObservatoryConfig = Union[ConfigParser, Observatory]
+
+
+def resolve_observatory(config: ObservatoryConfig) -> Observatory:
+    """Return ``config`` if it is already an :class:`Observatory`, else load and parse it.
+
+    Passing a ``ConfigParser`` reloads the INI file once; callers running many
+    scheduling functions in a row should resolve once and pass the result on.
+    """
+
+    if isinstance(config, Observatory):
+        return config
+    configuration.load_config(config)
+    return Observatory.from_config(config)
+
+
+def earth_location_from_config(config: ObservatoryConfig) -> EarthLocation:
     """Earth location from ``[Observatory]`` latitude, longitude, altitude (m)."""
 
+    if isinstance(config, Observatory):
+        return config.location
     return EarthLocation.from_geodetic(
         lon=float(config["Observatory"]["longitude"]) * u.deg,
         lat=float(config["Observatory"]["latitude"]) * u.deg,
@@ -227,10 +445,155 @@ def earth_location_from_config(config: ConfigParser) -> EarthLocation:
     )
 
 
+class CacheInfo(NamedTuple):
+    """Counters of one bounded LRU cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class AltAzCacheInfo(NamedTuple):
+    """Counters reported by :func:`altaz_cache_info`."""
+
+    frames: CacheInfo
+    transforms: CacheInfo
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping with hit/miss counters."""
+
+    __slots__ = ("maxsize", "hits", "misses", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+ALTAZ_FRAME_CACHE_SIZE = 128
+ALTAZ_TRANSFORM_CACHE_SIZE = 32
+
+_altaz_frame_cache = _LRUCache(ALTAZ_FRAME_CACHE_SIZE)
+_altaz_transform_cache = _LRUCache(ALTAZ_TRANSFORM_CACHE_SIZE)
+
+
+def _location_key(location: EarthLocation) -> Tuple[Any, ...]:
+    x, y, z = location.geocentric
+    return (
+        location.shape,
+        np.asarray(x.to_value(u.m)).tobytes(),
+        np.asarray(y.to_value(u.m)).tobytes(),
+        np.asarray(z.to_value(u.m)).tobytes(),
+    )
+
+
+def _time_key(time: Time) -> Tuple[Any, ...]:
+    return (
+        time.scale,
+        time.shape,
+        np.asarray(time.jd1).tobytes(),
+        np.asarray(time.jd2).tobytes(),
+    )
+
+
+def _coord_key(coord: SkyCoord) -> Optional[Tuple[Any, ...]]:
+    """Hashable ICRS direction of ``coord``; ``None`` when it is not cacheable."""
+
+    if not isinstance(coord, SkyCoord) or coord.frame.name != "icrs":
+        return None
+    if not isinstance(coord.data, UnitSphericalRepresentation):
+        return None
+    return (
+        coord.shape,
+        np.asarray(coord.ra.to_value(u.deg)).tobytes(),
+        np.asarray(coord.dec.to_value(u.deg)).tobytes(),
+    )
+
+
+def altaz_frame(location: EarthLocation, obstime: Time) -> AltAz:
+    """Return a (cached) ``AltAz`` frame for ``location`` and ``obstime``.
+
+    Frames are keyed on the geocentric position of ``location`` and the exact
+    Julian dates of ``obstime``, so equal inputs share one instance and its
+    lazily computed transformation state.
+    """
+
+    key = (_location_key(location), _time_key(obstime))
+    frame = _altaz_frame_cache.get(key)
+    if frame is None:
+        frame = AltAz(obstime=obstime, location=location)
+        _altaz_frame_cache.put(key, frame)
+    return cast(AltAz, frame)
+
+
+def transform_to_altaz(
+    coord: SkyCoord, location: EarthLocation, obstime: Time
+) -> SkyCoord:
+    """Transform ``coord`` to horizontal coordinates, reusing recent results.
+
+    ICRS directions (no distance) are memoised on the coordinate values,
+    location and observation time; other frames are transformed every time.
+    The returned ``SkyCoord`` may be shared between callers and must not be
+    modified in place.
+    """
+
+    frame = altaz_frame(location, obstime)
+    coord_key = _coord_key(coord)
+    if coord_key is None:
+        return coord.transform_to(frame)
+    key = (coord_key, _location_key(location), _time_key(obstime))
+    altaz = _altaz_transform_cache.get(key)
+    if altaz is None:
+        altaz = coord.transform_to(frame)
+        _altaz_transform_cache.put(key, altaz)
+    return cast(SkyCoord, altaz)
+
+
+def altaz_cache_info() -> AltAzCacheInfo:
+    """Return hit/miss counters and sizes of the ``AltAz`` frame/transform caches."""
+
+    return AltAzCacheInfo(_altaz_frame_cache.info(), _altaz_transform_cache.info())
+
+
+def clear_altaz_cache() -> None:
+    """Drop cached ``AltAz`` frames and transforms and reset the counters."""
+
+    global _altaz_frame_cache, _altaz_transform_cache
+    _altaz_frame_cache = _LRUCache(ALTAZ_FRAME_CACHE_SIZE)
+    _altaz_transform_cache = _LRUCache(ALTAZ_TRANSFORM_CACHE_SIZE)
+
+
 async def httpx_get(
     url: str,
     payload: Dict[str, Any],
     return_type: Literal["json", "text"],
+    bypass_cache: bool = False,
 ) -> Tuple[Union[Dict[str, Any], List[Dict[str, Any]], str], int]:
     """Perform an asynchronous HTTP GET request.
 
@@ -245,6 +608,8 @@ async def httpx_get(
         Query parameters forwarded to HTTPX.
     return_type : str
         Either ``"json"`` (parse JSON body) or ``"text"`` (return raw response text).
+    bypass_cache : bool, optional
+        Skip the response cache lookup and fetch fresh data (default ``False``).
 
     Returns
     -------
@@ -254,12 +619,11 @@ async def httpx_get(
     Notes
     -----
     On transport errors or timeouts, returns empty data ({}, "") and status 0.
-    JSON decoding failures yield ``{}``.
+    JSON decoding failures yield ``{}``. Goes through :func:`network.afetch`,
+    so endpoints with a TTL may be answered from the response cache.
     """
-    timeout = httpx.Timeout(DEFAULT_REQUEST_TIMEOUT_SEC)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(url, params=payload)
+        r = await network.afetch("GET", url, params=payload, bypass_cache=bypass_cache)
     except httpx.RequestError:
         # Network/timeouts/unreachable hosts: safe defaults and status 0
         if return_type == "json":
@@ -285,6 +649,7 @@ async def httpx_post(
     url: str,
     payload: Dict[str, Any],
     return_type: Literal["json", "text"],
+    bypass_cache: bool = False,
 ) -> Tuple[Union[Dict[str, Any], List[Dict[str, Any]], str], int]:
     """Perform an asynchronous HTTP POST request.
 
@@ -299,6 +664,8 @@ async def httpx_post(
         Form fields forwarded in the POST body.
     return_type : str
         Either ``"json"`` or ``"text"`` (same semantics as :func:`httpx_get`).
+    bypass_cache : bool, optional
+        Skip the response cache lookup (default ``False``).
 
     Returns
     -------
@@ -309,14 +676,14 @@ async def httpx_post(
     -----
     Uses ``application/x-www-form-urlencoded``.
     """
-    timeout = httpx.Timeout(DEFAULT_REQUEST_TIMEOUT_SEC)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.post(
-                url,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                data=payload,
-            )
+        r = await network.afetch(
+            "POST",
+            url,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=payload,
+            bypass_cache=bypass_cache,
+        )
     except httpx.RequestError:
         if return_type == "json":
             return cast(
@@ -370,32 +737,41 @@ def weather_time(time_init: str, deltaT: int) -> str:
     return time.strftime("%d/%m %H:%M")
 
 
-def weather_forecast_report(config: ConfigParser) -> str:
+async def async_weather_forecast_report(
+    config: ObservatoryConfig, bypass_cache: bool = False
+) -> str:
     """Fetch and format the 7Timer astronomical forecast as plain text.
 
     Returns user-visible error messages when the HTTP request fails or the body
     is not JSON; otherwise returns the plaintext rendering of the formatted table.
+    Forecasts are served from the response cache while fresh unless
+    ``bypass_cache`` is set. The request goes through the running loop's
+    shared client (:func:`network.afetch`).
     """
 
-    configuration.load_config(config)
-    lat, long = config["Observatory"]["latitude"], config["Observatory"]["longitude"]
-    payload = {"lon": long, "lat": lat, "product": "astro", "output": "json"}
+    observatory = await asyncio.to_thread(resolve_observatory, config)
+    payload: Dict[str, Any] = {
+        "lon": observatory.longitude,
+        "lat": observatory.latitude,
+        "product": "astro",
+        "output": "json",
+    }
     try:
-        r = requests.get(
+        r = await network.afetch(
+            "GET",
             SEVENTIMER_API_URL,
             params=payload,
-            timeout=DEFAULT_REQUEST_TIMEOUT_SEC,
+            bypass_cache=bypass_cache,
         )
         r.raise_for_status()
         weather_forecast = r.json()
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         return f"Weather forecast request failed ({exc})."
     except ValueError:
         return "Weather forecast response was not valid JSON."
 
-    table = QTable(
-        [[""], [""], [""], [""], [""], [""], [""], [""], [""]],
-        names=(
+    table = ColumnarTableBuilder(
+        (
             "Time",
             "Clouds",
             "Seeing",
@@ -412,28 +788,28 @@ def weather_forecast_report(config: ConfigParser) -> str:
     def map_or_na(mapping: Dict[int, str], key: Any) -> str:
         return mapping.get(key, "N/A")
 
-    for time in weather_forecast.get("dataseries", []):
+    for entry in weather_forecast.get("dataseries", []):
         try:
             when = weather_time(
                 weather_forecast.get("init", ""),
-                time.get("timepoint", 0),
+                entry.get("timepoint", 0),
             )
         except (TypeError, ValueError):
             when = "N/A"
 
-        cloudcover = map_or_na(cloudcover_dict, time.get("cloudcover"))
-        seeing = map_or_na(seeing_dict, time.get("seeing"))
-        transp = map_or_na(transparency_dict, time.get("transparency"))
-        lifted = map_or_na(liftedIndex_dict, time.get("lifted_index"))
-        temp = f"{time.get('temp2m', 'N/A')} C" if "temp2m" in time else "N/A"
-        rh = map_or_na(rh2m_dict, time.get("rh2m"))
-        wind = time.get("wind10m") or {}
+        cloudcover = map_or_na(cloudcover_dict, entry.get("cloudcover"))
+        seeing = map_or_na(seeing_dict, entry.get("seeing"))
+        transp = map_or_na(transparency_dict, entry.get("transparency"))
+        lifted = map_or_na(liftedIndex_dict, entry.get("lifted_index"))
+        temp = f"{entry.get('temp2m', 'N/A')} C" if "temp2m" in entry else "N/A"
+        rh = map_or_na(rh2m_dict, entry.get("rh2m"))
+        wind = entry.get("wind10m") or {}
         wind_dir = wind.get("direction", "N/A")
         wind_speed = map_or_na(wind10m_speed_dict, wind.get("speed"))
         wind_str = f"{wind_dir} {wind_speed}"
-        precip = time.get("prec_type", "N/A")
+        precip = entry.get("prec_type", "N/A")
 
-        table.add_row(
+        table.append(
             [
                 when,
                 cloudcover,
@@ -446,11 +822,22 @@ def weather_forecast_report(config: ConfigParser) -> str:
                 precip,
             ]
         )
-    table.remove_row(0)
-    return str(table)
+    return str(table.build())
+
 
+def weather_forecast_report(
+    config: ObservatoryConfig, bypass_cache: bool = False
+) -> str:
+    """Blocking wrapper around :func:`async_weather_forecast_report`."""
 
-def weather(config: ConfigParser) -> None:
+    return _run_sync(
+        async_weather_forecast_report(config, bypass_cache),
+        "weather_forecast_report",
+        "async_weather_forecast_report",
+    )
+
+
+def weather(config: ObservatoryConfig) -> None:
     """Display weather forecast for the observatory location.
 
     Retrieves astronomical weather forecast data from 7Timer API for up to
@@ -460,9 +847,9 @@ def weather(config: ConfigParser) -> None:
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory latitude and longitude.
+        observatory latitude and longitude, or a parsed :class:`Observatory`.
 
     Returns
     -------
@@ -558,7 +945,7 @@ def skycoord_format(coord: str, coordid: str) -> str:
 
 
 def is_visible(
-    config: ConfigParser, coord: Union[SkyCoord, List[str]], time: Time
+    config: ObservatoryConfig, coord: Union[SkyCoord, List[str]], time: Time
 ) -> bool:
     """Check if an object is visible above the virtual horizon.
 
@@ -569,9 +956,10 @@ def is_visible(
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location and virtual horizon settings.
+        observatory location and virtual horizon settings, or a parsed
+        :class:`Observatory`.
     coord : Union[SkyCoord, List[str]]
         Celestial coordinates. When a list is given it must contain two RA/Dec
         strings convertible via :func:`skycoord_format`.
@@ -593,41 +981,143 @@ def is_visible(
     - West: 225° to 315°
 
     Each sector has its own minimum altitude threshold configured in the
-    virtual horizon settings.
+    virtual horizon settings. When ``horizon_file`` points to an azimuth
+    profile, its per-bin minima replace the sectors (see
+    :class:`~asteroidpy.horizon.HorizonProfile`).
     """
-    configuration.load_config(config)
-    location = earth_location_from_config(config)
+    observatory = resolve_observatory(config)
     if isinstance(coord, list):
         coord = SkyCoord(
             skycoord_format(coord[0], "ra") + " " + skycoord_format(coord[1], "dec")
         )
-    coord = coord.transform_to(AltAz(obstime=time, location=location))
+    coord = transform_to_altaz(coord, observatory.location, time)
 
     # Extract degrees for clear comparisons
     azimuth_deg: float = coord.az.to(u.deg).value
     altitude_deg: float = coord.alt.to(u.deg).value
 
-    north_alt_threshold = float(config["Observatory"]["nord_altitude"])
-    east_alt_threshold = float(config["Observatory"]["east_altitude"])
-    south_alt_threshold = float(config["Observatory"]["south_altitude"])
-    west_alt_threshold = float(config["Observatory"]["west_altitude"])
+    return bool(observatory.horizon_profile.is_visible(azimuth_deg, altitude_deg))
+
+
+def _skycoord_many(ra: Any, dec: Any) -> SkyCoord:
+    """Build one array-valued :class:`SkyCoord` from RA/Dec columns.
 
-    # Define inclusive azimuth sectors with proper wrap-around for North
-    in_north = azimuth_deg >= 315.0 or azimuth_deg < 45.0
-    in_east = 45.0 <= azimuth_deg < 135.0
-    in_south = 135.0 <= azimuth_deg < 225.0
-    in_west = 225.0 <= azimuth_deg < 315.0
+    Quantities are used as-is, strings are read as sexagesimal RA hours and Dec
+    degrees (the MPC table layout), anything else as plain degrees.
+    """
+    if isinstance(ra, Quantity) and isinstance(dec, Quantity):
+        return SkyCoord(np.atleast_1d(ra), np.atleast_1d(dec))
+    ra_arr = np.atleast_1d(np.asarray(ra))
+    dec_arr = np.atleast_1d(np.asarray(dec))
+    if ra_arr.dtype.kind in "US":
+        return SkyCoord(ra_arr, dec_arr, unit=(u.hourangle, u.deg))
+    return SkyCoord(ra_arr.astype(float) * u.deg, dec_arr.astype(float) * u.deg)
+
+
+def is_visible_many(
+    config: ObservatoryConfig,
+    ra: Union[Sequence[float], Sequence[str], np.ndarray, Quantity],
+    dec: Union[Sequence[float], Sequence[str], np.ndarray, Quantity],
+    times: Time,
+    fast: bool = False,
+) -> np.ndarray:
+    """Vectorized :func:`is_visible` over many coordinates.
+
+    Loads the configuration once, performs a single ``SkyCoord`` → ``AltAz``
+    transform for every target and applies the observatory's
+    :class:`~asteroidpy.horizon.HorizonProfile` as a NumPy index lookup.
+    With ``fast=True`` a NumPy approximation (:mod:`asteroidpy.fastaltaz`)
+    classifies every target first and only those within
+    :data:`~asteroidpy.fastaltaz.FAST_ALTAZ_MAX_ERROR_DEG` of the horizon are
+    transformed with astropy; the result is the same as the exact path.
 
-    if in_north and altitude_deg >= north_alt_threshold:
-        return True
-    if in_east and altitude_deg >= east_alt_threshold:
-        return True
-    if in_south and altitude_deg >= south_alt_threshold:
-        return True
-    return in_west and altitude_deg >= west_alt_threshold
+    Parameters
+    ----------
+    config : ConfigParser or Observatory
+        The ConfigParser object with configuration options, including
+        observatory location and virtual horizon settings, or a parsed
+        :class:`Observatory`.
+    ra, dec : array-like or Quantity
+        Right ascension and declination columns of equal length. Plain numbers
+        are degrees; strings are sexagesimal (RA in hours, Dec in degrees).
+    times : Time
+        Observation time: either a scalar shared by every target or an array
+        with one epoch per target.
+    fast : bool, optional
+        Pre-filter with the approximate engine and refine only borderline
+        targets with astropy (default ``False``).
 
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array, ``True`` where the target is above the virtual horizon.
+    """
+    coords = _skycoord_many(ra, dec)
+    if coords.size == 0:
+        return np.zeros(0, dtype=bool)
+    observatory = resolve_observatory(config)
+    if not fast:
+        return _exact_visible(observatory, coords, times)
+
+    azimuth, altitude = _approx_altaz(observatory, coords, times)
+    visible, borderline = _fast_horizon_split(
+        observatory.horizon_profile, azimuth, altitude
+    )
+    if borderline.any():
+        refine_times = times if times.isscalar else times[borderline]
+        visible[borderline] = _exact_visible(
+            observatory, coords[borderline], refine_times
+        )
+    return visible
 
-def observing_target_list_scraper(url: str, payload: Dict[str, Any]) -> List[List[str]]:
+
+def _exact_visible(
+    observatory: Observatory, coords: SkyCoord, times: Time
+) -> np.ndarray:
+    altaz = transform_to_altaz(coords, observatory.location, times)
+    return cast(
+        np.ndarray,
+        observatory.horizon_profile.is_visible(
+            altaz.az.to_value(u.deg), altaz.alt.to_value(u.deg)
+        ),
+    )
+
+
+def _approx_altaz(
+    observatory: Observatory, coords: SkyCoord, times: Time
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fast ``(azimuth, altitude)`` in degrees for array-valued ICRS ``coords``."""
+
+    return approx_altaz(
+        coords.ra.to_value(u.deg),
+        coords.dec.to_value(u.deg),
+        observatory.latitude,
+        observatory.longitude,
+        times.utc.jd,
+    )
+
+
+def _fast_horizon_split(
+    profile: HorizonProfile, azimuth: np.ndarray, altitude: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(surely_visible, borderline)`` masks for approximate positions.
+
+    A position error of ``FAST_ALTAZ_MAX_ERROR_DEG`` moves the azimuth by up to
+    that amount divided by ``cos(altitude)``, so the horizon is bracketed over
+    that azimuth window before comparing.
+    """
+
+    margin = FAST_ALTAZ_MAX_ERROR_DEG
+    cos_alt = np.maximum(np.cos(np.radians(altitude)), 1e-9)
+    low, high = profile.altitude_bounds(azimuth, margin / cos_alt)
+    visible = altitude - margin >= high
+    hidden = altitude + margin < low
+    return visible, ~(visible | hidden)
+
+
+async def async_observing_target_list_scraper(
+    url: str, payload: Dict[str, Any], bypass_cache: bool = False
+) -> List[List[str]]:
     """Scrape observing target list data from a web page.
 
     Performs an ``application/x-www-form-urlencoded`` POST (same as the MPC
@@ -640,6 +1130,9 @@ def observing_target_list_scraper(url: str, payload: Dict[str, Any]) -> List[Lis
     payload : Dict[str, Any]
         Form fields for the MPC query (latitude/longitude, time window, filters,
         ``authenticity_token``, etc.). Values are serialized like a browser form.
+    bypass_cache : bool, optional
+        Skip the response cache lookup (default ``False``). Cached pages are
+        keyed on the form without ``authenticity_token``.
 
     Returns
     -------
@@ -655,7 +1148,9 @@ def observing_target_list_scraper(url: str, payload: Dict[str, Any]) -> List[Lis
     uses either the classic columns (… Time / RA / Dec / Alt) or the extended
     layout with solar/lunar elongation and Begin/Max epochs (indices 4–7 still
     map to Begin time / Beg RA / Dec / Alt for visibility filtering). Only
-    non-empty data rows are returned.
+    non-empty data rows are returned. A POST rejected for a stale
+    ``authenticity_token`` is retried once with a freshly scraped token (see
+    :class:`MpcSession`).
 
     Raises nothing: failures return an empty list.
     """
@@ -665,65 +1160,30 @@ def observing_target_list_scraper(url: str, payload: Dict[str, Any]) -> List[Lis
         body["utf8"] = "\u2713"
 
     try:
-        r = requests.post(
-            url,
-            data=body,
-            headers=_MPC_BROWSER_HEADERS,
-            timeout=DEFAULT_REQUEST_TIMEOUT_SEC,
-        )
+        r = await mpc_session().async_post_form(url, body, bypass_cache=bypass_cache)
         r.raise_for_status()
-    except requests.RequestException:
+    except httpx.HTTPError:
         return []
 
-    soup = BeautifulSoup(r.content, "lxml")
-    tables = soup.find_all("table")
-
-    _classic_headers = {"Designation", "Mag", "Time", "RA", "Dec", "Alt"}
-    _beg_headers = {
-        "Designation",
-        "Mag",
-        "Begin Time",
-        "Beg RA",
-        "Beg Dec",
-        "Beg Alt",
-    }
+    # lxml parsing of a large page would stall the event loop (and the TUI).
+    return await asyncio.to_thread(parse_whatsup_results, r.content)
 
-    def _table_matches_results(headers: set[str]) -> bool:
-        return _classic_headers.issubset(headers) or _beg_headers.issubset(headers)
-
-    # Prefer the 4th table if present (legacy behavior), otherwise try to detect by headers
-    target_table = None
-    if len(tables) >= 4:
-        fourth = tables[3]
-        header_cells = [th.get_text(strip=True) for th in fourth.find_all("th")]
-        header_set = {h for h in header_cells if h}
-        if _table_matches_results(header_set):
-            target_table = fourth
-    if target_table is None:
-        for candidate in tables:
-            header_cells = [th.get_text(strip=True) for th in candidate.find_all("th")]
-            header_set = {h for h in header_cells if h}
-            if _table_matches_results(header_set):
-                target_table = candidate
-                break
-
-    # If no suitable table was found, return an empty result gracefully
-    if target_table is None:
-        return []
 
-    # Extract non-empty data rows, skipping header rows
-    data: List[List[str]] = []
-    for row in target_table.find_all("tr"):
-        cells = row.find_all("td")
-        if not cells:
-            continue
-        values = [cell.get_text(strip=True) for cell in cells]
-        if any(values):
-            data.append(values)
-    return data
+def observing_target_list_scraper(
+    url: str, payload: Dict[str, Any], bypass_cache: bool = False
+) -> List[List[str]]:
+    """Blocking wrapper around :func:`async_observing_target_list_scraper`."""
 
+    return _run_sync(
+        async_observing_target_list_scraper(url, payload, bypass_cache),
+        "observing_target_list_scraper",
+        "async_observing_target_list_scraper",
+    )
 
-def observing_target_list(config: ConfigParser, payload: Dict[str, Any]) -> QTable:
+
+async def async_observing_target_list(
+    config: ObservatoryConfig, payload: Dict[str, Any], bypass_cache: bool = False
+) -> QTable:
     """Generate an observing target list from the Minor Planet Center.
 
     Queries the MPC website for objects visible from the observatory location
@@ -732,9 +1192,10 @@ def observing_target_list(config: ConfigParser, payload: Dict[str, Any]) -> QTab
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location and virtual horizon settings.
+        observatory location and virtual horizon settings, or a parsed
+        :class:`Observatory`.
     payload : Dict[str, Any]
         Dictionary of POST form fields including:
         - latitude, longitude: Observatory coordinates
@@ -744,6 +1205,8 @@ def observing_target_list(config: ConfigParser, payload: Dict[str, Any]) -> QTab
         - min_alt: Minimum altitude
         - solar_elong, lunar_elong: Minimum elongations
         - object_type: Type of objects ('mp', 'neo', or 'cmt')
+    bypass_cache : bool, optional
+        Fetch a fresh MPC page instead of a cached one (default ``False``).
 
     Returns
     -------
@@ -760,27 +1223,49 @@ def observing_target_list(config: ConfigParser, payload: Dict[str, Any]) -> QTab
     -----
     Objects are filtered to only include those visible above the virtual
     horizon at the specified observation time. The function scrapes HTML
-    from the MPC website and parses table data.
+    from the MPC website and parses table data. Visibility of all rows is
+    decided by one :func:`is_visible_many` call. Only the request runs on the
+    event loop; parsing and the visibility check run in a worker thread.
     """
-    results = QTable(
-        [[""], [""], [""], [""], [""], [""]],
-        names=("Designation", "Mag", "Time", "RA", "Dec", "Alt"),
+    with network.cache_bypass(bypass_cache):
+        data = await async_observing_target_list_scraper(MPC_WHATSUP_INDEX_URL, payload)
+    return await asyncio.to_thread(_observing_target_table, config, data)
+
+
+def _observing_target_table(config: ObservatoryConfig, data: List[List[str]]) -> QTable:
+    """Visible rows of a What's Observable result as the target-list table."""
+
+    results = ColumnarTableBuilder(
+        ("Designation", "Mag", "Time", "RA", "Dec", "Alt"),
         meta={"name": "Observing Target List"},
     )
-    data = observing_target_list_scraper(MPC_WHATSUP_INDEX_URL, payload)
+    rows: List[List[str]] = []
+    ra_deg: List[float] = []
+    dec_deg: List[float] = []
+    observing_times: List[Time] = []
     for d in data:
         if len(d) < MPC_MIN_COLS:
             continue
         try:
             observing_time = mpc_whatsup_table_cell_to_time(d[MPC_COL_TIME])
+            ra_angle = Angle(d[MPC_COL_RA], unit=u.hourangle)
+            dec_angle = Angle(d[MPC_COL_DEC], unit=u.deg)
         except (ValueError, TypeError):
             continue
-        if is_visible(
-            config,
-            [d[MPC_COL_RA], d[MPC_COL_DEC]],
-            observing_time,
-        ):
-            results.add_row(
+        rows.append(d)
+        ra_deg.append(float(ra_angle.to_value(u.deg)))
+        dec_deg.append(float(dec_angle.to_value(u.deg)))
+        observing_times.append(observing_time)
+
+    if not rows:
+        return results.build()
+
+    visible = is_visible_many(
+        resolve_observatory(config), ra_deg, dec_deg, Time(observing_times), fast=True
+    )
+    for d, d_visible in zip(rows, visible):
+        if d_visible:
+            results.append(
                 [
                     d[MPC_COL_DESIGNATION],
                     d[MPC_COL_MAG],
@@ -790,12 +1275,29 @@ def observing_target_list(config: ConfigParser, payload: Dict[str, Any]) -> QTab
                     d[MPC_COL_ALT],
                 ]
             )
-    results.remove_row(0)
-    return results
+    return results.build()
+
+
+def observing_target_list(
+    config: ObservatoryConfig, payload: Dict[str, Any], bypass_cache: bool = False
+) -> QTable:
+    """Blocking wrapper around :func:`async_observing_target_list`."""
+
+    return _run_sync(
+        async_observing_target_list(config, payload, bypass_cache),
+        "observing_target_list",
+        "async_observing_target_list",
+    )
 
 
 def neocp_confirmation(
-    config: ConfigParser, min_score: int, max_magnitude: float, min_altitude: int
+    config: ObservatoryConfig,
+    min_score: int,
+    max_magnitude: float,
+    min_altitude: int,
+    bypass_cache: bool = False,
+    top_n: Optional[int] = None,
+    scorer: Optional[NeocpScorer] = None,
 ) -> QTable:
     """Generate a list of NEOcp (Near Earth Object Confirmation Page) candidates.
 
@@ -805,9 +1307,10 @@ def neocp_confirmation(
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location, MPC code, and virtual horizon settings.
+        observatory location, MPC code, and virtual horizon settings, or a
+        parsed :class:`Observatory`.
     min_score : int
         Minimum score threshold for NEO candidates (higher scores indicate
         higher priority).
@@ -815,6 +1318,15 @@ def neocp_confirmation(
         Maximum visual magnitude (brighter objects have lower magnitudes).
     min_altitude : int
         Minimum altitude in degrees above the horizon.
+    bypass_cache : bool, optional
+        Download fresh ``neocp.json`` and ephemerides instead of cached ones
+        (default ``False``).
+    top_n : int, optional
+        Keep only the ``top_n`` candidates with the highest follow-up
+        priority. ``None`` (default) keeps every candidate.
+    scorer : callable, optional
+        Priority function for the ranking (see :mod:`asteroidpy.ranking`);
+        defaults to :func:`~asteroidpy.ranking.default_neocp_priority`.
 
     Returns
     -------
@@ -831,6 +1343,8 @@ def neocp_confirmation(
         - NObs: Number of observations
         - Arc: Observation arc
         - Not_seen: Days since last observation
+        - Priority: Follow-up priority, only when ``top_n`` or ``scorer``
+          is given
 
     Notes
     -----
@@ -839,122 +1353,278 @@ def neocp_confirmation(
     to calculate velocity and direction. Objects with zero velocity are
     excluded from the results.
 
+    With ``top_n`` or ``scorer`` the surviving candidates are scored in one
+    vectorized call and the table lists them best first; only the selected
+    rows are formatted.
+
     This function uses :func:`asyncio.run` internally when no asyncio event loop
     is already running. From async code, Jupyter, or any context where a loop
     is active, call :func:`async_neocp_confirmation` with ``await`` instead.
     """
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(
-            async_neocp_confirmation(config, min_score, max_magnitude, min_altitude)
-        )
-    raise RuntimeError(
-        "neocp_confirmation() cannot be used while an asyncio event loop is running "
-        "(e.g. inside async code or Jupyter). Use "
-        "await async_neocp_confirmation(config, min_score, max_magnitude, min_altitude) "
-        "instead."
+    return _run_sync(
+        async_neocp_confirmation(
+            config,
+            min_score,
+            max_magnitude,
+            min_altitude,
+            bypass_cache,
+            top_n=top_n,
+            scorer=scorer,
+        ),
+        "neocp_confirmation",
+        "async_neocp_confirmation",
     )
 
 
 async def async_neocp_confirmation(
-    config: ConfigParser, min_score: int, max_magnitude: float, min_altitude: int
+    config: ObservatoryConfig,
+    min_score: int,
+    max_magnitude: float,
+    min_altitude: int,
+    bypass_cache: bool = False,
+    top_n: Optional[int] = None,
+    scorer: Optional[NeocpScorer] = None,
 ) -> QTable:
     """Async implementation of NEOcp candidate table generation.
 
     Use this from code that already runs an asyncio event loop instead of
     :func:`neocp_confirmation`.
     """
-    configuration.load_config(config)
-    # r=requests.get('https://www.minorplanetcenter.net/Extended_Files/neocp.json')
-    # data=r.json()
-    # Pre-create result table so we can return it early if needed
-    table = QTable(
-        [[""], [0], [""], [""], [0.0], [0.0], [0.0], [0.0], [0], [0.0], [0.0]],
-        names=(
-            "Temp_Desig",
-            "Score",
-            "R.A.",
-            "Decl",
-            "Alt",
-            "V",
-            'Velocity "/min',
-            "Direction",
-            "NObs",
-            "Arc",
-            "Not_seen",
-        ),
-        meta={"name": "NEOcp confirmation"},
-    )
-    data_raw, response, fetch_ok = await fetch_neocp_json_and_ephemeris(config)
+    observatory = await asyncio.to_thread(resolve_observatory, config)
+    with network.cache_bypass(bypass_cache):
+        data, response, fetch_ok = await fetch_neocp_json_and_ephemeris(observatory)
     if not fetch_ok:
-        table.remove_row(0)
-        return table
+        data, response = [], {}
+    return await asyncio.to_thread(
+        _neocp_candidates_table,
+        observatory,
+        data,
+        response,
+        min_score,
+        max_magnitude,
+        min_altitude,
+        top_n=top_n,
+        scorer=scorer,
+    )
 
-    data = data_raw
-    try:
-        min_altitude_deg = float(min_altitude)
-    except (TypeError, ValueError):
-        min_altitude_deg = 0.0
 
-    location = earth_location_from_config(config)
-    observing_date = Time(datetime.datetime.now(datetime.UTC))
-    altaz = AltAz(location=location, obstime=observing_date)
+# neocp.json fields read into float columns by :func:`neocp_columns`, in order.
+NEOCP_NUMERIC_FIELDS = ("R.A.", "Decl.", "Score", "V", "NObs", "Arc", "Not_Seen_dys")
 
-    # table already created above
-    for item in data:
-        coord = SkyCoord(float(item["R.A."]) * u.deg, float(item["Decl."]) * u.deg)
-        coord_altaz = coord.transform_to(altaz)
+
+class NeocpColumns(NamedTuple):
+    """A ``neocp.json`` list as NumPy columns, one element per entry.
+
+    Numeric fields are ``float64`` with NaN where the entry lacks the field
+    or it does not parse; ``valid`` is true for entries with a designation
+    and every field of :data:`NEOCP_NUMERIC_FIELDS` present.
+    """
+
+    designation: np.ndarray
+    ra: np.ndarray
+    dec: np.ndarray
+    score: np.ndarray
+    v: np.ndarray
+    nobs: np.ndarray
+    arc: np.ndarray
+    not_seen: np.ndarray
+    valid: np.ndarray
+
+
+def neocp_columns(data: Sequence[Dict[str, Any]]) -> NeocpColumns:
+    """Read the NEOcp entries into :class:`NeocpColumns` in one pass."""
+
+    values = np.full((len(data), len(NEOCP_NUMERIC_FIELDS)), np.nan)
+    designations: List[str] = []
+    for row, item in enumerate(data):
+        designations.append(str(item.get("Temp_Desig") or ""))
+        for col, field in enumerate(NEOCP_NUMERIC_FIELDS):
+            try:
+                values[row, col] = float(item[field])
+            except (KeyError, TypeError, ValueError):
+                pass
+    designation = np.array(designations, dtype=str)
+    valid = np.isfinite(values).all(axis=1) & (designation != "")
+    ra, dec, score, v, nobs, arc, not_seen = values.T
+    return NeocpColumns(designation, ra, dec, score, v, nobs, arc, not_seen, valid)
+
+
+def _neocp_ephemeris_rates(
+    response: Dict[str, List[str]], designations: Union[Sequence[str], np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Velocity and direction columns from confirmeph2 rows; 0 where missing."""
+
+    rates = np.zeros((len(designations), 2))
+    for row, designation in enumerate(designations):
+        values = response.get(designation)
+        if values is None or len(values) < NEOCP_EPHEM_MIN_LEN:
+            continue
         try:
-            score = int(item["Score"])
-            mag = float(item["V"])
-        except (ValueError, TypeError):
+            rates[row] = (
+                float(values[NEOCP_EPHEM_VELOCITY_IDX]),
+                float(values[NEOCP_EPHEM_DIRECTION_IDX]),
+            )
+        except ValueError:
             continue
-        # Apply score, magnitude, altitude threshold and visibility filters
-        if (
-            score > min_score
-            and mag < max_magnitude
-            and coord_altaz.alt.to(u.deg).value > min_altitude_deg
-            and is_visible(config, coord, observing_date)
-        ):
-            # Safely access ephemeris data with bounds checking
-            temp_desig = item["Temp_Desig"]
+    return rates[:, 0], rates[:, 1]
+
+
+def _neocp_peak_altitudes(
+    response: Dict[str, List[str]],
+    designations: Union[Sequence[str], np.ndarray],
+    current_alt: np.ndarray,
+    now: datetime.datetime,
+) -> np.ndarray:
+    """Highest altitude from ``now`` on: the ephemeris maximum or the current."""
+
+    peak = np.array(current_alt, dtype=float)
+    start = _utc_minute(now)
+    for row, designation in enumerate(designations):
+        series = ephemeris_series(response.get(designation, ()))
+        upcoming = series["alt"][series["time"] >= start]
+        if upcoming.size:
+            peak[row] = max(peak[row], float(upcoming.max()))
+    return peak
+
+
+def _neocp_candidates_table(
+    observatory: Observatory,
+    data: List[Dict[str, Any]],
+    response: Dict[str, List[str]],
+    min_score: int,
+    max_magnitude: float,
+    min_altitude: int,
+    top_n: Optional[int] = None,
+    scorer: Optional[NeocpScorer] = None,
+) -> QTable:
+    """Filter NEOcp entries and join their ephemerides into the candidate table.
+
+    The list is read with :func:`neocp_columns`; malformed entries, then the
+    score and magnitude limits, the altitude limit and the virtual horizon
+    are applied as boolean masks, with one AltAz transform for the entries
+    that survive the cheap approximate altitude cut. When ranking (``top_n``
+    or ``scorer`` given) the survivors are scored on :class:`NeocpFeatures`
+    columns and the best ``top_n`` are picked with :func:`top_k_indices`
+    before any row is formatted.
+    """
 
-            if (
-                temp_desig in response
-                and len(response[temp_desig]) >= NEOCP_EPHEM_MIN_LEN
-            ):
-                velocity = float(response[temp_desig][NEOCP_EPHEM_VELOCITY_IDX])
-                direction = float(response[temp_desig][NEOCP_EPHEM_DIRECTION_IDX])
-            else:
-                # Use default values if ephemeris data is not available
-                velocity = 0.0
-                direction = 0.0
+    ranked = top_n is not None or scorer is not None
+    names = [
+        "Temp_Desig",
+        "Score",
+        "R.A.",
+        "Decl",
+        "Alt",
+        "V",
+        'Velocity "/min',
+        "Direction",
+        "NObs",
+        "Arc",
+        "Not_seen",
+    ]
+    dtypes: List[Any] = [
+        str,
+        int,
+        str,
+        str,
+        float,
+        float,
+        float,
+        float,
+        int,
+        float,
+        float,
+    ]
+    if ranked:
+        names.append("Priority")
+        dtypes.append(float)
+    table = ColumnarTableBuilder(
+        names,
+        dtypes=dtypes,
+        units={"Alt": u.deg},
+        meta={"name": "NEOcp confirmation"},
+    )
+    try:
+        min_altitude_deg = float(min_altitude)
+    except (TypeError, ValueError):
+        min_altitude_deg = 0.0
 
-            if velocity == 0.0:
-                continue
+    now = datetime.datetime.now(datetime.UTC)
+    observing_date = Time(now)
 
-            table.add_row(
-                [
-                    temp_desig,
-                    score,
-                    coord.ra.to_string(u.hour),
-                    coord.dec.to_string(u.degree, alwayssign=True),
-                    coord_altaz.alt,
-                    mag,
-                    velocity,
-                    direction,
-                    int(item["NObs"]),
-                    float(item["Arc"]),
-                    float(item["Not_Seen_dys"]),
-                ]
-            )
-    table.remove_row(0)
-    return table
+    columns = neocp_columns(data)
+    # Score and magnitude filters are cheap; apply them before any transform.
+    selected = np.flatnonzero(
+        columns.valid & (columns.score > min_score) & (columns.v < max_magnitude)
+    )
+    if selected.size == 0:
+        return table.build()
+
+    coords = SkyCoord(columns.ra[selected] * u.deg, columns.dec[selected] * u.deg)
+    # Approximate altitudes drop targets clearly below min_altitude; one
+    # astropy transform then gives the displayed altitude of the rest, and
+    # the horizon profile is applied to that same az/alt.
+    _, approx_alt = _approx_altaz(observatory, coords, observing_date)
+    kept = np.flatnonzero(approx_alt + FAST_ALTAZ_MAX_ERROR_DEG > min_altitude_deg)
+    if kept.size == 0:
+        return table.build()
+    selected = selected[kept]
+    coords = coords[kept]
+    coords_altaz = transform_to_altaz(coords, observatory.location, observing_date)
+    alt_deg = coords_altaz.alt.to_value(u.deg)
+    visible = (alt_deg > min_altitude_deg) & observatory.horizon_profile.is_visible(
+        coords_altaz.az.to_value(u.deg), alt_deg
+    )
+    velocity, direction = _neocp_ephemeris_rates(
+        response, columns.designation[selected]
+    )
+    # Objects without a usable ephemeris (zero rate) are left out.
+    shown = np.flatnonzero(visible & (velocity != 0.0))
+    if shown.size == 0:
+        return table.build()
+
+    priority = np.empty(0)
+    if ranked:
+        rows = selected[shown]
+        features = NeocpFeatures(
+            score=columns.score[rows],
+            v=columns.v[rows],
+            alt=alt_deg[shown],
+            peak_alt=_neocp_peak_altitudes(
+                response, columns.designation[rows], alt_deg[shown], now
+            ),
+            motion=velocity[shown],
+            not_seen=columns.not_seen[rows],
+            arc=columns.arc[rows],
+        )
+        priority = np.asarray((scorer or default_neocp_priority)(features), dtype=float)
+        best = top_k_indices(priority, shown.size if top_n is None else top_n)
+        shown = shown[best]
+        priority = priority[best]
+
+    rows = selected[shown]
+    coords = coords[shown]
+    values: List[Union[Sequence[Any], np.ndarray]] = [
+        columns.designation[rows],
+        columns.score[rows].astype(int),
+        coords.ra.to_string(u.hour),
+        coords.dec.to_string(u.degree, alwayssign=True),
+        alt_deg[shown],
+        columns.v[rows],
+        velocity[shown],
+        direction[shown],
+        columns.nobs[rows].astype(int),
+        columns.arc[rows],
+        columns.not_seen[rows],
+    ]
+    if ranked:
+        values.append(priority)
+    table.extend(values)
+    return table.build()
 
 
 async def get_neocp_ephemeris(
-    config: ConfigParser, object_names: List[str]
+    config: ObservatoryConfig, object_names: List[str]
 ) -> Dict[str, List[str]]:
     """Retrieve ephemeris data for NEOcp objects from the Minor Planet Center.
 
@@ -964,9 +1634,9 @@ async def get_neocp_ephemeris(
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location and MPC code.
+        observatory location and MPC code, or a parsed :class:`Observatory`.
     object_names : List[str]
         Temporary designations for NEOcp objects to query.
 
@@ -976,85 +1646,519 @@ async def get_neocp_ephemeris(
         Dictionary mapping object temporary designations to lists of
         ephemeris values. Each list contains parsed values from the ephemeris
         table, including velocity at index ``NEOCP_EPHEM_VELOCITY_IDX``
-        and direction at ``NEOCP_EPHEM_DIRECTION_IDX``.
+        and direction at ``NEOCP_EPHEM_DIRECTION_IDX``. The lists are
+        :class:`~asteroidpy.mpcparse.EphemerisValues`: every line of the
+        object's ephemeris is on their ``series`` (see :func:`ephemeris_series`).
 
     Notes
     -----
     The function constructs a form-encoded payload with observation parameters
-    and queries the MPC CGI service. The HTML response is parsed using regex
-    to extract ephemeris data. Only objects with at least 4 values in their
-    ephemeris data are included in the results.
+    and queries the MPC CGI service. The HTML response is fed, chunk by chunk
+    as it arrives, to :class:`~asteroidpy.mpcparse.NeocpEphemerisScanner`.
+    Only objects with at least 4 values in their ephemeris data are included
+    in the results; if the transfer fails midway, the objects already read
+    are returned.
     """
-    configuration.load_config(config)
+    observatory = resolve_observatory(config)
     object_names_str = ",".join(object_names)
-    obs_code = (
-        config["Observatory"]["mpc_code"] if config["Observatory"]["mpc_code"] else ""
-    )
-    latitude = (
-        config["Observatory"]["latitude"] if config["Observatory"]["latitude"] else ""
-    )
-    longitude = (
-        config["Observatory"]["longitude"] if config["Observatory"]["longitude"] else ""
-    )
+    obs_code = observatory.mpc_code
+    latitude = observatory.latitude
+    longitude = observatory.longitude
     payload = f"mb=-30&mf=30&dl=-90&du=%2B90&nl=0&nu=100&sort=d&W=j&obj={object_names_str}&Parallax=1&obscode={obs_code}&long={longitude}&lat={latitude}&int=0&start=0&raty=a&mot=m&dmot=p&out=f&sun=x&oalt=20"
     url = "https://cgi.minorplanetcenter.net/cgi-bin/confirmeph2.cgi"
-    timeout = httpx.Timeout(DEFAULT_REQUEST_TIMEOUT_SEC)
+    scanner = NeocpEphemerisScanner()
+    result_dict: Dict[str, List[str]] = {}
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.post(
-                url,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                content=payload,
-            )
-        response_text = r.text
-    except httpx.RequestError:
-        response_text = ""
+        async for chunk in network.astream(
+            "POST",
+            url,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            content=payload,
+        ):
+            result_dict.update(scanner.feed(chunk))
+        result_dict.update(scanner.close())
+    except httpx.RequestError as exc:
+        logger.warning("NEOcp ephemeris request failed: %s", exc)
+
+    return result_dict
 
-    pattern = r"<b>([A-Za-z0-9]+)</b>[\s\S]*?<pre>([\s\S]*?)</pre>"
-    matches = re.findall(pattern, response_text)
 
-    result_dict = {}
-    for key, value in matches:
-        lines = value.strip().split("\n")
-        if len(lines) > 2:
-            second_line = lines[2]
-        else:
-            second_line = lines[0] if lines else ""
+def ephemeris_series(values: Sequence[str]) -> np.ndarray:
+    """Every ephemeris line behind a :func:`get_neocp_ephemeris` value.
+
+    Returns the :data:`~asteroidpy.mpcparse.EPHEMERIS_DTYPE` array carried by
+    the value, or an empty one for plain lists.
+    """
+
+    series = getattr(values, "series", None)
+    return series if series is not None else np.empty(0, EPHEMERIS_DTYPE)
+
+
+class NeocpNightVisibility(NamedTuple):
+    """How an NEOcp object fares over an observing window, from its ephemeris.
+
+    ``visible_from``/``visible_until`` are the first and last ephemeris epochs
+    (UTC) at or above the altitude limit, ``None`` when there is none;
+    ``peak_alt`` and ``peak_time`` give the highest point in the window and
+    ``max_motion`` the fastest sky motion ("/min) while above the limit.
+    """
+
+    visible_from: Optional[np.datetime64]
+    visible_until: Optional[np.datetime64]
+    peak_time: Optional[np.datetime64]
+    peak_alt: float
+    max_motion: float
+
 
-        values_array = re.split(r"\s+", second_line.strip())
+def _utc_minute(when: datetime.datetime) -> np.datetime64:
+    if when.tzinfo is not None:
+        when = when.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(when, "m")
 
-        if len(values_array) < 4:
+
+def neocp_night_visibility(
+    ephemerides: Mapping[str, Sequence[str]],
+    min_altitude: float = 0.0,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+) -> Dict[str, NeocpNightVisibility]:
+    """Summarise each object's ephemeris between ``start`` and ``end``.
+
+    Works on the results of :func:`get_neocp_ephemeris` (or the ephemerides
+    returned by :func:`fetch_neocp_json_and_ephemeris`) without further
+    requests; pass the dusk and dawn of :func:`twilight_times` to judge a
+    whole night. Naive datetimes are taken as UTC. Objects without ephemeris
+    lines in the window are left out.
+    """
+
+    lower = _utc_minute(start) if start is not None else None
+    upper = _utc_minute(end) if end is not None else None
+    summary: Dict[str, NeocpNightVisibility] = {}
+    for designation, values in ephemerides.items():
+        series = ephemeris_series(values)
+        window = np.ones(series.shape, dtype=bool)
+        if lower is not None:
+            window &= series["time"] >= lower
+        if upper is not None:
+            window &= series["time"] <= upper
+        series = series[window]
+        if series.size == 0:
             continue
+        peak = int(np.argmax(series["alt"]))
+        above = series[series["alt"] >= min_altitude]
+        summary[designation] = NeocpNightVisibility(
+            visible_from=above["time"][0] if above.size else None,
+            visible_until=above["time"][-1] if above.size else None,
+            peak_time=series["time"][peak],
+            peak_alt=float(series["alt"][peak]),
+            max_motion=float(above["motion"].max()) if above.size else 0.0,
+        )
+    return summary
 
-        values_array = [val for val in values_array if val]
 
-        result_dict[key] = values_array
+class NeocpPollState:
+    """What the last ``neocp.json`` poll returned, for conditional re-polling.
 
-    return result_dict
+    Holds the ``ETag``/``Last-Modified`` validators with the parsed list they
+    describe, and the confirmeph2 ephemeris of each designation keyed on the
+    site and the designation's NEOcp entry, so unchanged objects are not
+    queried again.
+    """
+
+    def __init__(self) -> None:
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.data: Optional[List[Dict[str, Any]]] = None
+        # (site, designation) -> (entry fingerprint, monotonic time, ephemeris)
+        self.ephemerides: Dict[
+            Tuple[Tuple[Any, ...], str], Tuple[str, float, List[str]]
+        ] = {}
+        self.lock = threading.Lock()
+
+
+_neocp_poll_state = NeocpPollState()
+
+
+def reset_neocp_poll_state() -> None:
+    """Forget stored validators, the parsed NEOcp list and memoized ephemerides."""
+
+    global _neocp_poll_state
+    _neocp_poll_state = NeocpPollState()
+
+
+# Days of NEOcp poll history kept by the snapshot store (0 or less keeps everything).
+NEOCP_SNAPSHOT_MAX_AGE_DAYS = 30.0
+
+_neocp_snapshots: Optional[NeocpSnapshotStore] = None
+_neocp_snapshots_enabled = True
+_neocp_snapshots_lock = threading.Lock()
+
+
+def neocp_snapshot_store() -> Optional[NeocpSnapshotStore]:
+    """Return the store every successful NEOcp poll is appended to (``None`` if off).
+
+    Query it for the past state of the page, e.g.
+    ``neocp_snapshot_store().history("P21abcD")`` or ``.state_at(when)``.
+    The file (under ``user_data_dir``) grows by one compressed row per
+    changed ephemeris or entry, where only :data:`NEOCP_EPHEM_FIELDS` count
+    as a change, and history older than :data:`NEOCP_SNAPSHOT_MAX_AGE_DAYS`
+    is pruned as new polls come in.
+    """
+
+    global _neocp_snapshots
+    if not _neocp_snapshots_enabled:
+        return None
+    with _neocp_snapshots_lock:
+        if _neocp_snapshots is None:
+            _neocp_snapshots = NeocpSnapshotStore(
+                default_snapshot_path(),
+                max_age=_snapshot_max_age(),
+                tracked_fields=NEOCP_EPHEM_FIELDS,
+            )
+        return _neocp_snapshots
+
+
+def _snapshot_max_age() -> Optional[float]:
+    days = NEOCP_SNAPSHOT_MAX_AGE_DAYS
+    return days * 86400.0 if days > 0 else None
+
+
+def configure_neocp_snapshots(
+    *,
+    path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    enabled: Optional[bool] = None,
+    max_age_days: Optional[float] = None,
+) -> None:
+    """Move the NEOcp snapshot store to ``path`` or turn recording on or off.
+
+    ``max_age_days`` changes how many days of history are kept; 0 or less
+    keeps everything.
+    """
+
+    global _neocp_snapshots, _neocp_snapshots_enabled, NEOCP_SNAPSHOT_MAX_AGE_DAYS
+    if enabled is not None:
+        _neocp_snapshots_enabled = enabled
+    with _neocp_snapshots_lock:
+        if max_age_days is not None:
+            NEOCP_SNAPSHOT_MAX_AGE_DAYS = float(max_age_days)
+            if _neocp_snapshots is not None:
+                _neocp_snapshots.max_age = _snapshot_max_age()
+        if path is not None:
+            if _neocp_snapshots is not None:
+                _neocp_snapshots.close()
+            _neocp_snapshots = NeocpSnapshotStore(
+                path, max_age=_snapshot_max_age(), tracked_fields=NEOCP_EPHEM_FIELDS
+            )
+
+
+def _record_neocp_snapshot(
+    data: List[Dict[str, Any]], ephemerides: Dict[str, List[str]]
+) -> None:
+    store = neocp_snapshot_store()
+    if store is None:
+        return
+    try:
+        store.append(data, ephemerides)
+    except (OSError, sqlite3.Error) as exc:
+        # History is a convenience; never fail the poll because of it.
+        logger.warning("Could not record NEOcp snapshot: %s", exc)
+
+
+def _neocp_entry_fingerprint(item: Dict[str, Any]) -> str:
+    return json.dumps([item.get(field) for field in NEOCP_EPHEM_FIELDS], default=str)
+
+
+async def poll_neocp_json() -> Tuple[List[Dict[str, Any]], bool]:
+    """GET ``neocp.json``, revalidating the previous download when there is one.
+
+    Sends ``If-None-Match``/``If-Modified-Since`` from the last successful
+    poll; on ``304 Not Modified`` (or a response carrying the same ``ETag``)
+    the stored list is returned without parsing the body again. Inside
+    :func:`network.cache_bypass` an unconditional request is made. While the
+    MPC circuit breaker is open the stored list is returned as well.
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], bool]
+        The NEOcp entries and whether the fetch succeeded (``([], False)`` on
+        transport errors, other status codes or a malformed body).
+    """
+
+    state = _neocp_poll_state
+    headers: Dict[str, str] = {}
+    if state.data is not None and not network.cache_bypassed():
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+    try:
+        r = await network.afetch("GET", NEOCP_JSON_URL, headers=headers or None)
+    except CircuitOpenError:
+        # MPC is known to be down: the last list beats waiting or nothing.
+        if state.data is not None:
+            return state.data, True
+        return [], False
+    except httpx.RequestError:
+        return [], False
+
+    if r.status_code == 304 and state.data is not None:
+        return state.data, True
+    if r.status_code != 200:
+        return [], False
+    etag = network.header_value(r.headers, "ETag")
+    if etag and etag == state.etag and state.data is not None:
+        return state.data, True
+    try:
+        data = r.json()
+    except ValueError:
+        return [], False
+    if not isinstance(data, list):
+        return [], False
+    with state.lock:
+        state.etag = etag
+        state.last_modified = network.header_value(r.headers, "Last-Modified")
+        state.data = data
+    return data, True
 
 
 async def fetch_neocp_json_and_ephemeris(
-    config: ConfigParser,
+    config: ObservatoryConfig,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], bool]:
-    """Download NEOcp JSON and MPC confirm ephemerides in one event-loop run."""
+    """Download NEOcp JSON and MPC confirm ephemerides in one event-loop run.
+
+    Ephemerides fetched by earlier polls are reused for designations whose
+    :data:`NEOCP_EPHEM_FIELDS` have not changed (for at most
+    ``NEOCP_EPHEM_MEMO_MAX_AGE_SEC``), so a poll where nothing changed costs
+    one conditional GET, even when MPC regenerated the file. Every successful
+    poll is appended to :func:`neocp_snapshot_store`, which keeps only what
+    changed since the previous one.
+    """
 
-    data_raw, status = await httpx_get(
-        "https://www.minorplanetcenter.net/Extended_Files/neocp.json",
-        {},
-        "json",
-    )
-    if status != 200 or not isinstance(data_raw, list):
+    data_raw, ok = await poll_neocp_json()
+    if not ok:
         return [], {}, False
-
-    designation_names = [item["Temp_Desig"] for item in data_raw]
-    if not designation_names:
+    if not data_raw:
+        await asyncio.to_thread(_record_neocp_snapshot, data_raw, {})
         return data_raw, {}, True
 
-    response = await get_neocp_ephemeris(config, designation_names)
+    observatory = resolve_observatory(config)
+    site = (observatory.mpc_code, observatory.latitude, observatory.longitude)
+    state = _neocp_poll_state
+    reuse = not network.cache_bypassed()
+    now = time.monotonic()
+    response: Dict[str, List[str]] = {}
+    fingerprints: Dict[str, str] = {}
+    stale: List[str] = []
+    with state.lock:
+        for item in data_raw:
+            designation = item["Temp_Desig"]
+            fingerprint = _neocp_entry_fingerprint(item)
+            fingerprints[designation] = fingerprint
+            memo = state.ephemerides.get((site, designation))
+            if (
+                reuse
+                and memo is not None
+                and memo[0] == fingerprint
+                and now - memo[1] <= NEOCP_EPHEM_MEMO_MAX_AGE_SEC
+            ):
+                response[designation] = memo[2]
+            else:
+                stale.append(designation)
+
+    if stale:
+        fresh = await fetch_neocp_ephemeris_chunked(observatory, stale)
+        response.update(fresh)
+    else:
+        fresh = {}
+
+    with state.lock:
+        # Objects that left the NEOcp are dropped from the memo.
+        state.ephemerides = {
+            key: memo
+            for key, memo in state.ephemerides.items()
+            if key[1] in fingerprints
+        }
+        for designation, values in fresh.items():
+            if designation in fingerprints:
+                state.ephemerides[(site, designation)] = (
+                    fingerprints[designation],
+                    now,
+                    values,
+                )
+    # SQLite write and zlib compression stay off the (TUI) event loop.
+    await asyncio.to_thread(_record_neocp_snapshot, data_raw, response)
     return data_raw, response, True
 
 
-def twilight_times(config: ConfigParser) -> Dict[str, Any]:
+async def fetch_neocp_ephemeris_chunked(
+    config: ObservatoryConfig,
+    object_names: Sequence[str],
+    chunk_size: int = NEOCP_EPHEM_CHUNK_SIZE,
+    max_concurrency: int = NEOCP_EPHEM_MAX_CONCURRENCY,
+    chunk_timeout: float = NEOCP_EPHEM_CHUNK_TIMEOUT_SEC,
+) -> Dict[str, List[str]]:
+    """Fetch confirmeph2 ephemerides in concurrent chunks and merge the results.
+
+    ``object_names`` is split into chunks of ``chunk_size`` designations, each
+    sent as its own :func:`get_neocp_ephemeris` request over the shared client.
+    At most ``max_concurrency`` requests run at once and each is abandoned
+    after ``chunk_timeout`` seconds; a chunk that times out or fails is logged
+    and its designations are simply missing from the merged dictionary.
+    """
+
+    observatory = resolve_observatory(config)
+    size = max(1, int(chunk_size))
+    chunks = [
+        list(object_names[i : i + size]) for i in range(0, len(object_names), size)
+    ]
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def fetch_chunk(chunk: List[str]) -> Dict[str, List[str]]:
+        async with semaphore:
+            return await asyncio.wait_for(
+                get_neocp_ephemeris(observatory, chunk), timeout=chunk_timeout
+            )
+
+    results = await asyncio.gather(
+        *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+    merged: Dict[str, List[str]] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.warning(
+                "NEOcp ephemeris chunk %s..%s failed: %r", chunk[0], chunk[-1], result
+            )
+            continue
+        merged.update(result)
+    return merged
+
+
+class NeocpChanges(NamedTuple):
+    """Differences between two ``neocp.json`` snapshots, by designation.
+
+    ``updated`` maps each designation present in both snapshots to the
+    :data:`NEOCP_WATCH_FIELDS` that changed, as ``{field: (old, new)}``.
+    """
+
+    added: List[str]
+    removed: List[str]
+    updated: Dict[str, Dict[str, Tuple[Any, Any]]]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+def diff_neocp_snapshots(
+    previous: Sequence[Dict[str, Any]],
+    current: Sequence[Dict[str, Any]],
+    fields: Sequence[str] = NEOCP_WATCH_FIELDS,
+) -> NeocpChanges:
+    """Compare two NEOcp lists; designations keep the order of their list."""
+
+    before: Dict[str, Dict[str, Any]] = {
+        item["Temp_Desig"]: item for item in previous if "Temp_Desig" in item
+    }
+    after: Dict[str, Dict[str, Any]] = {
+        item["Temp_Desig"]: item for item in current if "Temp_Desig" in item
+    }
+    updated: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+    for designation, item in after.items():
+        old = before.get(designation)
+        if old is None:
+            continue
+        fields_changed = {
+            field: (old.get(field), item.get(field))
+            for field in fields
+            if old.get(field) != item.get(field)
+        }
+        if fields_changed:
+            updated[designation] = fields_changed
+    return NeocpChanges(
+        added=[d for d in after if d not in before],
+        removed=[d for d in before if d not in after],
+        updated=updated,
+    )
+
+
+class NeocpWatchUpdate(NamedTuple):
+    """One poll of :func:`watch_neocp`.
+
+    ``table`` is the candidate table of the last successful poll (empty before
+    the first one), ``changes`` the difference from the previous snapshot and
+    ``ok`` whether this poll succeeded.
+    """
+
+    table: QTable
+    changes: NeocpChanges
+    ok: bool
+
+
+async def watch_neocp(
+    config: ObservatoryConfig,
+    min_score: int,
+    max_magnitude: float,
+    min_altitude: int,
+    interval: float = NEOCP_WATCH_INTERVAL_SEC,
+    top_n: Optional[int] = None,
+    scorer: Optional[NeocpScorer] = None,
+) -> AsyncIterator[NeocpWatchUpdate]:
+    """Poll the NEOcp every ``interval`` seconds and yield what changed.
+
+    Each poll revalidates ``neocp.json`` (see :func:`poll_neocp_json`) and
+    queries confirmeph2 only for designations that are new or whose
+    :data:`NEOCP_EPHEM_FIELDS` (Score, NObs, Arc and the position and
+    magnitude of the entry) changed, then rebuilds the candidate table with
+    the filters of :func:`async_neocp_confirmation` (including its
+    ``top_n``/``scorer`` ranking). The first update reports every entry as
+    added; later polls run at :attr:`~asteroidpy.ratelimit.Priority.BACKGROUND`
+    priority so interactive requests are served first. Runs until the
+    consumer stops iterating or the task is cancelled.
+    """
+
+    observatory = await asyncio.to_thread(resolve_observatory, config)
+    previous: List[Dict[str, Any]] = []
+    table = await asyncio.to_thread(
+        _neocp_candidates_table,
+        observatory,
+        [],
+        {},
+        min_score,
+        max_magnitude,
+        min_altitude,
+        top_n=top_n,
+        scorer=scorer,
+    )
+    priority = Priority.INTERACTIVE
+    while True:
+        with network.request_priority(priority):
+            data, response, ok = await fetch_neocp_json_and_ephemeris(observatory)
+        if ok:
+            changes = diff_neocp_snapshots(previous, data)
+            # Rebuilt every time: altitudes move even when the list does not.
+            # Off the loop, so a slow rebuild does not stall other tasks.
+            table = await asyncio.to_thread(
+                _neocp_candidates_table,
+                observatory,
+                data,
+                response,
+                min_score,
+                max_magnitude,
+                min_altitude,
+                top_n=top_n,
+                scorer=scorer,
+            )
+            previous = data
+        else:
+            changes = NeocpChanges([], [], {})
+        yield NeocpWatchUpdate(table, changes, ok)
+        priority = Priority.BACKGROUND
+        await asyncio.sleep(interval)
+
+
+def twilight_times(config: ObservatoryConfig) -> Dict[str, Any]:
     """Calculate twilight times for the observatory location.
 
     Computes civil, nautical, and astronomical twilight times (both morning
@@ -1062,9 +2166,10 @@ def twilight_times(config: ConfigParser) -> Dict[str, Any]:
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location (latitude, longitude, altitude) and name.
+        observatory location (latitude, longitude, altitude) and name, or a
+        parsed :class:`Observatory`.
 
     Returns
     -------
@@ -1085,9 +2190,8 @@ def twilight_times(config: ConfigParser) -> Dict[str, Any]:
     - Nautical: Sun 12° below horizon
     - Astronomical: Sun 18° below horizon
     """
-    configuration.load_config(config)
-    location = earth_location_from_config(config)
-    observer = Observer(name=config["Observatory"]["obs_name"], location=location)
+    observatory = resolve_observatory(config)
+    observer = Observer(name=observatory.name, location=observatory.location)
     observing_date = Time(datetime.datetime.now(datetime.UTC))
     result = {
         "AstroM": observer.twilight_morning_astronomical(observing_date, which="next"),
@@ -1100,7 +2204,7 @@ def twilight_times(config: ConfigParser) -> Dict[str, Any]:
     return result
 
 
-def sun_moon_ephemeris(config: ConfigParser) -> Dict[str, Any]:
+def sun_moon_ephemeris(config: ObservatoryConfig) -> Dict[str, Any]:
     """Calculate Sun and Moon ephemeris for the observatory location.
 
     Computes sunrise, sunset, moonrise, moonset times and moon illumination
@@ -1108,9 +2212,10 @@ def sun_moon_ephemeris(config: ConfigParser) -> Dict[str, Any]:
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location (latitude, longitude, altitude) and name.
+        observatory location (latitude, longitude, altitude) and name, or a
+        parsed :class:`Observatory`.
 
     Returns
     -------
@@ -1128,9 +2233,8 @@ def sun_moon_ephemeris(config: ConfigParser) -> Dict[str, Any]:
     using the astroplan Observer class. Moon illumination is a fraction
     between 0.0 (new moon) and 1.0 (full moon).
     """
-    configuration.load_config(config)
-    location = earth_location_from_config(config)
-    observer = Observer(name=config["Observatory"]["obs_name"], location=location)
+    observatory = resolve_observatory(config)
+    observer = Observer(name=observatory.name, location=observatory.location)
     observing_date = Time(datetime.datetime.now(datetime.UTC))
     result = {
         "Sunrise": observer.sun_rise_time(observing_date, which="next"),
@@ -1142,17 +2246,109 @@ def sun_moon_ephemeris(config: ConfigParser) -> Dict[str, Any]:
     return result
 
 
-def object_ephemeris(config: ConfigParser, object_name: str, stepping: str) -> QTable:
+# Orbits used by ``object_ephemeris(..., source="local")`` and the tables it
+# produced, keyed on the orbit, site, start and step.
+_orbit_catalog = ElementCatalog()
+LOCAL_EPHEMERIS_CACHE_SIZE = 64
+_local_ephemeris_cache = _LRUCache(LOCAL_EPHEMERIS_CACHE_SIZE)
+
+_PROVISIONAL_DESIGNATION = re.compile(r"\d{4} [A-Z]{2}\d*")
+
+
+def load_orbital_elements(path: Union[str, "os.PathLike[str]"]) -> int:
+    """Register the orbits of an MPCORB-format file for local ephemerides.
+
+    Returns how many orbits were read; later files replace earlier orbits of
+    the same objects.
+    """
+
+    return _orbit_catalog.add(read_mpcorb(path))
+
+
+def orbital_elements(object_name: str) -> OrbitalElements:
+    """Osculating elements of ``object_name``, queried from the MPC only once.
+
+    Orbits loaded with :func:`load_orbital_elements` or fetched before are
+    returned without a request. Numbers, provisional designations
+    (``2014 AA``) and names are accepted. Raises ``ValueError`` when the MPC
+    has no elliptic orbit for the object.
+    """
+
+    found = _orbit_catalog.get(object_name)
+    if found is not None:
+        return found
+    name = " ".join(str(object_name).split())
+    query: Dict[str, Any]
+    if name.isdigit():
+        query = {"number": int(name)}
+    elif _PROVISIONAL_DESIGNATION.fullmatch(name.upper()):
+        query = {"designation": name.upper()}
+    else:
+        query = {"name": name}
+    records = MPC.query_object("asteroid", **query)
+    if not records:
+        raise ValueError(f"No orbit found for {object_name!r}")
+    elements = elements_from_mpc(records[0])
+    if not 0.0 <= elements.eccentricity < 1.0:
+        raise ValueError(f"No elliptic orbit for {object_name!r}")
+    _orbit_catalog.add([elements])
+    # Also reachable under the name it was asked for.
+    _orbit_catalog.add([elements._replace(designation=name)])
+    return elements
+
+
+def _local_object_ephemeris(
+    location: EarthLocation, object_name: str, stepping: str, number: int = 30
+) -> QTable:
+    """``number`` rows from the local two-body engine, memoized per start."""
+
+    now = datetime.datetime.now(datetime.UTC).replace(second=0, microsecond=0)
+    step: Quantity
+    if stepping == "m":
+        step, start = 1 * u.minute, now
+    elif stepping == "d":
+        step, start = 1 * u.day, now.replace(hour=0, minute=0)
+    elif stepping == "w":
+        step, start = 7 * u.day, now.replace(hour=0, minute=0)
+    else:
+        # Default to 1 hour if unknown stepping value
+        step, start = 1 * u.hour, now.replace(minute=0)
+    elements = orbital_elements(object_name)
+    key = (
+        elements,
+        location.lat.to_value(u.deg),
+        location.lon.to_value(u.deg),
+        location.height.to_value(u.m),
+        start,
+        step.to_value(u.minute),
+        number,
+    )
+    table = _local_ephemeris_cache.get(key)
+    if table is None:
+        times = Time(start) + np.arange(number) * step
+        table = orbit_ephemeris(elements, location, times)
+        _local_ephemeris_cache.put(key, table)
+    return table.copy()
+
+
+def object_ephemeris(
+    config: ObservatoryConfig,
+    object_name: str,
+    stepping: str,
+    source: Literal["mpc", "local"] = "mpc",
+) -> QTable:
     """Retrieve ephemeris data for a specific object from the Minor Planet Center.
 
     Queries the MPC database for ephemeris data of the specified object,
-    calculated for the observatory location with the requested time step.
+    calculated for the observatory location with the requested time step,
+    or computes it locally from the object's orbit.
 
     Parameters
     ----------
-    config : ConfigParser
+    config : ConfigParser or Observatory
         The ConfigParser object with configuration options, including
-        observatory location (latitude, longitude, altitude).
+        observatory location (latitude, longitude, altitude), or a parsed
+        :class:`Observatory`.
     object_name : str
         The object designation or name (e.g., 'Ceres', '2001 AA').
         The name is automatically converted to uppercase.
@@ -1163,6 +2359,11 @@ def object_ephemeris(config: ConfigParser, object_name: str, stepping: str) -> Q
         - 'd': 1 day
         - 'w': 1 week
         Defaults to '1h' if an unknown value is provided.
+    source : {'mpc', 'local'}, optional
+        ``'mpc'`` (default) asks the MPC ephemeris service; ``'local'``
+        propagates the orbit from :func:`orbital_elements` with
+        :mod:`asteroidpy.orbit` (two-body, no request after the first lookup
+        of an object).
 
     Returns
     -------
@@ -1181,9 +2382,13 @@ def object_ephemeris(config: ConfigParser, object_name: str, stepping: str) -> Q
     -----
     The function uses astroquery.mpc.MPC to query the Minor Planet Center
     database. Ephemeris is calculated for the configured observatory location.
+    Local ephemerides start at the current minute (``'m'``), hour (``'h'``)
+    or 0h UTC (``'d'``, ``'w'``) and are memoized, so repeating a lookup
+    within that period returns the stored table.
     """
-    configuration.load_config(config)
-    location = earth_location_from_config(config)
+    location = resolve_observatory(config).location
+    if source == "local":
+        return _local_object_ephemeris(location, object_name, stepping)
     step: Union[Quantity, str]
     if stepping == "m":
         step = 1 * u.minute
@@ -0,0 +1,403 @@
+"""Append-only, delta-encoded history of NEOcp polls.
+
+Each :meth:`NeocpSnapshotStore.append` records one poll (the ``neocp.json``
+entries and the confirmeph2 ephemerides of :mod:`asteroidpy.scheduling`) under
+its fetch time, but only writes the objects whose entry or ephemeris differs
+from the stored state, plus a tombstone for objects that left the page, so the
+file grows with the changes rather than with the number of polls. Entries
+are compared on their tracked fields only (everything but
+:data:`VOLATILE_FIELDS` by default), so a page regenerated with nothing but
+new ages writes no row; the stored entry keeps the volatile values of its
+last change. Rows are
+zlib-compressed and keyed on ``(designation, kind, snapshot)``, which is also
+the index behind :meth:`~NeocpSnapshotStore.history` and
+:meth:`~NeocpSnapshotStore.state_at`: both read at most one row per object and
+kind instead of replaying every snapshot.
+
+Without a ``max_age`` the file only grows. With one, :meth:`append` prunes
+(at most once per :data:`PRUNE_INTERVAL_SEC`) every snapshot older than
+``max_age`` except the last of them, into which the rows still current at
+that time are folded, so :meth:`~NeocpSnapshotStore.state_at` stays exact
+for any time inside the window.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import platformdirs
+
+from asteroidpy.mpcparse import EPHEMERIS_DTYPE, EphemerisValues
+
+_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    fetched REAL NOT NULL
+)
+""",
+    "CREATE INDEX IF NOT EXISTS snapshots_fetched ON snapshots (fetched)",
+    """
+CREATE TABLE IF NOT EXISTS changes (
+    designation TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    snapshot INTEGER NOT NULL,
+    digest TEXT,
+    data BLOB,
+    PRIMARY KEY (designation, kind, snapshot)
+) WITHOUT ROWID
+""",
+)
+
+# Row kinds in ``changes``; ``data``/``digest`` are NULL for a removal.
+_ENTRY = "entry"
+_EPHEMERIS = "ephemeris"
+
+# The latest row of each (designation, kind) at or before a snapshot.
+_LATEST = (
+    "SELECT c.designation, c.kind, {columns} FROM changes AS c "
+    "WHERE c.snapshot = (SELECT MAX(snapshot) FROM changes "
+    "WHERE designation = c.designation AND kind = c.kind AND snapshot <= ?) "
+    "AND c.digest IS NOT NULL"
+)
+
+Timestamp = Union[float, datetime.datetime]
+
+#: neocp.json fields that move on every regeneration of the page, not with the object.
+VOLATILE_FIELDS = ("Not_Seen_dys", "Updated")
+
+#: Minimum fetch-time interval (s) between two automatic prunes.
+PRUNE_INTERVAL_SEC = 3600.0
+
+
+class NeocpSnapshot(NamedTuple):
+    """The NEOcp as stored at ``fetched`` (Unix time; ``None`` before any poll).
+
+    ``data`` lists the entries sorted by designation; ``ephemerides`` holds
+    the last ephemeris stored for each of them.
+    """
+
+    fetched: Optional[float]
+    data: List[Dict[str, Any]]
+    ephemerides: Dict[str, EphemerisValues]
+
+
+class NeocpObjectState(NamedTuple):
+    """One designation after a snapshot that changed it.
+
+    ``entry`` is ``None`` when the object had left the NEOcp; ``ephemeris``
+    is the latest stored one (``None`` if never stored).
+    """
+
+    fetched: float
+    entry: Optional[Dict[str, Any]]
+    ephemeris: Optional[EphemerisValues]
+
+
+def default_snapshot_path() -> Path:
+    """SQLite file under ``user_data_dir`` (e.g. ``~/.local/share/asteroidpy``)."""
+
+    return Path(platformdirs.user_data_dir("asteroidpy")) / "neocp_snapshots.sqlite3"
+
+
+def _unix_time(when: Timestamp) -> float:
+    if isinstance(when, datetime.datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        return when.timestamp()
+    return float(when)
+
+
+def _encode_entry(entry: Mapping[str, Any]) -> bytes:
+    return json.dumps(entry, sort_keys=True, default=str).encode("utf-8")
+
+
+def _encode_ephemeris(values: Sequence[str]) -> bytes:
+    # JSON escapes newlines, so the first one separates tokens from series.
+    series = getattr(values, "series", None)
+    raw = b"" if series is None else np.asarray(series, EPHEMERIS_DTYPE).tobytes()
+    return json.dumps(list(values)).encode("utf-8") + b"\n" + raw
+
+
+def _decode_ephemeris(payload: bytes) -> EphemerisValues:
+    tokens, _, raw = payload.partition(b"\n")
+    series = np.frombuffer(raw, dtype=EPHEMERIS_DTYPE).copy()
+    return EphemerisValues(json.loads(tokens), series)
+
+
+def _digest(payload: bytes) -> str:
+    return hashlib.sha1(payload).hexdigest()
+
+
+class NeocpSnapshotStore:
+    """Persistent NEOcp poll history shared by all threads of the process.
+
+    ``max_age`` (seconds) bounds the history kept; ``None`` keeps everything.
+    ``tracked_fields`` are the entry fields whose change is recorded; ``None``
+    tracks every field except :data:`VOLATILE_FIELDS`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        compression_level: int = 6,
+        max_age: Optional[float] = None,
+        tracked_fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.compression_level = int(compression_level)
+        self.max_age = max_age
+        self.tracked_fields = None if tracked_fields is None else tuple(tracked_fields)
+        self._pruned_at = float("-inf")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # (designation, kind) -> digest of the stored state; loaded lazily.
+        self._current: Optional[Dict[Tuple[str, str], str]] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _entry_digest(self, entry: Mapping[str, Any]) -> str:
+        if self.tracked_fields is None:
+            tracked = {k: v for k, v in entry.items() if k not in VOLATILE_FIELDS}
+        else:
+            tracked = {field: entry.get(field) for field in self.tracked_fields}
+        return _digest(_encode_entry(tracked))
+
+    def _current_digests(self, conn: sqlite3.Connection) -> Dict[Tuple[str, str], str]:
+        if self._current is None:
+            (last,) = conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM snapshots"
+            ).fetchone()
+            self._current = {
+                (designation, kind): str(digest)
+                for designation, kind, digest in conn.execute(
+                    _LATEST.format(columns="c.digest"), (last,)
+                )
+            }
+        return self._current
+
+    def append(
+        self,
+        data: Iterable[Mapping[str, Any]],
+        ephemerides: Mapping[str, Sequence[str]],
+        fetched: Optional[Timestamp] = None,
+    ) -> Optional[int]:
+        """Record one poll; return its snapshot id, or ``None`` if nothing changed.
+
+        Entries without ``Temp_Desig`` are skipped. An entry is only written
+        when a tracked field changed. Designations missing from
+        ``ephemerides`` keep their previously stored ephemeris.
+        """
+
+        when = time.time() if fetched is None else _unix_time(fetched)
+        payloads: Dict[Tuple[str, str], bytes] = {}
+        digests: Dict[Tuple[str, str], str] = {}
+        for item in data:
+            designation = item.get("Temp_Desig")
+            if not designation:
+                continue
+            designation = str(designation)
+            key = (designation, _ENTRY)
+            payloads[key] = _encode_entry(item)
+            digests[key] = self._entry_digest(item)
+            values = ephemerides.get(designation)
+            if values is not None:
+                key = (designation, _EPHEMERIS)
+                payloads[key] = _encode_ephemeris(values)
+                digests[key] = _digest(payloads[key])
+        present = {designation for designation, _ in payloads}
+
+        with self._lock:
+            conn = self._connection()
+            current = self._current_digests(conn)
+            changed = [key for key in payloads if current.get(key) != digests[key]]
+            removed = [key for key in current if key[0] not in present]
+            if not changed and not removed:
+                return None
+            cursor = conn.execute("INSERT INTO snapshots (fetched) VALUES (?)", (when,))
+            snapshot = int(cursor.lastrowid or 0)
+            rows: List[Tuple[str, str, int, Optional[str], Optional[bytes]]] = [
+                (
+                    designation,
+                    kind,
+                    snapshot,
+                    digests[(designation, kind)],
+                    zlib.compress(
+                        payloads[(designation, kind)], self.compression_level
+                    ),
+                )
+                for designation, kind in changed
+            ]
+            rows.extend(
+                (designation, kind, snapshot, None, None)
+                for designation, kind in removed
+            )
+            conn.executemany(
+                "INSERT INTO changes (designation, kind, snapshot, digest, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+            for key in changed:
+                current[key] = digests[key]
+            for key in removed:
+                del current[key]
+            if self.max_age is not None and when - self._pruned_at >= (
+                PRUNE_INTERVAL_SEC
+            ):
+                self._prune(conn, when - self.max_age)
+                self._pruned_at = when
+            return snapshot
+
+    def prune(self, before: Timestamp) -> int:
+        """Drop the history before ``before``; return the snapshots removed.
+
+        The last snapshot fetched at or before ``before`` is kept and absorbs
+        the rows still current at its time, so :meth:`state_at` is unchanged
+        from then on; :meth:`history` starts there.
+        """
+
+        with self._lock:
+            return self._prune(self._connection(), _unix_time(before))
+
+    def _prune(self, conn: sqlite3.Connection, cutoff: float) -> int:
+        row = conn.execute(
+            "SELECT id FROM snapshots WHERE fetched <= ? "
+            "ORDER BY fetched DESC, id DESC LIMIT 1",
+            (cutoff,),
+        ).fetchone()
+        if row is None:
+            return 0
+        base = int(row[0])
+        # Superseded rows go; the latest one of each key becomes part of base,
+        # where a removal needs no row at all.
+        conn.execute(
+            "DELETE FROM changes WHERE snapshot < (SELECT MAX(c.snapshot) "
+            "FROM changes AS c WHERE c.designation = changes.designation "
+            "AND c.kind = changes.kind AND c.snapshot <= ?)",
+            (base,),
+        )
+        conn.execute(
+            "DELETE FROM changes WHERE snapshot <= ? AND digest IS NULL", (base,)
+        )
+        conn.execute("UPDATE changes SET snapshot = ? WHERE snapshot < ?", (base, base))
+        removed = conn.execute("DELETE FROM snapshots WHERE id < ?", (base,)).rowcount
+        conn.commit()
+        return int(removed)
+
+    def snapshot_times(self) -> List[float]:
+        """Fetch times of every stored snapshot, oldest first."""
+
+        with self._lock:
+            return [
+                float(fetched)
+                for (fetched,) in self._connection().execute(
+                    "SELECT fetched FROM snapshots ORDER BY id"
+                )
+            ]
+
+    def state_at(self, when: Optional[Timestamp] = None) -> NeocpSnapshot:
+        """The NEOcp as of the last snapshot fetched at or before ``when``.
+
+        ``None`` means the latest snapshot; naive datetimes are taken as UTC.
+        """
+
+        with self._lock:
+            conn = self._connection()
+            if when is None:
+                row = conn.execute(
+                    "SELECT id, fetched FROM snapshots ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT id, fetched FROM snapshots WHERE fetched <= ? "
+                    "ORDER BY fetched DESC, id DESC LIMIT 1",
+                    (_unix_time(when),),
+                ).fetchone()
+            if row is None:
+                return NeocpSnapshot(None, [], {})
+            latest = conn.execute(
+                _LATEST.format(columns="c.data"), (int(row[0]),)
+            ).fetchall()
+        entries: Dict[str, Dict[str, Any]] = {}
+        ephemerides: Dict[str, EphemerisValues] = {}
+        for designation, kind, blob in latest:
+            payload = zlib.decompress(bytes(blob))
+            if kind == _ENTRY:
+                entries[designation] = json.loads(payload)
+            else:
+                ephemerides[designation] = _decode_ephemeris(payload)
+        return NeocpSnapshot(
+            float(row[1]),
+            [entries[designation] for designation in sorted(entries)],
+            {d: values for d, values in ephemerides.items() if d in entries},
+        )
+
+    def history(self, designation: str) -> List[NeocpObjectState]:
+        """Every stored change of ``designation``, oldest first."""
+
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT c.snapshot, s.fetched, c.kind, c.data FROM changes AS c "
+                    "JOIN snapshots AS s ON s.id = c.snapshot "
+                    "WHERE c.designation = ? ORDER BY c.snapshot, c.kind",
+                    (designation,),
+                )
+                .fetchall()
+            )
+        states: List[NeocpObjectState] = []
+        entry: Optional[Dict[str, Any]] = None
+        ephemeris: Optional[EphemerisValues] = None
+        previous = None
+        for snapshot, fetched, kind, blob in rows:
+            payload = zlib.decompress(bytes(blob)) if blob is not None else None
+            if kind == _ENTRY:
+                entry = json.loads(payload) if payload is not None else None
+            else:
+                ephemeris = _decode_ephemeris(payload) if payload is not None else None
+            state = NeocpObjectState(float(fetched), entry, ephemeris)
+            if snapshot == previous:
+                states[-1] = state
+            else:
+                states.append(state)
+            previous = snapshot
+        return states
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._current = None
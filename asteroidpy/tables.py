@@ -0,0 +1,95 @@
+"""Column-wise accumulation of result rows into a single ``QTable``."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from astropy import units as u
+from astropy.table import QTable
+
+
+class ColumnarTableBuilder:
+    """Collect rows into per-column lists and build the ``QTable`` once.
+
+    ``QTable.add_row`` copies every column on each call, so filling a table row
+    by row is quadratic; appending to lists and converting at the end is
+    linear. Columns get the given NumPy ``dtypes`` (strings are sized to the
+    longest value) and, where ``units`` names them, become ``Quantity``
+    columns. Empty builders still produce correctly typed zero-length columns.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        Column names, in row order.
+    dtypes : Sequence[Any], optional
+        One NumPy dtype per column (``str``, ``int``, ``float``...). Defaults to
+        ``str`` for every column.
+    units : Mapping[str, astropy.units.UnitBase], optional
+        Units for the named columns. Values may be plain numbers or
+        ``Quantity`` objects convertible to that unit.
+    meta : Dict[str, Any], optional
+        Table metadata (for example ``{"name": ...}``).
+    """
+
+    __slots__ = ("names", "dtypes", "units", "meta", "_columns")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        dtypes: Optional[Sequence[Any]] = None,
+        units: Optional[Mapping[str, u.UnitBase]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if dtypes is None:
+            dtypes = [str] * len(names)
+        if len(dtypes) != len(names):
+            raise ValueError("dtypes must have one entry per column name")
+        self.names = tuple(names)
+        self.dtypes = tuple(dtypes)
+        self.units = dict(units or {})
+        self.meta = dict(meta or {})
+        self._columns: List[List[Any]] = [[] for _ in self.names]
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Add one row; values are given in column order."""
+
+        if len(row) != len(self._columns):
+            raise ValueError(
+                f"row has {len(row)} values, expected {len(self._columns)}"
+            )
+        for column, value in zip(self._columns, row):
+            column.append(value)
+
+    def extend(self, columns: Sequence[Union[Sequence[Any], np.ndarray]]) -> None:
+        """Add many rows given column-wise: one equally long sequence per column."""
+
+        if len(columns) != len(self._columns):
+            raise ValueError(
+                f"got {len(columns)} columns, expected {len(self._columns)}"
+            )
+        if len({len(values) for values in columns}) > 1:
+            raise ValueError("columns must all have the same length")
+        for column, values in zip(self._columns, columns):
+            column.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def build(self) -> QTable:
+        """Return a new ``QTable`` holding every appended row."""
+
+        data: List[Any] = []
+        for name, dtype, values in zip(self.names, self.dtypes, self._columns):
+            unit = self.units.get(name)
+            if unit is None:
+                data.append(np.array(values, dtype=dtype))
+            elif values and any(isinstance(value, u.Quantity) for value in values):
+                data.append(
+                    u.Quantity(
+                        [u.Quantity(value, unit) for value in values], unit
+                    ).astype(dtype)
+                )
+            else:
+                data.append(u.Quantity(np.array(values, dtype=dtype), unit))
+        return QTable(data, names=self.names, meta=self.meta)
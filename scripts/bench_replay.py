@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Time the scheduling pipeline end-to-end against a recorded network cassette.
+
+Usage:
+  python scripts/bench_replay.py record DIR
+  python scripts/bench_replay.py replay DIR [--latency SECONDS] [--runs N]
+
+``record`` runs ``weather_forecast_report``, ``observing_target_list`` and
+``async_neocp_confirmation`` once against the live MPC and 7Timer services and
+saves every response in DIR (see :mod:`asteroidpy.cassette`), together with
+the observation time used for the What's Observable query. ``replay`` runs the
+same calls from DIR with no network access and prints the best wall time of
+``--runs`` runs per call; ``--latency`` adds a fixed delay to every replayed
+response to model a slow link.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from asteroidpy import network, scheduling
+from asteroidpy.cassette import Cassette
+from asteroidpy.observatory import Observatory
+
+METADATA_FILE = "bench_replay.json"
+
+OBSERVATORY = Observatory(
+    name="Bench",
+    latitude=45.0,
+    longitude=9.0,
+    height=100.0,
+    mpc_code="C10",
+    horizon=(10.0, 10.0, 10.0, 10.0),
+)
+
+
+def whatsup_payload(token: str, when: datetime.datetime) -> Dict[str, Any]:
+    return {
+        "utf8": "%E2%9C%93",
+        "authenticity_token": token,
+        "latitude": OBSERVATORY.latitude,
+        "longitude": OBSERVATORY.longitude,
+        "year": when.year,
+        "month": when.month,
+        "day": when.day,
+        "hour": when.hour,
+        "minute": when.minute,
+        "duration": 2,
+        "max_objects": 100,
+        "min_alt": 20,
+        "solar_elong": 60,
+        "lunar_elong": 30,
+        "object_type": "mp",
+        "submit": "Submit",
+    }
+
+
+def pipeline(when: datetime.datetime) -> List[Tuple[str, Callable[[], Any]]]:
+    def target_list() -> Any:
+        token, _ = scheduling.resolve_whatsup_authenticity_token()
+        return scheduling.observing_target_list(
+            OBSERVATORY, whatsup_payload(token, when)
+        )
+
+    def neocp() -> Any:
+        return asyncio.run(scheduling.async_neocp_confirmation(OBSERVATORY, 0, 22.0, 0))
+
+    return [
+        (
+            "weather_forecast_report",
+            lambda: scheduling.weather_forecast_report(OBSERVATORY),
+        ),
+        ("observing_target_list", target_list),
+        ("async_neocp_confirmation", neocp),
+    ]
+
+
+def reset_state() -> None:
+    """Start every run cold: no token, NEOcp validators or memoized ephemerides."""
+
+    scheduling.reset_neocp_poll_state()
+    scheduling.mpc_session().invalidate()
+    scheduling.clear_altaz_cache()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("record", "replay"))
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    # Only the cassette may answer; the response cache would hide requests.
+    network.configure_response_cache(enabled=False)
+    metadata_path = args.directory / METADATA_FILE
+    if args.mode == "record":
+        when = datetime.datetime.now(datetime.UTC).replace(second=0, microsecond=0)
+        cassette = Cassette(args.directory, "record")
+        runs = 1
+    else:
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        when = datetime.datetime.fromisoformat(metadata["when"])
+        cassette = Cassette(args.directory, "replay", latency=args.latency)
+        runs = max(1, args.runs)
+    network.use_cassette(cassette)
+
+    for name, call in pipeline(when):
+        best = float("inf")
+        rows = None
+        for _ in range(runs):
+            reset_state()
+            start = time.perf_counter()
+            result = call()
+            best = min(best, time.perf_counter() - start)
+            rows = len(result) if hasattr(result, "__len__") else None
+        print(f"{name:<26} {best:8.3f} s  ({rows} rows/chars)")
+
+    if args.mode == "record":
+        args.directory.mkdir(parents=True, exist_ok=True)
+        metadata_path.write_text(
+            json.dumps({"when": when.isoformat()}), encoding="utf-8"
+        )
+        print(f"recorded {cassette.recorded} responses in {args.directory}")
+    else:
+        print(f"replayed {cassette.replayed} responses (latency {args.latency} s)")
+
+
+if __name__ == "__main__":
+    main()
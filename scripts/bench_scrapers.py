@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Compare the lxml/XPath and BeautifulSoup What's Observable parsers.
+
+Usage:
+  python scripts/bench_scrapers.py [--objects N] [--save DIR] [PAGE.html ...]
+
+Parses each saved result page (or, without arguments, a generated page shaped
+like MPC's: the search form tables followed by the result table with N
+objects, default 1000) with both backends of :mod:`asteroidpy.mpcparse`,
+checks that they return the same rows and prints the best of five runs.
+``--save DIR`` writes the generated page to DIR for later runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from asteroidpy.mpcparse import ParserBackend, parse_whatsup_results
+
+_FORM_TABLES = "".join(
+    "<table class='form'><tr><td><label>Field {0}</label></td>"
+    "<td><input name='f{0}' value='1'></td></tr></table>".format(i)
+    for i in range(3)
+)
+
+
+def synthetic_page(objects: int) -> bytes:
+    """A What's Observable result page with ``objects`` rows."""
+
+    header = (
+        "<tr><th>Designation</th><th>Mag</th><th>Sol. Elong.</th>"
+        "<th>Lun. Elong.</th><th>Time</th><th>RA</th><th>Dec</th><th>Alt</th>"
+        "<th>Motion</th><th>PA</th></tr>"
+    )
+    rows = []
+    for i in range(objects):
+        rows.append(
+            "<tr>"
+            f"<td><a href='/db_search/show_object?object_id={i}'>({i + 1}) Obj{i}</a></td>"
+            f"<td>{14 + (i % 60) / 10:.1f}</td><td>{90 + i % 80}</td><td>{30 + i % 120}</td>"
+            f"<td>2026 10 17.{i % 100:02d}  <!-- t -->  </td>"
+            f"<td>{i % 24:02d} {i % 60:02d} {i % 57:02d}.{i % 10}</td>"
+            f"<td>{'+' if i % 2 else '-'}{i % 80:02d} {i % 60:02d} {i % 55:02d}</td>"
+            f"<td>{20 + i % 60}</td><td>{0.1 + (i % 30) / 10:.2f}</td><td>{i % 360}</td>"
+            "</tr>"
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        "<title>What's Observable</title></head><body>"
+        f"{_FORM_TABLES}<table class='results'>{header}{''.join(rows)}</table>"
+        "</body></html>"
+    ).encode("utf-8")
+
+
+def best_of(content: bytes, backend: ParserBackend, runs: int = 5) -> Tuple[float, int]:
+    best = float("inf")
+    rows: List[List[str]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = parse_whatsup_results(content, backend)
+        best = min(best, time.perf_counter() - start)
+    return best, len(rows)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--save", type=Path)
+    args = parser.parse_args(argv)
+
+    pages: List[Tuple[str, bytes]] = [(str(p), p.read_bytes()) for p in args.pages]
+    if not pages:
+        page = synthetic_page(args.objects)
+        if args.save:
+            args.save.mkdir(parents=True, exist_ok=True)
+            target = args.save / f"whatsup_{args.objects}.html"
+            target.write_bytes(page)
+            print(f"saved {target}")
+        pages = [(f"synthetic ({args.objects} objects)", page)]
+
+    print(f"{'page':<32} {'rows':>6} {'bs4 (s)':>9} {'lxml (s)':>9} {'speedup':>8}")
+    for name, content in pages:
+        if parse_whatsup_results(content, "bs4") != parse_whatsup_results(
+            content, "lxml"
+        ):
+            print(f"{name}: backends disagree", file=sys.stderr)
+            return 1
+        slow, rows = best_of(content, "bs4")
+        fast, _ = best_of(content, "lxml")
+        print(f"{name:<32} {rows:>6} {slow:>9.4f} {fast:>9.4f} {slow / fast:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Measure AsteroidPy import/startup cost with ``python -X importtime``.
+
+Usage:
+  python scripts/bench_startup.py [MODULE ...] [--runs N]
+
+For each module (default: ``asteroidpy``, ``asteroidpy.interface`` and
+``asteroidpy.scheduling``) a fresh interpreter imports it with ``-X importtime``;
+the best cumulative time of ``--runs`` runs is printed together with the heavy
+third-party packages that ended up imported. ``asteroidpy.interface`` is what the
+CLI loads before the main menu appears.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import List, Set, Tuple
+
+DEFAULT_MODULES = ["asteroidpy", "asteroidpy.interface", "asteroidpy.scheduling"]
+HEAVY_PACKAGES = (
+    "astropy",
+    "astroplan",
+    "astroquery",
+    "bs4",
+    "lxml",
+    "httpx",
+    "requests",
+)
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def measure(module: str) -> Tuple[float, Set[str]]:
+    """Return ``(cumulative seconds, heavy packages imported)`` for one cold import."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    heavy: Set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = match.groups()
+        if len(indent) == 1:
+            # Top-level entries (one space of indentation) sum to the total.
+            total_us += int(cumulative)
+        root = name.split(".", 1)[0]
+        if root in HEAVY_PACKAGES:
+            heavy.add(root)
+    return total_us / 1e6, heavy
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<26} {'best (s)':>9}  heavy imports")
+    for module in args.modules:
+        runs = [measure(module) for _ in range(max(1, args.runs))]
+        best = min(seconds for seconds, _ in runs)
+        heavy = ", ".join(sorted(runs[0][1])) or "-"
+        print(f"{module:<26} {best:>9.3f}  {heavy}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
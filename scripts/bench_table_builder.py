@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare QTable.add_row loops with ColumnarTableBuilder for result tables.
+
+Usage:
+  python scripts/bench_table_builder.py [ROWS ...]
+
+Builds a NEOcp-shaped table (strings, ints, floats and a degree column) with
+both strategies and prints the best of three runs for each size (default 1000
+and 10000 rows).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable, List
+
+from astropy import units as u
+from astropy.table import QTable
+
+from asteroidpy.tables import ColumnarTableBuilder
+
+NAMES = ("Temp_Desig", "Score", "R.A.", "Decl", "Alt", "V", "NObs")
+DTYPES = (str, int, str, str, float, float, int)
+
+
+def _rows(n: int) -> List[List[Any]]:
+    return [
+        [f"P1{i:05d}", 50 + i % 50, "10h00m00s", "+20d00m00s", 30.0, 19.5, 4]
+        for i in range(n)
+    ]
+
+
+def add_row_loop(rows: List[List[Any]]) -> QTable:
+    table = QTable(
+        [[""], [0], [""], [""], [0.0], [0.0], [0]],
+        names=NAMES,
+        meta={"name": "bench"},
+    )
+    for row in rows:
+        table.add_row(row)
+    table.remove_row(0)
+    return table
+
+
+def columnar(rows: List[List[Any]]) -> QTable:
+    builder = ColumnarTableBuilder(
+        NAMES, dtypes=DTYPES, units={"Alt": u.deg}, meta={"name": "bench"}
+    )
+    for row in rows:
+        builder.append(row)
+    return builder.build()
+
+
+def _best_of(fn: Callable[[List[List[Any]]], QTable], rows: List[List[Any]]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: List[str]) -> int:
+    sizes = [int(arg) for arg in argv] or [1000, 10000]
+    print(f"{'rows':>8} {'add_row (s)':>12} {'columnar (s)':>13} {'speedup':>8}")
+    for n in sizes:
+        rows = _rows(n)
+        slow = _best_of(add_row_loop, rows)
+        fast = _best_of(columnar, rows)
+        print(f"{n:>8} {slow:>12.4f} {fast:>13.4f} {slow / fast:>7.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
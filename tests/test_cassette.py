@@ -0,0 +1,113 @@
+import asyncio
+import weakref
+
+import pytest
+
+pytest.importorskip("httpx")
+
+import asteroidpy  # noqa: E402
+from asteroidpy import cassette, network  # noqa: E402
+
+URL = "https://www.7timer.info/bin/api.pl"
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {"content-type": "application/json"}
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+@pytest.fixture(autouse=True)
+def isolated_network(monkeypatch):
+    monkeypatch.setattr(network, "_async_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(network, "_breakers", {})
+    monkeypatch.setattr(network, "_limiters", {})
+    monkeypatch.setattr(network, "_response_cache_enabled", False)
+    monkeypatch.setattr(network, "_cassette", None)
+    monkeypatch.setattr(network, "_cassette_loaded", True)
+
+
+class FakeClient:
+    is_closed = False
+
+    def __init__(self, get):
+        self._get = get
+
+    async def get(self, url, params=None, **kwargs):
+        return self._get(url, params)
+
+
+def test_recorded_responses_replay_without_network(monkeypatch, tmp_path):
+    def fake_get(url, params):
+        return FakeResponse(b'{"lat": "%s"}' % params["lat"].encode())
+
+    monkeypatch.setattr(network, "get_async_client", lambda: FakeClient(fake_get))
+    network.use_cassette(cassette.Cassette(tmp_path, "record"))
+    asyncio.run(network.afetch("GET", URL, params={"lat": "45"}))
+    asyncio.run(network.afetch("GET", URL, params={"lat": "46"}))
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def no_network(url, params):
+        raise AssertionError("replay must not use the network")
+
+    monkeypatch.setattr(network, "get_async_client", lambda: FakeClient(no_network))
+    player = cassette.Cassette(tmp_path, "replay")
+    network.use_cassette(player)
+    response = asyncio.run(network.afetch("GET", URL, params={"lat": "46"}))
+    assert response.status_code == 200 and response.json() == {"lat": "46"}
+    assert network.header_value(response.headers, "Content-Type") == (
+        "application/json"
+    )
+    replayed = asyncio.run(network.afetch("GET", URL, params={"lat": "45"}))
+    assert replayed.json() == {"lat": "45"}
+    assert player.replayed == 2
+
+
+def test_replay_miss_is_a_transport_error(tmp_path):
+    network.use_cassette(cassette.Cassette(tmp_path, "replay"))
+    with pytest.raises(network.httpx.TransportError) as miss:
+        asyncio.run(network.afetch("GET", URL))
+    assert isinstance(miss.value, cassette.CassetteMissError)
+    with pytest.raises(network.httpx.TransportError):
+        asyncio.run(network.afetch("POST", URL, data={"a": "1"}))
+
+
+def test_replay_latency_is_applied(monkeypatch, tmp_path):
+    recorder = cassette.Cassette(tmp_path, "record")
+    recorder.record("GET", URL, None, None, FakeResponse(b"{}"))
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(cassette.asyncio, "sleep", fake_sleep)
+    network.use_cassette(cassette.Cassette(tmp_path, "replay", latency=0.25))
+    asyncio.run(network.afetch("GET", URL))
+    assert slept == [0.25]
+
+
+def test_cassette_from_env(tmp_path):
+    assert cassette.cassette_from_env({}) is None
+    env = {
+        cassette.ENV_MODE: "Replay",
+        cassette.ENV_DIR: str(tmp_path),
+        cassette.ENV_LATENCY: "0.5",
+    }
+    player = cassette.cassette_from_env(env)
+    assert player is not None and player.replaying and player.latency == 0.5
+    with pytest.raises(ValueError):
+        cassette.cassette_from_env({cassette.ENV_MODE: "record"})
+
+
+def test_main_cli_selects_cassette_through_environment(monkeypatch, tmp_path):
+    for name in (cassette.ENV_MODE, cassette.ENV_DIR, cassette.ENV_LATENCY):
+        monkeypatch.setenv(name, "")  # restored (or removed) after the test
+    args = asteroidpy._parse_args(
+        ["--replay", str(tmp_path), "--replay-latency", "0.1"]
+    )
+    asteroidpy._select_cassette(args)
+    assert cassette.cassette_from_env() is not None
+    with pytest.raises(SystemExit):
+        asteroidpy._parse_args(["--record", "a", "--replay", "b"])
@@ -302,3 +302,67 @@ def test_load_config_initializes_when_missing(tmp_home, fresh_config, monkeypatc
 
     assert called["count"] >= 1
     assert os.path.exists(config_file_canonical(tmp_home))
+
+
+def test_load_config_cache_hits_until_file_changes(tmp_home, monkeypatch):
+    canon = config_file_canonical(tmp_home)
+    write_config_file(canon, create_minimal_config_text(lang="en"))
+    cfg.clear_load_config_cache()
+
+    parsed = {"count": 0}
+    original_read = cfg._read_config_file
+
+    def counting_read(parser, path):
+        parsed["count"] += 1
+        return original_read(parser, path)
+
+    monkeypatch.setattr(cfg, "_read_config_file", counting_read)
+
+    first, second = ConfigParser(), ConfigParser()
+    cfg.load_config(first)
+    cfg.load_config(second)
+
+    assert parsed["count"] == 1
+    assert cfg.load_config_cache_info() == cfg.ConfigCacheInfo(hits=1, misses=1)
+    assert second.get("General", "lang") == "en"
+    assert second.get("Observatory", "nord_altitude") == "0"
+
+    write_config_file(canon, create_minimal_config_text(lang="it", place="Milano"))
+    third = ConfigParser()
+    cfg.load_config(third)
+
+    assert parsed["count"] == 2
+    assert third.get("General", "lang") == "it"
+    assert cfg.load_config_cache_info().misses == 2
+
+
+def test_save_config_refreshes_load_config_cache(tmp_home, fresh_config, monkeypatch):
+    cfg.clear_load_config_cache()
+    cfg.initialize(fresh_config)
+    fresh_config["Observatory"]["place"] = "Milano"
+    cfg.save_config(fresh_config)
+
+    def fail_read(parser, path):
+        raise AssertionError("saved file must be served from the cache")
+
+    monkeypatch.setattr(cfg, "_read_config_file", fail_read)
+    reloaded = ConfigParser()
+    cfg.load_config(reloaded)
+
+    assert reloaded.get("Observatory", "place") == "Milano"
+    assert cfg.load_config_cache_info() == cfg.ConfigCacheInfo(hits=1, misses=0)
+
+
+def test_load_config_skips_legacy_probe_when_canonical_exists(
+    tmp_home, fresh_config, monkeypatch
+):
+    write_config_file(config_file_canonical(tmp_home), create_minimal_config_text())
+
+    def fail_migrate():
+        raise AssertionError("legacy migration must not be probed")
+
+    monkeypatch.setattr(cfg, "_migrate_legacy_configuration", fail_migrate)
+    cfg.load_config(fresh_config)
+    cfg.load_config(fresh_config)
+
+    assert fresh_config.has_section("Observatory")
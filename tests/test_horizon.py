@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from asteroidpy.horizon import HorizonProfile
+
+
+def test_from_sectors_matches_cardinal_sector_boundaries():
+    profile = HorizonProfile.from_sectors(north=10, east=20, south=30, west=40)
+    az = np.array([0.0, 44.9, 45.0, 134.9, 135.0, 224.9, 225.0, 314.9, 315.0, 360.0])
+    assert profile.min_altitude(az).tolist() == [
+        10,
+        10,
+        20,
+        20,
+        30,
+        30,
+        40,
+        40,
+        10,
+        10,
+    ]
+    assert profile.is_visible(az, np.full(az.shape, 20.0)).tolist() == [
+        True,
+        True,
+        True,
+        True,
+        False,
+        False,
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_from_points_resamples_with_wraparound():
+    profile = HorizonProfile.from_points([0, 90, 180, 270], [0, 90, 0, 90])
+    assert profile.altitudes.size == 360
+    assert profile.min_altitude(45.0) == pytest.approx(45.5)
+    # Between 270° (90) and 360° (0) the profile wraps through north
+    assert profile.min_altitude(359.0) == pytest.approx(0.5)
+    assert profile.min_altitude(-1.0) == profile.min_altitude(359.0)
+
+
+def test_from_file_reads_csv_with_header_and_comments(tmp_path):
+    path = tmp_path / "horizon.csv"
+    path.write_text(
+        "# site horizon\nazimuth,altitude\n0,5\n90,15 # trees\n\n180;25\n270 35\n",
+        encoding="utf-8",
+    )
+    profile = HorizonProfile.from_file(path, resolution_deg=0.5)
+
+    assert profile.altitudes.size == 720
+    assert profile.min_altitude(90.0) == pytest.approx(15.0, abs=0.1)
+    assert profile.min_altitude(180.0) == pytest.approx(25.0, abs=0.1)
+
+
+def test_from_file_without_samples_raises(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("# nothing here\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        HorizonProfile.from_file(path)
+
+
+def test_profile_is_read_only():
+    profile = HorizonProfile.from_sectors(0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        profile.altitudes[0] = 5.0
+    with pytest.raises(AttributeError):
+        profile.step = 1.0
+
+
+def test_altitude_bounds_bracket_neighbouring_bins():
+    profile = HorizonProfile.from_sectors(north=10, east=20, south=30, west=40)
+
+    low, high = profile.altitude_bounds([90.0, 44.99, 0.0, 90.0], [1.0, 0.5, 0.5, 60.0])
+
+    assert low.tolist() == [20, 10, 10, 10]
+    assert high.tolist() == [20, 20, 10, 40]
@@ -0,0 +1,87 @@
+import pytest
+
+from asteroidpy import httpcache
+from asteroidpy.httpcache import ResponseCache, cache_key
+
+URL = "https://www.7timer.info/bin/api.pl"
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=1000)
+    yield c
+    c.close()
+
+
+def test_cache_key_ignores_field_order_and_authenticity_token():
+    a = cache_key(
+        "post", URL, body={"lat": "45", "lon": "9", "authenticity_token": "x"}
+    )
+    b = cache_key("POST", URL, body="lon=9&authenticity_token=y&lat=45")
+    assert a == b
+    assert a != cache_key("POST", URL, body={"lat": "46", "lon": "9"})
+    assert a != cache_key("GET", URL, params={"lat": "45", "lon": "9"})
+
+
+def test_entries_expire_after_endpoint_ttl(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(httpcache.time, "time", lambda: now[0])
+    cache.ttls = {"https://www.7timer.info/": 60.0}
+    cache.put("k", URL, 200, b'{"ok": true}', {"ETag": '"v1"'})
+
+    now[0] += 59
+    hit = cache.get("k", URL)
+    assert hit is not None and hit.json() == {"ok": True}
+    assert hit.headers == {"ETag": '"v1"'}
+
+    now[0] += 2
+    assert cache.get("k", URL) is None
+    assert cache.stats()[:2] == (1, 1)
+
+
+def test_urls_without_ttl_are_not_stored(cache):
+    cache.put("k", "https://example.com/", 200, b"x")
+    assert cache.stats().entries == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(httpcache.time, "time", lambda: now[0])
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        cache.put(key, URL, 200, b"x" * 400)
+    # "a" was evicted when "c" pushed the total over 1000 bytes
+    assert cache.get("a", URL) is None
+    now[0] += 1
+    assert cache.get("b", URL) is not None  # touch "b" so "c" is older
+    now[0] += 1
+    cache.put("d", URL, 200, b"x" * 400)
+
+    assert cache.get("c", URL) is None
+    assert cache.get("b", URL) is not None
+    stats = cache.stats()
+    assert stats.entries == 2 and stats.size_bytes == 800
+
+
+def test_clear_resets_entries_and_counters(cache):
+    cache.put("k", URL, 200, b"x")
+    cache.get("k", URL)
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 1000)
+
+
+def test_hits_do_not_write_until_the_next_put(cache, monkeypatch):
+    now = [10.0]
+    monkeypatch.setattr(httpcache.time, "time", lambda: now[0])
+    cache.put("a", URL, 200, b"x")
+    conn = cache._connection()
+    writes = conn.total_changes
+    now[0] += 5
+    assert cache.get("a", URL) is not None
+    assert conn.total_changes == writes and not conn.in_transaction
+
+    cache.put("b", URL, 200, b"y")
+    (accessed,) = conn.execute(
+        "SELECT accessed FROM responses WHERE key = 'a'"
+    ).fetchone()
+    assert accessed == 15.0
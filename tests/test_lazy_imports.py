@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+HEAVY = ("astropy", "astroplan", "astroquery", "bs4", "httpx", "requests")
+
+
+def _loaded_after(statement: str) -> list:
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(sorted(m for m in {HEAVY!r} if m in sys.modules)))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return [name for name in out.stdout.strip().split(",") if name]
+
+
+def test_package_and_interface_import_without_heavy_dependencies():
+    assert _loaded_after("import asteroidpy") == []
+    assert _loaded_after("import asteroidpy.interface") == []
+    assert _loaded_after("import asteroidpy.configuration") == []
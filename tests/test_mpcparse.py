@@ -0,0 +1,138 @@
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("bs4")
+
+from asteroidpy import mpcparse  # noqa: E402
+
+CLASSIC = (
+    "<tr><th>Designation</th><th>Mag</th><th>a</th><th>b</th><th>Time</th>"
+    "<th>RA</th><th>Dec</th><th>Alt</th></tr>"
+)
+BEGIN = (
+    "<tr><th>Designation</th><th>Mag</th><th>Sol</th><th>Lun</th>"
+    "<th>Begin Time</th><th>Beg RA</th><th>Beg Dec</th><th>Beg Alt</th></tr>"
+)
+
+
+def page(*tables: str) -> bytes:
+    body = "".join(f"<table>{t}</table>" for t in tables)
+    return f"<html><body>{body}</body></html>".encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", ["lxml", "bs4"])
+def test_result_rows_from_fourth_table(backend):
+    rows = (
+        "<tr><td><a href='#'>(433)</a> Eros</td><td> 11.2 </td><td>x</td><td>y</td>"
+        "<td>2026 10 17.5 <!-- note --> (12:00 UT)</td><td>12 00 00</td>"
+        "<td>-30 00 00</td><td>45</td></tr>"
+        "<tr><td></td><td> </td></tr>"
+    )
+    content = page("", "", "<tr><th>Designation</th></tr>", CLASSIC + rows)
+    assert mpcparse.parse_whatsup_results(content, backend) == [
+        [
+            "(433)Eros",
+            "11.2",
+            "x",
+            "y",
+            "2026 10 17.5(12:00 UT)",
+            "12 00 00",
+            "-30 00 00",
+            "45",
+        ]
+    ]
+
+
+def test_backends_agree_on_extended_layout_and_missing_tables():
+    content = page(BEGIN + "<tr><td>2026 AB</td><td>19.1</td><td>ø</td></tr>")
+    lxml_rows = mpcparse.parse_whatsup_results(content, "lxml")
+    assert lxml_rows == mpcparse.parse_whatsup_results(content, "bs4")
+    assert lxml_rows == [["2026 AB", "19.1", "ø"]]
+
+    no_results = page("<tr><th>Other</th></tr><tr><td>1</td></tr>")
+    assert mpcparse.parse_whatsup_results(no_results) == []
+    assert mpcparse.parse_whatsup_results(b"") == []
+    with pytest.raises(ValueError):
+        mpcparse.parse_whatsup_results(no_results, "html5")  # type: ignore[arg-type]
+
+
+def test_authenticity_token_from_input_meta_or_missing():
+    form = (
+        b"<html><body><form><input type='hidden' name='authenticity_token' "
+        b"value='abc/123='></form></body></html>"
+    )
+    assert mpcparse.parse_authenticity_token(form) == "abc/123="
+    meta = b"<html><head><meta name='csrf-token' content='meta-token'></head></html>"
+    assert mpcparse.parse_authenticity_token(meta) == "meta-token"
+    assert mpcparse.parse_authenticity_token(b"<html></html>") == ""
+
+
+EPHEMERIS = (
+    "<html><body><p><b></b> <b>bad name</b> <b>x-1</b></p>\n"
+    "<b>P21abcD</b> follows\n<pre>\n  Date       UT   R.A.\n  ----\n"
+    "2026 10 17 0000 12 00 00.0 -30 00 00 19.8 1.23 270.1\n"
+    "2026 10 17 0100 12 00 01.0 -30 00 01 19.8 1.23 270.1\n</pre>\n"
+    "<b>SHORT1</b><pre>header\nonly two</pre>"
+    "<b>ONELINE</b><pre> a b c d e </pre>"
+    "<b>Zé9</b><pre>x\ny\n1 2 3 4</pre><b>OPEN1</b><pre>\n1 2 3 4\n"
+)
+
+
+def regex_records(html):
+    import re
+
+    records = []
+    for key, value in re.findall(
+        r"<b>([A-Za-z0-9]+)</b>[\s\S]*?<pre>([\s\S]*?)</pre>", html
+    ):
+        lines = value.strip().split("\n")
+        values = (lines[2] if len(lines) > 2 else lines[0]).split()
+        if len(values) >= 4:
+            records.append((key, values))
+    return records
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64, 10_000])
+def test_ephemeris_scanner_matches_regex_for_any_chunking(size):
+    raw = EPHEMERIS.encode("utf-8")
+    chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+    records = list(mpcparse.scan_neocp_ephemerides(chunks))
+    assert records == regex_records(EPHEMERIS)
+    assert [name for name, _ in records] == ["P21abcD", "ONELINE"]
+    assert records[0][1][:4] == ["2026", "10", "17", "0000"]
+
+
+def test_ephemeris_scanner_reports_records_as_blocks_close():
+    scanner = mpcparse.NeocpEphemerisScanner()
+    assert scanner.feed("<b>A1</b><pre>h\nh\n1 2 3 4") == []
+    assert scanner.feed("</pr") == []
+    assert scanner.feed("e><b>B2") == [("A1", ["1", "2", "3", "4"])]
+    assert scanner.close() == []
+    # close() resets the scanner for the next body
+    assert scanner.feed("<b>C3</b><pre>5 6 7 8</pre>") == [("C3", ["5", "6", "7", "8"])]
+
+
+CONFIRMEPH2_BLOCK = """
+Date       UT      R.A. (J2000) Decl.  Elong.  V        Motion     Object     Sun
+            h m                                      "/min   P.A.  Azi. Alt.  Alt.
+2026 10 17 2100   08 32 44.2 +11 50 04  145.2  20.4   1.23  285.3  123  +25   -34
+2026 10 17 2200   08 32 40.0 -00 30 00  145.3  20.4   1.25  285.1  130  +41   -40  <a href="#">Map</a>
+... Suppressed 2 lines ...
+2026 10 18 0000   08 32 30.1 -12 00 00  145.4  20.5   1.30  284.9  150  +30   -50
+"""
+
+
+def test_ephemeris_series_keeps_every_line():
+    records = list(
+        mpcparse.scan_neocp_ephemerides([f"<b>P21x</b><pre>{CONFIRMEPH2_BLOCK}</pre>"])
+    )
+    [(name, values)] = records
+    assert name == "P21x" and values[12] == "1.23"  # first row, as before
+    series = values.series
+    assert series.dtype == mpcparse.EPHEMERIS_DTYPE and len(series) == 3
+    assert str(series["time"][1]) == "2026-10-17T22:00"
+    assert series["ra"][0] == pytest.approx(15 * (8 + 32 / 60 + 44.2 / 3600))
+    assert series["dec"][1] == pytest.approx(-0.5)
+    assert series["alt"].tolist() == [25.0, 41.0, 30.0]
+    assert series["motion"][2] == pytest.approx(1.30)
+    assert mpcparse.parse_ephemeris_series("no data\n").shape == (0,)
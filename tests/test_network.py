@@ -0,0 +1,79 @@
+import asyncio
+import weakref
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from asteroidpy import network  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_clients(monkeypatch):
+    monkeypatch.setattr(network, "_async_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(network, "_settings", network.HttpClientSettings())
+
+
+async def network_client():
+    return network.get_async_client()
+
+
+def test_async_client_is_shared_within_a_loop_and_closed_by_run():
+    async def grab():
+        return network.get_async_client(), network.get_async_client()
+
+    first, second = asyncio.run(grab())
+    assert first is second
+
+    client = network.run(network_client())
+    assert client.is_closed
+    assert client is not first
+
+
+def test_closed_client_is_replaced():
+    async def scenario():
+        client = network.get_async_client()
+        await network.aclose_async_client()
+        replacement = network.get_async_client()
+        await network.aclose_async_client()
+        return client, replacement
+
+    client, replacement = asyncio.run(scenario())
+    assert client.is_closed and replacement.is_closed
+    assert client is not replacement
+
+
+def test_clients_of_different_loops_share_cookies(monkeypatch):
+    monkeypatch.setattr(network, "_cookies", network.http.cookiejar.CookieJar())
+
+    async def set_cookie():
+        network.get_async_client().cookies.set("_session", "abc", domain="mpc.test")
+
+    async def read_cookie():
+        return network.get_async_client().cookies.get("_session")
+
+    network.run(set_cookie())
+    assert network.run(read_cookie()) == "abc"
+
+
+def test_configure_http_applies_to_new_clients(monkeypatch):
+    created = []
+
+    class RecordingClient:
+        is_closed = False
+
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    monkeypatch.setattr(network.httpx, "AsyncClient", RecordingClient)
+    monkeypatch.setattr(network, "_http2_available", lambda: False)
+    network.configure_http(max_connections=3, http2=True)
+
+    async def grab():
+        return network.get_async_client()
+
+    asyncio.run(grab())
+
+    assert created[0]["limits"].max_connections == 3
+    # HTTP/2 silently falls back without the optional h2 package
+    assert created[0]["http2"] is False
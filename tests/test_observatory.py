@@ -0,0 +1,74 @@
+from configparser import ConfigParser
+
+import pytest
+
+pytest.importorskip("astropy")
+
+from asteroidpy.observatory import Observatory  # noqa: E402
+
+
+@pytest.fixture()
+def config() -> ConfigParser:
+    c = ConfigParser()
+    c["Observatory"] = {
+        "obs_name": "Obs",
+        "latitude": "45.5",
+        "longitude": "9.25",
+        "altitude": "120",
+        "mpc_code": "C10",
+        "nord_altitude": "10",
+        "east_altitude": "20",
+        "south_altitude": "30",
+        "west_altitude": "40",
+    }
+    return c
+
+
+def test_from_config_parses_once(config):
+    obs = Observatory.from_config(config)
+
+    assert obs.name == "Obs"
+    assert obs.latitude == 45.5
+    assert obs.longitude == 9.25
+    assert obs.height == 120.0
+    assert obs.mpc_code == "C10"
+    assert obs.horizon == (10.0, 20.0, 30.0, 40.0)
+    assert obs.location.lat.deg == pytest.approx(45.5)
+    assert obs.location.lon.deg == pytest.approx(9.25)
+
+
+def test_observatory_is_immutable_and_slotted(config):
+    obs = Observatory.from_config(config)
+
+    with pytest.raises(AttributeError):
+        obs.latitude = 0.0
+    with pytest.raises(AttributeError):
+        del obs.mpc_code
+    with pytest.raises(AttributeError):
+        obs.extra = 1
+    assert not hasattr(obs, "__dict__")
+
+
+def test_from_config_rejects_non_numeric_coordinates(config):
+    config["Observatory"]["latitude"] = "north"
+    with pytest.raises(ValueError):
+        Observatory.from_config(config)
+
+
+def test_from_config_uses_horizon_file_when_configured(config, tmp_path):
+    path = tmp_path / "horizon.txt"
+    path.write_text("0 60\n180 60\n", encoding="utf-8")
+    config["Observatory"]["horizon_file"] = str(path)
+
+    obs = Observatory.from_config(config)
+
+    assert obs.horizon_profile.altitudes.size == 360
+    assert bool(obs.horizon_profile.is_visible(90.0, 50.0)) is False
+
+
+def test_from_config_falls_back_to_sectors_for_missing_horizon_file(config, tmp_path):
+    config["Observatory"]["horizon_file"] = str(tmp_path / "missing.txt")
+
+    obs = Observatory.from_config(config)
+
+    assert obs.horizon_profile.altitudes.tolist() == [10, 20, 20, 30, 30, 40, 40, 10]
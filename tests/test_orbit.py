@@ -0,0 +1,84 @@
+import gzip
+
+import numpy as np
+import pytest
+
+pytest.importorskip("astropy")
+pytest.importorskip("erfa")
+
+from astropy import units as u  # noqa: E402
+from astropy.coordinates import EarthLocation  # noqa: E402
+from astropy.time import Time  # noqa: E402
+
+from asteroidpy import orbit  # noqa: E402
+
+# (1) Ceres osculating at 2022-06-10 TDB, in MPCORB layout (values from JPL
+# Horizons, H and G as Horizons used for the ephemeris below).
+CERES_MPCORB = (
+    "00001    3.33  0.12 K226A 321.43713   73.56969   80.26775   10.58713  "
+    "0.0785751  0.21420822   2.7663808  0 MPO000000  7330 125 1801-2022 0.80 "
+    "M-v 30k MPCLINUX   0000 (1) Ceres                   20220610"
+)
+
+# Saved JPL Horizons observer table for Ceres (geocenter, astrometric ICRF):
+# UTC date, RA, Dec (deg), V, elongation (deg), dRA*cosD and dDec ("/h).
+CERES_HORIZONS = [
+    ("2022-06-10", 101.73343, 26.78554, 8.741, 21.9691, 64.31742, -1.85528),
+    ("2022-06-20", 106.56175, 26.59903, 8.672, 16.8989, 65.04421, -4.03596),
+    ("2022-06-30", 111.42655, 26.26772, 8.586, 12.0265, 65.56345, -6.18733),
+    ("2022-07-10", 116.30339, 25.79505, 8.487, 7.6002, 65.81537, -8.26018),
+]
+
+
+def test_two_body_ephemeris_matches_saved_horizons_output():
+    elements = orbit.parse_mpcorb_line(CERES_MPCORB)
+    geocenter = EarthLocation.from_geocentric(0, 0, 0, unit=u.m)
+    dates, ra, dec, v, elong, d_ra, d_dec = map(np.array, zip(*CERES_HORIZONS))
+    table = orbit.ephemeris(elements, geocenter, Time(list(dates), scale="utc"))
+
+    assert table.colnames == [
+        "Date",
+        "RA",
+        "Dec",
+        "Elongation",
+        "V",
+        "Altitude",
+        "Proper motion",
+        "Direction",
+    ]
+    cos_dec = np.cos(np.radians(dec))
+    ra_error = (table["RA"].to_value(u.deg) - ra) * cos_dec * 3600
+    dec_error = (table["Dec"].to_value(u.deg) - dec) * 3600
+    # The 0.3" over 30 days stated in the asteroidpy.orbit docstring
+    assert np.all(np.hypot(ra_error, dec_error) < 0.3)
+    assert table["Elongation"].to_value(u.deg) == pytest.approx(elong, abs=0.01)
+    assert table["V"].to_value(u.mag) == pytest.approx(v, abs=0.01)
+    motion = table["Proper motion"].to_value(u.arcsec / u.hour)
+    assert motion == pytest.approx(np.hypot(d_ra, d_dec), abs=0.5)
+    direction = np.degrees(np.arctan2(d_ra, d_dec))
+    assert table["Direction"].to_value(u.deg) == pytest.approx(direction, abs=0.5)
+
+
+@pytest.mark.parametrize("e", [0.0, 0.1, 0.5, 0.9, 0.99])
+def test_kepler_solver_inverts_keplers_equation(e):
+    mean = np.linspace(-10.0, 10.0, 1001)
+    ecc = orbit.solve_kepler(mean, e)
+    residual = ecc - e * np.sin(ecc) - np.mod(mean, 2 * np.pi)
+    assert np.max(np.abs(residual)) < 1e-10
+    with pytest.raises(ValueError):
+        orbit.solve_kepler(mean, 1.2)
+
+
+def test_read_mpcorb_skips_header_and_reads_gzip(tmp_path):
+    lines = ["MINOR PLANET CENTER ORBIT DATABASE (MPCORB)", "-" * 160]
+    lines += [CERES_MPCORB, "", "not an orbit"]
+    path = tmp_path / "MPCORB.DAT.gz"
+    with gzip.open(path, "wt", encoding="ascii") as handle:
+        handle.write("\n".join(lines) + "\n")
+    [ceres] = orbit.read_mpcorb(path)
+    assert ceres.designation == "(1) Ceres"
+    assert ceres.epoch == 2459740.5  # K226A = 2022 Jun 10, 0h
+    assert (ceres.h, ceres.g) == (3.33, 0.12)
+    assert orbit.designation_keys(" (1)  ceres ") == ["(1) CERES", "1", "CERES"]
+    with pytest.raises(ValueError):
+        orbit.unpack_epoch("X226A")
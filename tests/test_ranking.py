@@ -0,0 +1,42 @@
+import numpy as np
+
+from asteroidpy.ranking import NeocpFeatures, default_neocp_priority, top_k_indices
+
+
+def features(**overrides):
+    base = dict(
+        score=[90.0],
+        v=[19.5],
+        alt=[40.0],
+        peak_alt=[60.0],
+        motion=[1.0],
+        not_seen=[0.5],
+        arc=[0.5],
+    )
+    base.update(overrides)
+    return NeocpFeatures(**{k: np.asarray(v, dtype=float) for k, v in base.items()})
+
+
+def test_top_k_is_best_first_stable_and_bounded():
+    priority = np.array([0.5, 2.0, np.nan, 2.0, 1.0])
+    assert top_k_indices(priority, 3).tolist() == [1, 3, 4]
+    assert top_k_indices(priority, 10).tolist() == [1, 3, 4, 0, 2]
+    assert top_k_indices(priority, 0).tolist() == []
+    assert top_k_indices(np.empty(0), 3).tolist() == []
+
+
+def test_default_priority_rewards_each_feature():
+    (reference,) = default_neocp_priority(features())
+    better = [
+        features(score=[99.0]),
+        features(v=[18.0]),
+        features(alt=[70.0]),
+        features(peak_alt=[80.0]),
+        features(motion=[4.0]),
+        features(not_seen=[1.5]),
+        features(arc=[0.1]),
+    ]
+    for candidate in better:
+        assert default_neocp_priority(candidate)[0] > reference
+    (missing,) = default_neocp_priority(features(v=[np.nan], peak_alt=[np.nan]))
+    assert np.isfinite(missing) and missing < reference
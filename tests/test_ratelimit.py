@@ -0,0 +1,130 @@
+import asyncio
+import time
+import weakref
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from asteroidpy import network  # noqa: E402
+from asteroidpy.ratelimit import (  # noqa: E402
+    HostRateLimiter,
+    Priority,
+    RateLimit,
+    limit_for,
+)
+
+URL = "https://cgi.minorplanetcenter.net/cgi-bin/confirmeph2.cgi"
+
+
+@pytest.fixture(autouse=True)
+def isolated_network(monkeypatch):
+    monkeypatch.setattr(network, "_async_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(network, "_breakers", {})
+    monkeypatch.setattr(network, "_limiters", {})
+    monkeypatch.setattr(network, "_response_cache_enabled", False)
+    monkeypatch.setattr(network, "_cassette", None)
+    monkeypatch.setattr(network, "_cassette_loaded", True)
+
+
+def test_limit_lookup_matches_host_suffixes():
+    limits = {"example.net": RateLimit(1, 1), "api.example.net": RateLimit(5, 5)}
+    assert limit_for("www.example.net", limits) == ("example.net", RateLimit(1, 1))
+    assert limit_for("API.example.net:443", limits)[1] == RateLimit(5, 5)
+    assert limit_for("notexample.net", limits) == ("", None)
+
+
+def test_bucket_allows_burst_then_paces():
+    limiter = HostRateLimiter(rate=20.0, burst=2)
+    start = time.monotonic()
+    waits = [limiter.acquire() for _ in range(4)]
+    assert waits[0] < 0.01 and waits[1] < 0.01
+    # Two more tokens at 20/s take about 0.1 s
+    assert 0.07 <= time.monotonic() - start < 0.5
+
+
+def test_interactive_requests_are_served_before_background():
+    limiter = HostRateLimiter(rate=20.0, burst=1)
+    limiter.acquire()  # drain the bucket
+    order = []
+
+    async def request(name, priority, delay):
+        await asyncio.sleep(delay)
+        await limiter.acquire_async(priority)
+        order.append(name)
+
+    async def scenario():
+        await asyncio.gather(
+            request("bg-1", Priority.BACKGROUND, 0),
+            request("bg-2", Priority.BACKGROUND, 0),
+            request("ui", Priority.INTERACTIVE, 0.01),
+        )
+
+    asyncio.run(scenario())
+    assert order == ["ui", "bg-1", "bg-2"]
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    limiter = HostRateLimiter(rate=5.0, burst=1)
+    limiter.acquire()
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire_async(), timeout=0.01)
+
+    asyncio.run(scenario())
+    assert limiter._queue == []
+
+
+def test_concurrent_identical_requests_share_one_response(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+        content = b"ok"
+
+    class FakeClient:
+        is_closed = False
+
+        async def post(self, url, headers=None, content=None, timeout=None):
+            calls.append(content)
+            await asyncio.sleep(0.02)
+            return FakeResponse()
+
+    monkeypatch.setattr(network, "get_async_client", lambda: FakeClient())
+
+    async def scenario():
+        return await asyncio.gather(
+            *(network.afetch("POST", URL, content="obj=P1") for _ in range(3)),
+            network.afetch("POST", URL, content="obj=P2"),
+        )
+
+    responses = asyncio.run(scenario())
+    assert calls == ["obj=P1", "obj=P2"]
+    assert responses[0] is responses[1] is responses[2]
+
+
+def test_request_priority_context(monkeypatch):
+    seen = []
+
+    class RecordingLimiter:
+        async def acquire_async(self, priority):
+            seen.append(priority)
+
+    class FakeClient:
+        is_closed = False
+
+        async def post(self, url, headers=None, data=None, timeout=None):
+            return type("R", (), {"status_code": 200})()
+
+    monkeypatch.setattr(network, "rate_limiter", lambda url: RecordingLimiter())
+    monkeypatch.setattr(network, "get_async_client", lambda: FakeClient())
+
+    async def scenario():
+        await network.afetch("POST", "https://example.com/form", data={"a": "1"})
+        with network.request_priority(Priority.BACKGROUND):
+            await network.afetch("POST", "https://example.com/form", data={"a": "1"})
+
+    asyncio.run(scenario())
+    assert seen == [Priority.INTERACTIVE, Priority.BACKGROUND]
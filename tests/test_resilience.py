@@ -0,0 +1,252 @@
+import asyncio
+import threading
+import weakref
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from asteroidpy import network, resilience  # noqa: E402
+from asteroidpy.httpcache import ResponseCache  # noqa: E402
+
+URL = "https://www.7timer.info/bin/api.pl"
+
+
+@pytest.fixture(autouse=True)
+def isolated_network(monkeypatch, tmp_path):
+    monkeypatch.setattr(network, "_async_clients", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(network, "_breakers", {})
+    monkeypatch.setattr(network, "_limiters", {})
+    monkeypatch.setattr(network, "_rate_limits", {})
+    monkeypatch.setattr(network, "_policies", dict(resilience.DEFAULT_POLICIES))
+    monkeypatch.setattr(network, "_response_cache_enabled", True)
+    monkeypatch.setattr(
+        network, "_response_cache", ResponseCache(tmp_path / "responses.db")
+    )
+    monkeypatch.setattr(network, "backoff_delay", lambda policy, attempt: 0.0)
+
+
+def mock_client(monkeypatch, handler):
+    client = network.httpx.AsyncClient(transport=network.httpx.MockTransport(handler))
+    monkeypatch.setattr(network, "get_async_client", lambda: client)
+
+
+def afetch(*args, **kwargs):
+    return asyncio.run(network.afetch(*args, **kwargs))
+
+
+def test_policy_lookup_uses_longest_prefix():
+    policies = {
+        "https://a.example/": resilience.EndpointPolicy(read_timeout=1.0),
+        "https://a.example/slow": resilience.EndpointPolicy(read_timeout=9.0),
+    }
+    assert resilience.policy_for("https://a.example/slow/x", policies).read_timeout == 9
+    assert resilience.policy_for("https://a.example/x", policies).read_timeout == 1
+    assert resilience.policy_for("https://b.example/", policies) == (
+        resilience.EndpointPolicy()
+    )
+
+
+def test_backoff_is_exponential_capped_and_jittered():
+    policy = resilience.EndpointPolicy(backoff_base=1.0, backoff_max=4.0)
+    for attempt, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (6, 4.0)]:
+        delay = resilience.backoff_delay(policy, attempt)
+        assert cap / 2 <= delay <= cap
+
+
+def test_breaker_opens_half_opens_and_closes(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = resilience.CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] += 30
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial request at a time
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.failures == 0
+
+
+def test_fetch_retries_transient_failures(monkeypatch):
+    replies = [
+        network.httpx.ConnectError("reset"),
+        network.httpx.Response(503),
+        network.httpx.Response(200, content=b'{"ok": true}'),
+    ]
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"])
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    mock_client(monkeypatch, handler)
+    response = afetch("GET", URL)
+    assert response.status_code == 200 and not replies
+    assert (timeouts[0]["connect"], timeouts[0]["read"]) == (5.0, 20.0)
+    assert network.circuit_breaker(URL).state == "closed"
+
+
+def test_post_is_not_retried_unless_policy_allows(monkeypatch):
+    calls = []
+
+    def failing(request):
+        calls.append(request.url)
+        raise network.httpx.ConnectError("down")
+
+    mock_client(monkeypatch, failing)
+    with pytest.raises(network.httpx.ConnectError):
+        afetch("POST", URL, data={"a": 1})
+    assert len(calls) == 1
+
+    mpc = "https://www.minorplanetcenter.net/whatsup/index"
+    with pytest.raises(network.httpx.ConnectError):
+        afetch("POST", mpc, data={"a": 1})
+    assert len(calls) == 4
+
+
+def test_open_breaker_fails_fast_or_serves_stale_cache(monkeypatch):
+    calls = []
+    up = [True]
+
+    def handler(request):
+        calls.append(request.url.params)
+        if not up[0]:
+            raise network.httpx.ConnectTimeout("timeout")
+        return network.httpx.Response(200, content=b"cached")
+
+    mock_client(monkeypatch, handler)
+    network.configure_endpoint_policy(URL, retries=0, failure_threshold=2)
+    assert afetch("GET", URL, params={"q": 1}).content == b"cached"
+
+    up[0] = False
+    for _ in range(2):
+        with pytest.raises(network.httpx.ConnectTimeout):
+            afetch("GET", URL, params={"q": 2})
+    assert network.circuit_breaker(URL).state == "open"
+    sent = len(calls)
+
+    with pytest.raises(resilience.CircuitOpenError):
+        afetch("GET", URL, params={"q": 2})
+    stale = afetch("GET", URL, params={"q": 1}, bypass_cache=True)
+    assert stale.content == b"cached"
+    assert len(calls) == sent
+
+
+def test_astream_retries_before_the_body_then_caches_it(monkeypatch):
+    url = "https://cgi.minorplanetcenter.net/cgi-bin/confirmeph2.cgi"
+    statuses = [503, 200]
+
+    def handler(request):
+        return network.httpx.Response(statuses.pop(0), content=b"x" * 100)
+
+    client = network.httpx.AsyncClient(transport=network.httpx.MockTransport(handler))
+    monkeypatch.setattr(network, "get_async_client", lambda: client)
+    network.configure_endpoint_policy(url, backoff_base=0.0, backoff_max=0.0)
+    monkeypatch.setattr(network, "STREAM_CHUNK_SIZE", 30)
+
+    async def body():
+        return [chunk async for chunk in network.astream("POST", url, content="q")]
+
+    assert b"".join(asyncio.run(body())) == b"x" * 100 and not statuses
+    # Served from the cache in STREAM_CHUNK_SIZE pieces, without a request
+    assert [len(chunk) for chunk in asyncio.run(body())] == [30, 30, 30, 10]
+
+
+def test_cancelled_half_open_trial_releases_the_breaker(monkeypatch):
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    client = network.httpx.AsyncClient(transport=network.httpx.MockTransport(hang))
+    monkeypatch.setattr(network, "get_async_client", lambda: client)
+    network.configure_endpoint_policy(URL, failure_threshold=1, reset_timeout=0.0)
+    breaker = network.circuit_breaker(URL)
+    breaker.record_failure()
+    assert breaker.state == "half-open"
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(network.afetch("GET", URL), 0.05))
+    assert breaker.allow()  # the next caller gets the trial
+    breaker.release_trial()
+
+    def broken(request):
+        raise network.httpx.DecodingError("truncated")
+
+    mock_client(monkeypatch, broken)
+    with pytest.raises(network.httpx.DecodingError):
+        afetch("GET", URL)
+    assert breaker.state == "half-open" and breaker.allow()
+
+
+def test_astream_shares_the_trial_handling(monkeypatch):
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    client = network.httpx.AsyncClient(transport=network.httpx.MockTransport(hang))
+    monkeypatch.setattr(network, "get_async_client", lambda: client)
+    network.configure_endpoint_policy(URL, failure_threshold=1, reset_timeout=0.0)
+    breaker = network.circuit_breaker(URL)
+    breaker.record_failure()
+
+    async def body():
+        return [chunk async for chunk in network.astream("GET", URL)]
+
+    async def cancelled():
+        await asyncio.wait_for(body(), 0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(cancelled())
+    assert breaker.allow()
+
+
+def test_a_failed_request_counts_once_however_many_retries(monkeypatch):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        raise network.httpx.ConnectError("down")
+
+    client = network.httpx.AsyncClient(transport=network.httpx.MockTransport(handler))
+    monkeypatch.setattr(network, "get_async_client", lambda: client)
+    network.configure_endpoint_policy(URL, backoff_base=0.0, backoff_max=0.0)
+    breaker = network.circuit_breaker(URL)
+
+    for failed in (1, 2):
+        with pytest.raises(network.httpx.ConnectError):
+            asyncio.run(network.afetch("GET", URL))
+        assert breaker.failures == failed and breaker.state == "closed"
+    assert len(sent) == 6  # retries=2: three attempts per request
+    with pytest.raises(network.httpx.ConnectError):
+        asyncio.run(network.afetch("GET", URL))
+    assert breaker.state == "open"
+
+
+def test_response_cache_is_used_off_the_event_loop(monkeypatch):
+    cache = network.response_cache()
+    threads = []
+    for name in ("get", "put"):
+        method = getattr(cache, name)
+
+        def spy(*args, _method=method, _name=name, **kwargs):
+            threads.append((_name, threading.get_ident()))
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, spy)
+    mock_client(monkeypatch, lambda request: network.httpx.Response(200, text="{}"))
+
+    afetch("GET", URL)
+    assert afetch("GET", URL).json() == {}
+    assert [name for name, _ in threads] == ["get", "put", "get"]
+    assert threading.get_ident() not in {ident for _, ident in threads}
@@ -1,22 +1,58 @@
 import asyncio
+import contextlib
+import datetime
+import json
+import threading
+import weakref
 from configparser import ConfigParser
 from typing import Any, Dict, List
 
 import httpx
+import numpy as np
 import pytest
-import requests
 
 
 class FakeRequestsSuccessResponse:
     """Minimal response object for ``observing_target_list_scraper`` mocks."""
 
+    headers: Dict[str, str] = {}
+
     def __init__(self, content: bytes, status_code: int = 200) -> None:
         self.content = content
         self.status_code = status_code
 
+    def json(self) -> Any:
+        return json.loads(self.content)
+
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
-            raise requests.HTTPError(response=None)
+            request = httpx.Request("POST", "https://mpc")
+            raise httpx.HTTPStatusError("error", request=request, response=None)
+
+
+def patch_async_client(monkeypatch, sch, get=None, post=None):
+    """Route the shared async client's GET/POST calls to plain functions."""
+
+    class FakeAsyncClient:
+        is_closed = False
+
+        async def get(self, url, **kwargs):
+            return get(url, **kwargs)
+
+        async def post(self, url, **kwargs):
+            return post(url, **kwargs)
+
+        async def aclose(self):
+            pass
+
+    monkeypatch.setattr(sch.httpx, "AsyncClient", lambda *a, **k: FakeAsyncClient())
+
+
+def async_returning(value):
+    async def fake(*args, **kwargs):
+        return value
+
+    return fake
 
 
 @pytest.fixture(scope="module")
@@ -27,7 +63,6 @@ def sch():
     pytest.importorskip("astroquery")
     pytest.importorskip("bs4")
     pytest.importorskip("httpx")
-    pytest.importorskip("requests")
 
     import importlib
 
@@ -40,6 +75,25 @@ def no_load_config(monkeypatch, sch):
     monkeypatch.setattr(sch.configuration, "load_config", lambda conf: None)
 
 
+@pytest.fixture(autouse=True)
+def fresh_network(monkeypatch, sch):
+    # Each test starts without pooled clients (monkeypatched classes take effect)
+    monkeypatch.setattr(sch.network, "_async_clients", weakref.WeakKeyDictionary())
+    # No persistent response cache or NEOcp history unless a test opts in
+    monkeypatch.setattr(sch.network, "_response_cache_enabled", False)
+    monkeypatch.setattr(sch, "_neocp_snapshots_enabled", False)
+    # ...and no validators or memoized ephemerides from earlier NEOcp polls
+    sch.reset_neocp_poll_state()
+    # ...and with every circuit breaker closed
+    sch.network.reset_circuit_breakers()
+    sch.network.reset_rate_limiters()
+    # ...talking to the (mocked) network, not a cassette
+    monkeypatch.setattr(sch.network, "_cassette", None)
+    monkeypatch.setattr(sch.network, "_cassette_loaded", True)
+    # ...or MPC form tokens
+    monkeypatch.setattr(sch, "_mpc_session", sch.MpcSession())
+
+
 @pytest.fixture()
 def fresh_config() -> ConfigParser:
     c = ConfigParser()
@@ -101,10 +155,10 @@ def test_httpx_get_and_post(monkeypatch, sch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def get(self, url, params=None):
+        async def get(self, url, params=None, headers=None, timeout=None):
             return DummyResponse({"url": url, "params": params})
 
-        async def post(self, url, data=None, headers=None):
+        async def post(self, url, data=None, headers=None, timeout=None):
             return DummyResponse({"url": url, "data": data})
 
     monkeypatch.setattr(sch.httpx, "AsyncClient", lambda *a, **k: DummyAsyncClient())
@@ -140,10 +194,10 @@ def test_httpx_get_post_non_200(monkeypatch, sch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def get(self, url, params=None):
+        async def get(self, url, params=None, headers=None, timeout=None):
             return DummyResponse({"error": "not found"}, 404, "Not Found")
 
-        async def post(self, url, data=None, headers=None):
+        async def post(self, url, data=None, headers=None, timeout=None):
             return DummyResponse({"error": "bad request"}, 400, "Bad Request")
 
     monkeypatch.setattr(sch.httpx, "AsyncClient", lambda *a, **k: DummyAsyncClient())
@@ -169,7 +223,7 @@ def test_httpx_get_post_exception(monkeypatch, sch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def get(self, url, params=None):
+        async def get(self, url, params=None, headers=None, timeout=None):
             raise httpx.RequestError("boom", request=None)
 
         async def post(self, url, data=None, headers=None, **_kwargs):
@@ -252,6 +306,113 @@ def test_is_visible_quadrants_and_boundaries(fresh_config, monkeypatch, sch):
     )
 
 
+def test_is_visible_many_matches_scalar_is_visible(fresh_config, sch):
+    fresh_config["Observatory"]["east_altitude"] = "25"
+    fresh_config["Observatory"]["west_altitude"] = "5"
+    rng = np.random.default_rng(42)
+    ra = rng.uniform(0.0, 360.0, 40)
+    dec = rng.uniform(-60.0, 85.0, 40)
+    when = sch.Time("2025-03-01T22:00:00")
+
+    batch = sch.is_visible_many(fresh_config, ra, dec, when)
+
+    expected = [
+        sch.is_visible(fresh_config, sch.SkyCoord(r * sch.u.deg, d * sch.u.deg), when)
+        for r, d in zip(ra, dec)
+    ]
+    assert batch.dtype == bool
+    assert batch.tolist() == expected
+    assert batch.any() and not batch.all()
+
+
+def test_is_visible_many_accepts_sexagesimal_strings_and_per_row_times(
+    fresh_config, sch
+):
+    times = sch.Time(["2025-03-01T22:00:00", "2025-03-02T10:00:00"])
+    batch = sch.is_visible_many(
+        fresh_config, ["12 00 00", "12 00 00"], ["+60 00 00", "+60 00 00"], times
+    )
+    scalar = [sch.is_visible(fresh_config, ["12 00 00", "+60 00 00"], t) for t in times]
+    assert batch.tolist() == scalar
+
+
+def test_scheduling_accepts_observatory_without_reloading_config(
+    monkeypatch, fresh_config, sch
+):
+    observatory = sch.Observatory.from_config(fresh_config)
+
+    def fail_load(conf):
+        raise AssertionError("load_config must not run for an Observatory")
+
+    monkeypatch.setattr(sch.configuration, "load_config", fail_load)
+    assert sch.resolve_observatory(observatory) is observatory
+    when = sch.Time("2025-03-01T22:00:00")
+    batch = sch.is_visible_many(observatory, [10.0, 200.0], [80.0, -80.0], when)
+    assert batch.tolist() == [True, False]
+    assert sch.is_visible(observatory, ["00 40 00", "+80 00 00"], when) is True
+
+
+def test_is_visible_many_empty_input(fresh_config, sch):
+    batch = sch.is_visible_many(fresh_config, [], [], sch.Time.now())
+    assert batch.shape == (0,)
+
+
+def test_observing_target_list_checks_visibility_in_one_batch(
+    monkeypatch, fresh_config, sch
+):
+    rows: List[List[str]] = [
+        [
+            "2025 A%d" % i,
+            "18.2",
+            "x",
+            "y",
+            "2025-01-01T00:00z",
+            "12 00 00",
+            "+10 00 00",
+            "45",
+        ]
+        for i in range(5)
+    ]
+    calls: List[int] = []
+
+    def fake_is_visible_many(config, ra, dec, t, fast=False):
+        calls.append(len(ra))
+        return np.array([True, False, True, False, True])
+
+    monkeypatch.setattr(
+        sch, "async_observing_target_list_scraper", async_returning(rows)
+    )
+    monkeypatch.setattr(sch, "is_visible_many", fake_is_visible_many)
+
+    table = sch.observing_target_list(fresh_config, {"dummy": "1"})
+
+    assert calls == [5]
+    assert list(table["Designation"]) == ["2025 A0", "2025 A2", "2025 A4"]
+
+
+def test_observing_target_list_post_processing_runs_off_the_event_loop(
+    monkeypatch, fresh_config, sch
+):
+    row = ["2025 A1", "18.2", "x", "y", "2025-01-01T00:00z", "12 00 00", "+10 00", "45"]
+    threads: List[int] = []
+
+    def fake_is_visible_many(config, ra, dec, t, fast=False):
+        threads.append(threading.get_ident())
+        return np.ones(len(ra), dtype=bool)
+
+    monkeypatch.setattr(
+        sch, "async_observing_target_list_scraper", async_returning([row])
+    )
+    monkeypatch.setattr(sch, "is_visible_many", fake_is_visible_many)
+
+    async def run():
+        table = await sch.async_observing_target_list(fresh_config, {})
+        return table, threading.get_ident()
+
+    table, loop_thread = asyncio.run(run())
+    assert len(table) == 1 and threads and threads[0] != loop_thread
+
+
 def test_observing_target_list_scraper_parses_table(monkeypatch, sch):
     # Construct HTML with at least 4 tables, the fourth containing headers and a row
     html = (
@@ -266,10 +427,8 @@ def test_observing_target_list_scraper_parses_table(monkeypatch, sch):
         "</body></html>"
     ).encode("utf-8")
 
-    monkeypatch.setattr(
-        sch.requests,
-        "post",
-        lambda url, data=None, params=None, **kwargs: FakeRequestsSuccessResponse(html),
+    patch_async_client(
+        monkeypatch, sch, post=lambda url, **kwargs: FakeRequestsSuccessResponse(html)
     )
 
     data = sch.observing_target_list_scraper("https://mpc", {"k": "v"})
@@ -302,8 +461,14 @@ def test_observing_target_list_filters_and_formats(monkeypatch, fresh_config, sc
             "45",
         ]
     ]
-    monkeypatch.setattr(sch, "observing_target_list_scraper", lambda url, payload: rows)
-    monkeypatch.setattr(sch, "is_visible", lambda config, coord, t: True)
+    monkeypatch.setattr(
+        sch, "async_observing_target_list_scraper", async_returning(rows)
+    )
+    monkeypatch.setattr(
+        sch,
+        "is_visible_many",
+        lambda config, ra, dec, t, fast=False: np.ones(len(ra), dtype=bool),
+    )
 
     table = sch.observing_target_list(fresh_config, {"dummy": "1"})
 
@@ -339,8 +504,14 @@ def test_observing_target_list_includes_new_mpc_time_strings(
             "13.5",
         ],
     ]
-    monkeypatch.setattr(sch, "observing_target_list_scraper", lambda url, payload: rows)
-    monkeypatch.setattr(sch, "is_visible", lambda config, coord, t: True)
+    monkeypatch.setattr(
+        sch, "async_observing_target_list_scraper", async_returning(rows)
+    )
+    monkeypatch.setattr(
+        sch,
+        "is_visible_many",
+        lambda config, ra, dec, t, fast=False: np.ones(len(ra), dtype=bool),
+    )
 
     table = sch.observing_target_list(fresh_config, {"dummy": "1"})
     assert len(table) == 1
@@ -348,10 +519,8 @@ def test_observing_target_list_includes_new_mpc_time_strings(
 
 def test_observing_target_list_scraper_no_tables(monkeypatch, sch):
     html = b"<html><body><p>No tables here</p></body></html>"
-    monkeypatch.setattr(
-        sch.requests,
-        "post",
-        lambda url, data=None, params=None, **kwargs: FakeRequestsSuccessResponse(html),
+    patch_async_client(
+        monkeypatch, sch, post=lambda url, **kwargs: FakeRequestsSuccessResponse(html)
     )
 
     data = sch.observing_target_list_scraper("https://mpc", {"k": "v"})
@@ -368,10 +537,8 @@ def test_observing_target_list_scraper_tables_without_expected_headers(
         "<table><tr><th>C</th><th>D</th></tr><tr><td>3</td><td>4</td></tr></table>"
         "</body></html>"
     ).encode("utf-8")
-    monkeypatch.setattr(
-        sch.requests,
-        "post",
-        lambda url, data=None, params=None, **kwargs: FakeRequestsSuccessResponse(html),
+    patch_async_client(
+        monkeypatch, sch, post=lambda url, **kwargs: FakeRequestsSuccessResponse(html)
     )
 
     data = sch.observing_target_list_scraper("https://mpc", {"k": "v"})
@@ -393,8 +560,14 @@ def test_observing_target_list_skips_malformed_rows(monkeypatch, fresh_config, s
             "45",
         ],
     ]
-    monkeypatch.setattr(sch, "observing_target_list_scraper", lambda url, payload: rows)
-    monkeypatch.setattr(sch, "is_visible", lambda config, coord, t: True)
+    monkeypatch.setattr(
+        sch, "async_observing_target_list_scraper", async_returning(rows)
+    )
+    monkeypatch.setattr(
+        sch,
+        "is_visible_many",
+        lambda config, ra, dec, t, fast=False: np.ones(len(ra), dtype=bool),
+    )
 
     table = sch.observing_target_list(fresh_config, {"dummy": "1"})
     assert len(table) == 0
@@ -417,8 +590,8 @@ def test_neocp_confirmation_returns_table_even_when_filtering_all(
         }
     ]
 
-    async def fake_httpx_get(url: str, payload: Dict[str, Any], return_type: str):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         return {
@@ -440,9 +613,13 @@ def test_neocp_confirmation_returns_table_even_when_filtering_all(
             ]
         }
 
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     tbl = sch.neocp_confirmation(
         fresh_config, min_score=100, max_magnitude=20, min_altitude=20
@@ -479,8 +656,8 @@ def test_neocp_confirmation_includes_valid_object(monkeypatch, fresh_config, sch
         }
     ]
 
-    async def fake_httpx_get(url, payload, return_type):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         return {
@@ -503,9 +680,13 @@ def test_neocp_confirmation_includes_valid_object(monkeypatch, fresh_config, sch
         }
 
     # Ensure visibility gate passes deterministically
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     # Altitude depends on current UTC; allow slightly below-horizon so the row is included
     # regardless of time-of-day.
@@ -539,8 +720,8 @@ def test_neocp_confirmation_raises_when_event_loop_running(
         }
     ]
 
-    async def fake_httpx_get(url, payload, return_type):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         return {
@@ -562,9 +743,13 @@ def test_neocp_confirmation_raises_when_event_loop_running(
             ]
         }
 
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     async def call_sync_from_async():
         sch.neocp_confirmation(
@@ -589,8 +774,8 @@ def test_async_neocp_confirmation_matches_sync_wrapper(monkeypatch, fresh_config
         }
     ]
 
-    async def fake_httpx_get(url, payload, return_type):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         return {
@@ -612,9 +797,13 @@ def test_async_neocp_confirmation_matches_sync_wrapper(monkeypatch, fresh_config
             ]
         }
 
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     sync_tbl = sch.neocp_confirmation(
         fresh_config, min_score=50, max_magnitude=19.0, min_altitude=-30
@@ -783,8 +972,8 @@ def test_neocp_confirmation_skips_zero_velocity_objects(monkeypatch, fresh_confi
         }
     ]
 
-    async def fake_httpx_get(url, payload, return_type):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         # Return zero velocity which should cause the object to be skipped
@@ -807,9 +996,13 @@ def test_neocp_confirmation_skips_zero_velocity_objects(monkeypatch, fresh_confi
             ]
         }
 
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     tbl = sch.neocp_confirmation(
         fresh_config, min_score=50, max_magnitude=19.0, min_altitude=0
@@ -836,16 +1029,20 @@ def test_neocp_confirmation_handles_missing_ephemeris_data(
         }
     ]
 
-    async def fake_httpx_get(url, payload, return_type):
-        return [sample, 200]
+    async def fake_poll_neocp_json():
+        return sample, True
 
     async def fake_get_neocp_ephemeris(config, object_names):
         # Return empty dict or object with insufficient data
         return {}
 
-    monkeypatch.setattr(sch, "httpx_get", fake_httpx_get)
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
     monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
-    monkeypatch.setattr(sch, "is_visible", lambda c, coord, t: True)
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
 
     tbl = sch.neocp_confirmation(
         fresh_config, min_score=50, max_magnitude=19.0, min_altitude=0
@@ -877,9 +1074,17 @@ def test_get_neocp_ephemeris_parses_response_correctly(monkeypatch, fresh_config
     """
 
     class MockResponse:
+        status_code = 200
+        headers = {}
+
         def __init__(self, text):
             self.text = text
 
+        async def aiter_bytes(self):
+            # Split mid-tag to exercise the scanner's chunk boundaries
+            for start in range(0, len(self.text), 7):
+                yield self.text[start : start + 7].encode()
+
     class MockAsyncClient:
         def __init__(self, text):
             self._text = text
@@ -890,8 +1095,9 @@ def test_get_neocp_ephemeris_parses_response_correctly(monkeypatch, fresh_config
         async def __aexit__(self, *args):
             pass
 
-        async def post(self, *args, **kwargs):
-            return MockResponse(self._text)
+        @contextlib.asynccontextmanager
+        async def stream(self, *args, **kwargs):
+            yield MockResponse(self._text)
 
     def make_client(*args, **kwargs):
         return MockAsyncClient(sample_html)
@@ -925,9 +1131,17 @@ def test_get_neocp_ephemeris_handles_insufficient_data(monkeypatch, fresh_config
     """
 
     class MockResponse:
+        status_code = 200
+        headers = {}
+
         def __init__(self, text):
             self.text = text
 
+        async def aiter_bytes(self):
+            # Split mid-tag to exercise the scanner's chunk boundaries
+            for start in range(0, len(self.text), 7):
+                yield self.text[start : start + 7].encode()
+
     class MockAsyncClient:
         def __init__(self, text):
             self._text = text
@@ -938,8 +1152,9 @@ def test_get_neocp_ephemeris_handles_insufficient_data(monkeypatch, fresh_config
         async def __aexit__(self, *args):
             pass
 
-        async def post(self, *args, **kwargs):
-            return MockResponse(self._text)
+        @contextlib.asynccontextmanager
+        async def stream(self, *args, **kwargs):
+            yield MockResponse(self._text)
 
     def make_client(*args, **kwargs):
         return MockAsyncClient(sample_html)
@@ -950,3 +1165,639 @@ def test_get_neocp_ephemeris_handles_insufficient_data(monkeypatch, fresh_config
 
     # Should return empty dict because insufficient data is skipped
     assert result == {}
+
+
+def test_altaz_cache_reuses_frames_and_transforms(fresh_config, sch):
+    sch.clear_altaz_cache()
+    observatory = sch.Observatory.from_config(fresh_config)
+    when = sch.Time("2025-03-01T22:00:00")
+    ra, dec = [10.0, 120.0, 250.0], [40.0, -5.0, 70.0]
+
+    first = sch.is_visible_many(observatory, ra, dec, when)
+    second = sch.is_visible_many(observatory, ra, dec, when)
+    info = sch.altaz_cache_info()
+
+    assert first.tolist() == second.tolist()
+    assert (info.transforms.hits, info.transforms.misses) == (1, 1)
+    assert info.frames.hits == 1 and info.frames.currsize == 1
+    # A different epoch is a new key
+    sch.is_visible_many(observatory, ra, dec, sch.Time("2025-03-02T22:00:00"))
+    assert sch.altaz_cache_info().transforms.misses == 2
+
+    sch.clear_altaz_cache()
+    assert sch.altaz_cache_info().transforms == (
+        0,
+        0,
+        sch.ALTAZ_TRANSFORM_CACHE_SIZE,
+        0,
+    )
+
+
+def test_altaz_transform_cache_is_bounded(fresh_config, sch, monkeypatch):
+    monkeypatch.setattr(sch, "_altaz_transform_cache", sch._LRUCache(2))
+    location = sch.Observatory.from_config(fresh_config).location
+    when = sch.Time("2025-03-01T22:00:00")
+    coords = [sch.SkyCoord(r * sch.u.deg, 0 * sch.u.deg) for r in (0, 90, 180)]
+
+    for coord in coords:
+        sch.transform_to_altaz(coord, location, when)
+    sch.transform_to_altaz(coords[0], location, when)
+
+    info = sch.altaz_cache_info().transforms
+    assert info.currsize == 2
+    assert (info.hits, info.misses) == (0, 4)
+
+
+def test_approx_altaz_within_documented_error(sch):
+    from asteroidpy.fastaltaz import FAST_ALTAZ_MAX_ERROR_DEG, approx_altaz
+
+    rng = np.random.default_rng(7)
+    location = sch.EarthLocation.from_geodetic(
+        -70.4 * sch.u.deg, -24.6 * sch.u.deg, 2600 * sch.u.m
+    )
+    ra = rng.uniform(0.0, 360.0, 500)
+    dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 500)))
+    times = sch.Time("2024-06-01T00:00:00") + rng.uniform(0.0, 365.0, 500) * sch.u.day
+    exact = sch.SkyCoord(ra * sch.u.deg, dec * sch.u.deg).transform_to(
+        sch.AltAz(obstime=times, location=location)
+    )
+
+    az, alt = approx_altaz(ra, dec, -24.6, -70.4, times.utc.jd)
+
+    assert np.abs(alt - exact.alt.deg).max() < FAST_ALTAZ_MAX_ERROR_DEG
+    daz = np.abs((az - exact.az.deg + 180.0) % 360.0 - 180.0)
+    assert (daz * np.cos(np.radians(exact.alt.deg))).max() < FAST_ALTAZ_MAX_ERROR_DEG
+
+
+def test_is_visible_many_fast_matches_exact_and_refines_only_borderline(
+    monkeypatch, fresh_config, sch
+):
+    fresh_config["Observatory"]["east_altitude"] = "25"
+    fresh_config["Observatory"]["south_altitude"] = "0"
+    observatory = sch.Observatory.from_config(fresh_config)
+    rng = np.random.default_rng(3)
+    ra = rng.uniform(0.0, 360.0, 300)
+    dec = rng.uniform(-60.0, 85.0, 300)
+    when = sch.Time("2025-03-01T22:00:00")
+    exact = sch.is_visible_many(observatory, ra, dec, when)
+
+    refined: List[int] = []
+    original = sch._exact_visible
+
+    def spy(obs, coords, times):
+        refined.append(coords.size)
+        return original(obs, coords, times)
+
+    monkeypatch.setattr(sch, "_exact_visible", spy)
+    fast = sch.is_visible_many(observatory, ra, dec, when, fast=True)
+
+    assert fast.tolist() == exact.tolist()
+    assert sum(refined) < 10
+
+
+def test_is_visible_many_fast_refines_targets_on_the_horizon(fresh_config, sch):
+    observatory = sch.Observatory.from_config(fresh_config)
+    when = sch.Time("2025-03-01T22:00:00")
+    location = observatory.location
+    # Targets placed exactly on the 10° horizon, just above and just below it
+    on_horizon = sch.SkyCoord(
+        az=[100.0, 100.0, 100.0] * sch.u.deg,
+        alt=[10.0, 10.001, 9.999] * sch.u.deg,
+        frame=sch.AltAz(obstime=when, location=location),
+    ).icrs
+
+    fast = sch.is_visible_many(
+        observatory, on_horizon.ra, on_horizon.dec, when, fast=True
+    )
+    exact = sch.is_visible_many(observatory, on_horizon.ra, on_horizon.dec, when)
+
+    assert fast.tolist() == exact.tolist()
+    assert fast[1] and not fast[2]
+
+
+def test_weather_report_is_served_from_response_cache(
+    monkeypatch, fresh_config, sch, tmp_path
+):
+    monkeypatch.setattr(sch.network, "_response_cache_enabled", True)
+    monkeypatch.setattr(
+        sch.network, "_response_cache", sch.network.ResponseCache(tmp_path / "c.db")
+    )
+    calls: List[str] = []
+
+    class FakeWeatherResponse:
+        status_code = 200
+        headers: Dict[str, str] = {}
+        content = b'{"init": "2025010100", "dataseries": [{"timepoint": 3}]}'
+
+        def json(self):
+            import json
+
+            return json.loads(self.content)
+
+        def raise_for_status(self):
+            return None
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        return FakeWeatherResponse()
+
+    patch_async_client(monkeypatch, sch, get=fake_get)
+
+    first = sch.weather_forecast_report(fresh_config)
+    second = sch.weather_forecast_report(fresh_config)
+    assert first == second and "01/01 03:00" in first
+    assert len(calls) == 1
+
+    sch.weather_forecast_report(fresh_config, bypass_cache=True)
+    assert len(calls) == 2
+    stats = sch.network.response_cache_stats()
+    assert stats is not None and (stats.hits, stats.entries) == (1, 1)
+
+
+def test_neocp_ephemeris_chunks_run_concurrently_and_merge_partial_results(
+    monkeypatch, fresh_config, sch
+):
+    names = [f"P{i:02d}" for i in range(7)]
+    active = [0]
+    peak = [0]
+    seen: List[List[str]] = []
+
+    async def fake_get_neocp_ephemeris(config, object_names):
+        seen.append(list(object_names))
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        try:
+            if "P03" in object_names:
+                await asyncio.sleep(5)  # slower than the chunk timeout
+            if "P06" in object_names:
+                raise httpx.ConnectError("boom")
+            await asyncio.sleep(0.01)
+            return {name: ["1"] * 14 for name in object_names}
+        finally:
+            active[0] -= 1
+
+    monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
+
+    result = asyncio.run(
+        sch.fetch_neocp_ephemeris_chunked(
+            fresh_config, names, chunk_size=2, max_concurrency=2, chunk_timeout=0.2
+        )
+    )
+
+    assert sorted(map(tuple, seen)) == [
+        ("P00", "P01"),
+        ("P02", "P03"),
+        ("P04", "P05"),
+        ("P06",),
+    ]
+    assert peak[0] == 2
+    assert sorted(result) == ["P00", "P01", "P04", "P05"]
+
+
+def test_neocp_poll_revalidates_and_skips_unchanged_ephemerides(
+    monkeypatch, fresh_config, sch
+):
+    entry = {"Temp_Desig": "P11aaaa", "Score": 90, "NObs": 5}
+    listing = [entry, {"Temp_Desig": "P11bbbb", "Score": 80, "NObs": 3}]
+
+    class FakeResponse:
+        def __init__(self, status_code, payload=None, etag='"v1"'):
+            self.status_code = status_code
+            self.headers = {"etag": etag, "last-modified": "Fri, 16 Oct 2026"}
+            self._payload = payload
+
+        def json(self):
+            if self._payload is None:
+                raise ValueError("no body")
+            return self._payload
+
+    sent_headers: List[Any] = []
+    replies = [FakeResponse(200, listing), FakeResponse(304)]
+
+    async def fake_afetch(method, url, **kwargs):
+        assert url == sch.NEOCP_JSON_URL
+        sent_headers.append(kwargs.get("headers"))
+        return replies.pop(0)
+
+    queried: List[List[str]] = []
+
+    async def fake_get_neocp_ephemeris(config, object_names):
+        queried.append(list(object_names))
+        return {name: ["1"] * 14 for name in object_names}
+
+    monkeypatch.setattr(sch.network, "afetch", fake_afetch)
+    monkeypatch.setattr(sch, "get_neocp_ephemeris", fake_get_neocp_ephemeris)
+
+    first = asyncio.run(sch.fetch_neocp_json_and_ephemeris(fresh_config))
+    second = asyncio.run(sch.fetch_neocp_json_and_ephemeris(fresh_config))
+
+    assert sent_headers[0] is None
+    assert sent_headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Fri, 16 Oct 2026",
+    }
+    assert second == first
+    assert second[0] == listing and sorted(second[1]) == ["P11aaaa", "P11bbbb"]
+    # The 304 poll reused every memoized ephemeris
+    assert queried == [["P11aaaa", "P11bbbb"]]
+
+    # Only the entry that changed is queried again
+    updated = [dict(entry, NObs=6), listing[1]]
+    replies.append(FakeResponse(200, updated, etag='"v2"'))
+    third = asyncio.run(sch.fetch_neocp_json_and_ephemeris(fresh_config))
+    assert third[0] == updated
+    assert queried[1:] == [["P11aaaa"]]
+
+    # A regenerated list where only the age fields moved queries nothing
+    aged = [dict(item, Not_Seen_dys=0.5, Updated="Oct. 17.12 UT") for item in updated]
+    replies.append(FakeResponse(200, aged, etag='"v3"'))
+    fourth = asyncio.run(sch.fetch_neocp_json_and_ephemeris(fresh_config))
+    assert fourth[0] == aged and sorted(fourth[1]) == ["P11aaaa", "P11bbbb"]
+    assert len(queried) == 2
+
+
+def test_neocp_polls_replay_the_recorded_list_after_a_304(monkeypatch, sch, tmp_path):
+    listing = [{"Temp_Desig": "P11aaaa", "Score": 90, "NObs": 5}]
+    validators = {"ETag": '"v1"', "Last-Modified": "Fri, 16 Oct 2026"}
+
+    class FakeClient:
+        is_closed = False
+
+        async def get(self, url, params=None, headers=None, **kwargs):
+            if headers and headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers=validators)
+            return httpx.Response(200, json=listing, headers=validators)
+
+    monkeypatch.setattr(sch.network, "get_async_client", FakeClient)
+    sch.network.use_cassette(sch.network.Cassette(tmp_path, "record"))
+    assert asyncio.run(sch.poll_neocp_json()) == (listing, True)
+    assert asyncio.run(sch.poll_neocp_json()) == (listing, True)
+
+    # Replaying the same two polls from a cold start gets the list both times
+    sch.reset_neocp_poll_state()
+    sch.network.use_cassette(sch.network.Cassette(tmp_path, "replay"))
+    assert asyncio.run(sch.poll_neocp_json()) == (listing, True)
+    assert asyncio.run(sch.poll_neocp_json()) == (listing, True)
+
+
+def test_mpc_session_reuses_token_and_rescrapes_on_rejection(monkeypatch, sch):
+    scrapes: List[str] = []
+    tokens = iter(["tok-1", "tok-2"])
+
+    async def fake_scrape():
+        scrapes.append("scrape")
+        return next(tokens)
+
+    posted: List[Any] = []
+
+    def fake_post(url, data=None, **kwargs):
+        posted.append(data["authenticity_token"])
+        status = 422 if data["authenticity_token"] == "tok-1" else 200
+        return FakeRequestsSuccessResponse(b"<html></html>", status)
+
+    monkeypatch.setattr(sch, "_scrape_whatsup_authenticity_token", fake_scrape)
+    patch_async_client(monkeypatch, sch, post=fake_post)
+
+    assert sch.resolve_whatsup_authenticity_token() == ("tok-1", False)
+    assert sch.resolve_whatsup_authenticity_token() == ("tok-1", False)
+    assert scrapes == ["scrape"]
+
+    sch.observing_target_list_scraper(
+        sch.MPC_WHATSUP_INDEX_URL, {"authenticity_token": "tok-1"}
+    )
+    assert posted == ["tok-1", "tok-2"]
+    assert sch.resolve_whatsup_authenticity_token() == ("tok-2", False)
+    assert len(scrapes) == 2
+
+
+def test_mpc_session_does_not_cache_fallback_token(monkeypatch, sch):
+    calls: List[int] = []
+
+    async def failing_scrape():
+        calls.append(1)
+        return ""
+
+    monkeypatch.setattr(sch, "_scrape_whatsup_authenticity_token", failing_scrape)
+    session = sch.MpcSession(token_ttl=60)
+    assert session.authenticity_token()[1] is True
+    assert session.authenticity_token()[1] is True
+    assert len(calls) == 2
+
+
+def test_async_variants_share_one_loop_and_sync_wrappers_refuse_inside_it(
+    monkeypatch, fresh_config, sch
+):
+    forecast = b'{"init": "2025010100", "dataseries": [{"timepoint": 3}]}'
+    form = b"<input name='authenticity_token' value='tok-9'>"
+    requested: List[str] = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return FakeRequestsSuccessResponse(
+            forecast if url == sch.SEVENTIMER_API_URL else form
+        )
+
+    patch_async_client(monkeypatch, sch, get=fake_get)
+
+    async def both():
+        return await asyncio.gather(
+            sch.async_resolve_whatsup_authenticity_token(),
+            sch.async_weather_forecast_report(fresh_config),
+        )
+
+    token, report = asyncio.run(both())
+    assert token == ("tok-9", False) and "01/01 03:00" in report
+    assert sorted(requested) == sorted(
+        [sch.MPC_WHATSUP_INDEX_URL, sch.SEVENTIMER_API_URL]
+    )
+
+    async def blocking_call_in_loop():
+        sch.weather_forecast_report(fresh_config)
+
+    with pytest.raises(RuntimeError, match="async_weather_forecast_report"):
+        asyncio.run(blocking_call_in_loop())
+
+
+def test_diff_neocp_snapshots_reports_added_removed_and_watched_fields(sch):
+    previous = [
+        {"Temp_Desig": "A", "Score": 90, "NObs": 4, "Arc": 0.1, "V": 20.0},
+        {"Temp_Desig": "B", "Score": 80, "NObs": 3, "Arc": 0.2},
+        {"Temp_Desig": "C", "Score": 70, "NObs": 3, "Arc": 0.2},
+    ]
+    current = [
+        {"Temp_Desig": "A", "Score": 90, "NObs": 6, "Arc": 0.3, "V": 20.5},
+        {"Temp_Desig": "C", "Score": 70, "NObs": 3, "Arc": 0.2},
+        {"Temp_Desig": "D", "Score": 99, "NObs": 2, "Arc": 0.0},
+    ]
+    changes = sch.diff_neocp_snapshots(previous, current)
+    assert changes.added == ["D"] and changes.removed == ["B"]
+    assert changes.updated == {"A": {"NObs": (4, 6), "Arc": (0.1, 0.3)}}
+    assert changes.changed
+    assert not sch.diff_neocp_snapshots(current, current).changed
+
+
+def test_watch_neocp_polls_in_background_and_yields_diffs(
+    monkeypatch, fresh_config, sch
+):
+    snapshots = [
+        [{"Temp_Desig": "A", "Score": 90}],
+        None,
+        [{"Temp_Desig": "A", "Score": 95}, {"Temp_Desig": "B", "Score": 60}],
+    ]
+    priorities: List[Any] = []
+    built: List[List[Any]] = []
+
+    async def fake_fetch(observatory):
+        priorities.append(sch.network._priority.get())
+        data = snapshots.pop(0)
+        return (data or [], {}, data is not None)
+
+    def fake_table(observatory, data, response, *filters, **ranking):
+        built.append([item["Temp_Desig"] for item in data])
+        return list(built[-1])
+
+    monkeypatch.setattr(sch, "fetch_neocp_json_and_ephemeris", fake_fetch)
+    monkeypatch.setattr(sch, "_neocp_candidates_table", fake_table)
+
+    async def three_polls():
+        updates = []
+        async for update in sch.watch_neocp(fresh_config, 0, 30.0, 0, interval=0):
+            updates.append(update)
+            if len(updates) == 3:
+                break
+        return updates
+
+    first, failed, third = asyncio.run(three_polls())
+    assert first.ok and first.changes.added == ["A"] and first.table == ["A"]
+    assert not failed.ok and failed.table == ["A"] and not failed.changes.changed
+    assert third.changes.added == ["B"]
+    assert third.changes.updated == {"A": {"Score": (90, 95)}}
+    assert third.table == ["A", "B"]
+    assert priorities == [
+        sch.Priority.INTERACTIVE,
+        sch.Priority.BACKGROUND,
+        sch.Priority.BACKGROUND,
+    ]
+
+
+def test_neocp_columns_masks_malformed_entries(sch):
+    entry = {
+        "Temp_Desig": "P1",
+        "R.A.": "10.5",
+        "Decl.": -5,
+        "Score": 90,
+        "V": 19.5,
+        "NObs": 4,
+        "Arc": 0.2,
+        "Not_Seen_dys": 0.1,
+    }
+    data = [
+        entry,
+        dict(entry, Temp_Desig="P2", V="bright"),
+        dict(entry, Temp_Desig="P3", NObs=None),
+        {k: v for k, v in entry.items() if k != "Temp_Desig"},
+    ]
+    columns = sch.neocp_columns(data)
+    assert columns.valid.tolist() == [True, False, False, False]
+    assert columns.designation.tolist() == ["P1", "P2", "P3", ""]
+    assert columns.ra[0] == 10.5 and columns.dec[0] == -5.0
+    assert np.isnan(columns.v[1]) and columns.score[1] == 90
+    assert len(sch.neocp_columns([]).valid) == 0
+
+
+def test_neocp_night_visibility_from_ephemeris_series(sch):
+    from asteroidpy.mpcparse import EPHEMERIS_DTYPE, EphemerisValues
+
+    series = np.array(
+        [
+            (np.datetime64("2026-10-17T20:00"), 10.0, 5.0, 20.0, 1.0, 90.0, 15.0),
+            (np.datetime64("2026-10-17T22:00"), 10.1, 5.0, 20.0, 2.5, 90.0, 40.0),
+            (np.datetime64("2026-10-18T00:00"), 10.2, 5.0, 20.0, 1.5, 90.0, 32.0),
+            (np.datetime64("2026-10-18T06:00"), 10.3, 5.0, 20.0, 9.0, 90.0, 70.0),
+        ],
+        dtype=EPHEMERIS_DTYPE,
+    )
+    ephemerides = {
+        "P1": EphemerisValues(["x"] * 14, series),
+        "P2": ["1"] * 14,  # plain list: no series
+    }
+    night = sch.neocp_night_visibility(
+        ephemerides,
+        min_altitude=30,
+        start=datetime.datetime(2026, 10, 17, 19, 0),
+        end=datetime.datetime(2026, 10, 18, 1, 0, tzinfo=datetime.timezone.utc),
+    )
+    assert list(night) == ["P1"]
+    p1 = night["P1"]
+    assert str(p1.visible_from) == "2026-10-17T22:00"
+    assert str(p1.visible_until) == "2026-10-18T00:00"
+    assert p1.peak_alt == 40.0 and p1.max_motion == 2.5
+    assert len(sch.ephemeris_series(["1"] * 14)) == 0
+
+
+def test_neocp_candidates_table_keeps_the_best_ranked(monkeypatch, fresh_config, sch):
+    entry = {
+        "R.A.": "10.0",
+        "Decl.": "-5.0",
+        "V": 19.0,
+        "NObs": 4,
+        "Arc": 0.5,
+        "Not_Seen_dys": 0.2,
+    }
+    data = [
+        dict(entry, Temp_Desig=name, Score=score)
+        for name, score in [("A", 70), ("B", 99), ("C", 80), ("D", 90)]
+    ]
+    rates = ["0"] * 12 + ["1.5", "120.0"]
+    response = {item["Temp_Desig"]: rates for item in data}
+    monkeypatch.setattr(
+        sch.HorizonProfile,
+        "is_visible",
+        lambda self, az, alt: np.ones(np.shape(az), dtype=bool),
+    )
+    observatory = sch.resolve_observatory(fresh_config)
+
+    seen: List[Any] = []
+
+    def by_score(features):
+        seen.append(features)
+        return features.score
+
+    table = sch._neocp_candidates_table(
+        observatory, data, response, 0, 25.0, -90, top_n=2, scorer=by_score
+    )
+    assert list(table["Temp_Desig"]) == ["B", "D"]
+    assert list(table["Priority"]) == [99.0, 90.0]
+    [features] = seen
+    assert features.motion.tolist() == [1.5] * 4
+    assert features.peak_alt.tolist() == features.alt.tolist()  # no series
+
+    default = sch._neocp_candidates_table(
+        observatory, data, response, 0, 25.0, -90, top_n=10
+    )
+    assert list(default["Temp_Desig"]) == ["B", "D", "C", "A"]
+    unranked = sch._neocp_candidates_table(observatory, data, response, 0, 25.0, -90)
+    assert "Priority" not in unranked.colnames
+    assert list(unranked["Temp_Desig"]) == ["A", "B", "C", "D"]
+
+
+def test_neocp_horizon_check_uses_the_displayed_altaz(monkeypatch, fresh_config, sch):
+    data = [
+        {
+            "Temp_Desig": "A",
+            "R.A.": "10.0",
+            "Decl.": "-5.0",
+            "Score": 90,
+            "V": 19.0,
+            "NObs": 4,
+            "Arc": 0.5,
+            "Not_Seen_dys": 0.2,
+        }
+    ]
+    response = {"A": ["0"] * 12 + ["1.5", "120.0"]}
+    checked: List[Any] = []
+
+    def fake_is_visible(self, az, alt):
+        checked.append(np.array(alt))
+        return np.ones(np.shape(az), dtype=bool)
+
+    monkeypatch.setattr(sch.HorizonProfile, "is_visible", fake_is_visible)
+    monkeypatch.setattr(
+        sch, "is_visible_many", lambda *args, **kwargs: pytest.fail("re-transform")
+    )
+    observatory = sch.resolve_observatory(fresh_config)
+    table = sch._neocp_candidates_table(observatory, data, response, 0, 25.0, -90)
+    [alt] = checked
+    assert table["Alt"].to_value(sch.u.deg).tolist() == alt.tolist()
+
+
+def test_neocp_polls_are_recorded_as_deltas(monkeypatch, fresh_config, sch, tmp_path):
+    monkeypatch.setattr(sch, "_neocp_snapshots_enabled", True)
+    monkeypatch.setattr(sch, "_neocp_snapshots", None)
+    sch.configure_neocp_snapshots(path=tmp_path / "history.sqlite3")
+    polls = [
+        [{"Temp_Desig": "A", "NObs": 3}, {"Temp_Desig": "B", "NObs": 4}],
+        [
+            {"Temp_Desig": "A", "NObs": 3, "Not_Seen_dys": 0.2},
+            {"Temp_Desig": "B", "NObs": 4, "Not_Seen_dys": 0.1},
+        ],
+        [{"Temp_Desig": "A", "NObs": 5}],
+    ]
+
+    async def fake_poll_neocp_json():
+        return polls.pop(0), True
+
+    async def fake_chunked(observatory, names):
+        return {name: ["1"] * 14 for name in names}
+
+    monkeypatch.setattr(sch, "poll_neocp_json", fake_poll_neocp_json)
+    monkeypatch.setattr(sch, "fetch_neocp_ephemeris_chunked", fake_chunked)
+    for _ in range(3):
+        asyncio.run(sch.fetch_neocp_json_and_ephemeris(fresh_config))
+
+    store = sch.neocp_snapshot_store()
+    assert store is not None
+    try:
+        first, last = store.snapshot_times()  # the aged poll adds nothing
+        assert [s.entry["NObs"] for s in store.history("A")] == [3, 5]
+        assert store.history("B")[-1].entry is None
+        assert [e["Temp_Desig"] for e in store.state_at(first).data] == ["A", "B"]
+        assert store.state_at().ephemerides["A"] == ["1"] * 14
+        assert store.max_age == sch.NEOCP_SNAPSHOT_MAX_AGE_DAYS * 86400
+        monkeypatch.setattr(sch, "NEOCP_SNAPSHOT_MAX_AGE_DAYS", 30.0)
+        sch.configure_neocp_snapshots(max_age_days=0)
+        assert store.max_age is None  # keep everything
+    finally:
+        store.close()
+
+
+def test_local_object_ephemeris_fetches_the_orbit_once(
+    monkeypatch, fresh_config, sch, tmp_path
+):
+    monkeypatch.setattr(sch, "_orbit_catalog", sch.ElementCatalog())
+    monkeypatch.setattr(sch, "_local_ephemeris_cache", sch._LRUCache(4))
+    queries: List[Dict[str, Any]] = []
+
+    def fake_query_object(target_type, **query):
+        queries.append(query)
+        return [
+            {
+                "name": "Ceres",
+                "number": 1,
+                "epoch_jd": "2459740.5",
+                "mean_anomaly": "321.43713",
+                "argument_of_perihelion": "73.56969",
+                "ascending_node": "80.26775",
+                "inclination": "10.58713",
+                "eccentricity": "0.0785751",
+                "semimajor_axis": "2.7663808",
+                "mean_daily_motion": "0.21420822",
+                "absolute_magnitude": "3.33",
+                "phase_slope": "0.12",
+            }
+        ]
+
+    def no_mpc_ephemeris(*args, **kwargs):
+        raise AssertionError("the MPC ephemeris service must not be queried")
+
+    monkeypatch.setattr(sch.MPC, "query_object", fake_query_object)
+    monkeypatch.setattr(sch.MPC, "get_ephemeris", no_mpc_ephemeris)
+
+    first = sch.object_ephemeris(fresh_config, "Ceres", "d", source="local")
+    again = sch.object_ephemeris(fresh_config, "1", "d", source="local")
+    assert queries == [{"name": "Ceres"}]
+    assert len(first) == 30 and list(first["V"]) == list(again["V"])
+    assert sch._local_ephemeris_cache.info().hits == 1
+    step = (first["Date"][1] - first["Date"][0]).jd
+    assert step == pytest.approx(1.0)
+
+    # Orbits from an MPCORB file are used without any query.
+    mpcorb = tmp_path / "MPCORB.DAT"
+    mpcorb.write_text(
+        "00433   10.38  0.46 K2555  310.55432  178.92981  304.28296   10.82847  "
+        "0.2228359  0.55984866   1.4581100  0 E2025-A01  9000  50 1893-2025 0.50 "
+        "M-v 3Ek MPCLINUX   0000 (433) Eros                  20250105\n"
+    )
+    assert sch.load_orbital_elements(mpcorb) == 1
+    eros = sch.object_ephemeris(fresh_config, "eros", "h", source="local")
+    assert eros.meta["name"] == "(433) Eros" and len(queries) == 1
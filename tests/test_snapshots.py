@@ -0,0 +1,127 @@
+import datetime
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("lxml")
+
+from asteroidpy.mpcparse import EPHEMERIS_DTYPE, EphemerisValues  # noqa: E402
+from asteroidpy.snapshots import NeocpSnapshotStore  # noqa: E402
+
+
+@pytest.fixture()
+def store(tmp_path):
+    s = NeocpSnapshotStore(tmp_path / "neocp.sqlite3")
+    yield s
+    s.close()
+
+
+def entry(name, **fields):
+    return dict({"Temp_Desig": name, "Score": 90, "NObs": 3}, **fields)
+
+
+def test_only_changes_are_stored(store):
+    assert store.append([entry("A"), entry("B")], {}, fetched=100.0) == 1
+    assert store.append([entry("B"), entry("A")], {}, fetched=200.0) is None
+    assert store.append([entry("A", NObs=4), entry("B")], {}, fetched=300.0) == 2
+    assert store.append([entry("A", NObs=4)], {}, fetched=400.0) == 3
+    assert store.snapshot_times() == [100.0, 300.0, 400.0]
+    conn = store._connection()
+    assert conn.execute("SELECT COUNT(*) FROM changes").fetchone() == (4,)
+    (blob,) = conn.execute(
+        "SELECT data FROM changes WHERE designation = 'A' AND snapshot = 2"
+    ).fetchone()
+    assert b'"NObs": 4' in zlib.decompress(blob)
+
+
+def test_age_only_changes_write_no_row(store, tmp_path):
+    assert store.append([entry("A", Not_Seen_dys=0.1)], {}, fetched=100.0) == 1
+    aged = entry("A", Not_Seen_dys=0.4, Updated="Oct. 17.12 UT")
+    assert store.append([aged], {}, fetched=200.0) is None
+    assert store.state_at().data == [entry("A", Not_Seen_dys=0.1)]
+    assert store.append([entry("A", NObs=4, Not_Seen_dys=0.5)], {}, fetched=300.0)
+    conn = store._connection()
+    assert conn.execute("SELECT COUNT(*) FROM changes").fetchone() == (2,)
+
+    # With tracked fields, only those count as a change
+    tracked = NeocpSnapshotStore(tmp_path / "tracked.sqlite3", tracked_fields=["NObs"])
+    try:
+        assert tracked.append([entry("A")], {}, fetched=100.0) == 1
+        assert tracked.append([entry("A", Score=50)], {}, fetched=200.0) is None
+        assert tracked.append([entry("A", NObs=4)], {}, fetched=300.0) == 2
+    finally:
+        tracked.close()
+
+
+def test_state_at_and_history(store):
+    store.append([entry("A"), entry("B")], {}, fetched=100.0)
+    store.append([entry("A", NObs=4)], {}, fetched=300.0)
+    store.append([entry("A", NObs=4), entry("B", Score=50)], {}, fetched=500.0)
+
+    assert store.state_at(50.0) == (None, [], {})
+    past = store.state_at(299.0)
+    assert past.fetched == 100.0 and past.data == [entry("A"), entry("B")]
+    assert store.state_at(400.0).data == [entry("A", NObs=4)]
+    when = datetime.datetime(1970, 1, 1, 0, 8, 20)  # naive UTC = 500 s
+    assert store.state_at(when).data[1] == entry("B", Score=50)
+    assert store.state_at().fetched == 500.0
+
+    states = store.history("B")
+    assert [s.fetched for s in states] == [100.0, 300.0, 500.0]
+    assert [s.entry and s.entry["Score"] for s in states] == [90, None, 50]
+    assert store.history("missing") == []
+
+
+def test_ephemerides_round_trip_and_survive_reopening(tmp_path):
+    series = np.zeros(2, EPHEMERIS_DTYPE)
+    series["time"] = np.datetime64("2026-10-17T21:00") + np.arange(2)
+    series["alt"] = [25.0, 41.0]
+    values = EphemerisValues(["2026", "10", "17", "2100"], series)
+    path = tmp_path / "neocp.sqlite3"
+
+    first = NeocpSnapshotStore(path)
+    first.append([entry("A")], {"A": values}, fetched=100.0)
+    first.close()
+
+    reopened = NeocpSnapshotStore(path)
+    try:
+        # The stored state is known after reopening: nothing new to write.
+        assert reopened.append([entry("A")], {"A": values}, fetched=200.0) is None
+        # A missing ephemeris keeps the stored one.
+        assert reopened.append([entry("A", NObs=9)], {}, fetched=300.0) == 2
+        restored = reopened.state_at().ephemerides["A"]
+        assert restored == values
+        assert np.array_equal(restored.series, series)
+        assert reopened.history("A")[-1].ephemeris == values
+    finally:
+        reopened.close()
+
+
+def test_prune_keeps_state_inside_the_window(store):
+    store.append([entry("A"), entry("B")], {}, fetched=100.0)
+    store.append([entry("A", NObs=4), entry("C")], {}, fetched=300.0)
+    store.append([entry("A", NObs=4), entry("C", Score=10)], {}, fetched=500.0)
+    store.append([entry("A", NObs=5), entry("C", Score=10)], {}, fetched=700.0)
+    times = [500.0, 600.0, 700.0, 800.0]
+    before = [store.state_at(t) for t in times]
+
+    assert store.prune(550.0) == 2
+    assert store.snapshot_times() == [500.0, 700.0]
+    assert [store.state_at(t) for t in times] == before
+    assert store.state_at(499.0) == (None, [], {})
+    assert [s.entry and s.entry["NObs"] for s in store.history("A")] == [4, 5]
+    assert store.history("B") == []
+    conn = store._connection()
+    assert conn.execute("SELECT COUNT(*) FROM changes").fetchone() == (3,)
+    assert store.prune(550.0) == 0
+
+
+def test_max_age_prunes_automatically(tmp_path):
+    hour = 3600.0
+    store = NeocpSnapshotStore(tmp_path / "neocp.sqlite3", max_age=2 * hour)
+    for i in range(5):
+        store.append([entry("A", NObs=i)], {}, fetched=i * hour)
+    assert store.snapshot_times() == [2 * hour, 3 * hour, 4 * hour]
+    assert store.state_at(2.5 * hour).data == [entry("A", NObs=2)]
+    store.close()
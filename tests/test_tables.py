@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("astropy")
+
+from astropy import units as u  # noqa: E402
+from astropy.coordinates import Latitude  # noqa: E402
+
+from asteroidpy.tables import ColumnarTableBuilder  # noqa: E402
+
+
+def test_build_uses_dtypes_units_and_meta():
+    builder = ColumnarTableBuilder(
+        ("Name", "Score", "Alt"),
+        dtypes=(str, int, float),
+        units={"Alt": u.deg},
+        meta={"name": "demo"},
+    )
+    builder.append(["P10abcd", 90, 35.5])
+    builder.append(["X1", 12, Latitude(0.5 * u.rad)])
+
+    table = builder.build()
+
+    assert len(builder) == 2
+    assert list(table["Name"]) == ["P10abcd", "X1"]
+    assert table["Score"].dtype.kind == "i"
+    assert table["Alt"].unit == u.deg
+    assert table["Alt"][1].to_value(u.rad) == pytest.approx(0.5)
+    assert table.meta == {"name": "demo"}
+
+
+def test_empty_builder_keeps_column_types():
+    table = ColumnarTableBuilder(
+        ("Name", "V"), dtypes=(str, float), units={"V": u.mag}
+    ).build()
+
+    assert len(table) == 0
+    assert table.colnames == ["Name", "V"]
+    assert table["Name"].dtype.kind == "U"
+    assert table["V"].unit == u.mag
+
+
+def test_append_rejects_wrong_row_length():
+    builder = ColumnarTableBuilder(("A", "B"))
+    with pytest.raises(ValueError):
+        builder.append(["only one"])
+
+
+def test_extend_adds_columnwise_rows():
+    builder = ColumnarTableBuilder(("Name", "Score"), dtypes=(str, int))
+    builder.append(["A", 1])
+    builder.extend([["B", "CC"], [2, 3]])
+
+    table = builder.build()
+    assert list(table["Name"]) == ["A", "B", "CC"]
+    assert list(table["Score"]) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        builder.extend([["D"], [4, 5]])
+    with pytest.raises(ValueError):
+        builder.extend([["D"]])
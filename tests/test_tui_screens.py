@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("textual")
+pytest.importorskip("astropy")
+
+from astropy.table import QTable  # noqa: E402
+from textual.app import App  # noqa: E402
+from textual.widgets import DataTable  # noqa: E402
+
+from asteroidpy.interface._tui_screens import _sync_neocp_rows  # noqa: E402
+
+
+class TableApp(App):
+    def compose(self):
+        yield DataTable()
+
+
+def neocp_table(scores, ranked):
+    table = QTable(
+        {
+            "Temp_Desig": list(scores),
+            "Score": list(scores.values()),
+        }
+    )
+    if ranked:
+        table["Priority"] = [score / 100 for score in scores.values()]
+    return table
+
+
+def test_watch_table_follows_switches_between_ranked_and_unranked_updates():
+    async def scenario():
+        app = TableApp()
+        async with app.run_test():
+            data_table = app.query_one(DataTable)
+
+            def shown():
+                keys = [key.value for key in data_table.columns]
+                return keys, [
+                    data_table.get_row_at(i) for i in range(data_table.row_count)
+                ]
+
+            _sync_neocp_rows(data_table, neocp_table({"A": 50, "B": 90}, False))
+            assert shown() == (["Temp_Desig", "Score"], [["A", "50"], ["B", "90"]])
+
+            _sync_neocp_rows(data_table, neocp_table({"A": 50, "B": 90}, True))
+            assert shown() == (
+                ["Temp_Desig", "Score", "Priority"],
+                [["B", "90", "0.90"], ["A", "50", "0.50"]],
+            )
+
+            _sync_neocp_rows(data_table, neocp_table({"A": 60, "C": 70}, True))
+            assert shown()[1] == [["C", "70", "0.70"], ["A", "60", "0.60"]]
+
+            _sync_neocp_rows(data_table, neocp_table({"A": 60}, False))
+            assert shown() == (["Temp_Desig", "Score"], [["A", "60"]])
+
+    asyncio.run(scenario())
+
+
+def test_failing_watch_reports_the_error_and_resets_the_button(monkeypatch):
+    from types import SimpleNamespace
+
+    from textual.widgets import Button, Input, Static
+
+    from asteroidpy.interface import _tui_screens
+
+    async def broken_watch(*args, **kwargs):
+        raise RuntimeError("table exploded")
+        yield  # pragma: no cover
+
+    async def fake_import():
+        return SimpleNamespace(watch_neocp=broken_watch)
+
+    monkeypatch.setattr(_tui_screens, "_import_scheduling", fake_import)
+
+    class ScreenApp(App):
+        config = None
+
+        def on_mount(self):
+            self.push_screen(_tui_screens.NeocpScreen())
+
+    async def scenario():
+        app = ScreenApp()
+        async with app.run_test() as pilot:
+            screen = app.screen
+            for field, value in [
+                ("min_score", "50"),
+                ("max_mag", "21"),
+                ("min_alt", "20"),
+            ]:
+                screen.query_one(f"#{field}", Input).value = value
+            await screen._toggle_watch()
+            assert screen._watch_worker is not None
+            for _ in range(3):
+                await pilot.pause()
+            assert screen._watch_worker is None
+            assert str(screen.query_one("#watch", Button).label) == "Watch"
+            status = str(screen.query_one("#watch_status", Static).render())
+            assert "table exploded" in status
+
+    asyncio.run(scenario())